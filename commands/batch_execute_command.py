@@ -0,0 +1,50 @@
+"""
+This module defines the BatchExecuteCommand class which extends the SSHCommand abstract base class.
+
+The BatchExecuteCommand class represents several remote commands executed over SSH in a
+single remote invocation, so they cost one round-trip instead of one per command.
+
+Classes:
+    BatchExecuteCommand: Represents several remote commands executed in one invocation.
+
+Attributes:
+    remote_commands (list): The remote commands to be executed.
+
+Methods:
+    __init__(self, remote_commands): Initializes an instance of BatchExecuteCommand.
+    execute(self): Executes the remote commands and returns their results.
+"""
+
+from commands.ssh_command import SSHCommand
+
+
+class BatchExecuteCommand(SSHCommand):
+    """
+    Represents several remote commands executed over SSH in a single invocation.
+    """
+
+    __slots__ = ("remote_commands",)
+
+    def __init__(self, remote_commands):
+        """
+        Initializes an instance of BatchExecuteCommand.
+
+        Args:
+            remote_commands (list): The remote commands to be executed, in order.
+        """
+        self.remote_commands = list(remote_commands)
+
+    def execute(self):
+        """
+        Executes the remote commands and returns their results.
+
+        The commands run one after another on a single channel through the shared
+        BatchExecuteCommand API function instance. The API module is imported here rather
+        than at module level so that importing this module does not load the SSH backend.
+
+        Returns:
+            list: The result of each remote command, in order.
+        """
+        from model.api.api_functions import BATCH_EXECUTE_COMMAND
+
+        return BATCH_EXECUTE_COMMAND.execute(self.remote_commands)
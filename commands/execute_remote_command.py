@@ -13,10 +13,10 @@ Attributes:
 Methods:
     __init__(self, remote_command): Initializes an instance of ExecuteRemoteCommand.
     execute(self): Executes the remote command and returns the result.
+    render(self): Returns the remote command line.
 """
 
 from commands.ssh_command import SSHCommand
-from model.api.api_function_factory import APIFunctionFactory
 
 
 class ExecuteRemoteCommand(SSHCommand):
@@ -24,6 +24,8 @@ class ExecuteRemoteCommand(SSHCommand):
     Represents a command to execute a remote command over SSH.
     """
 
+    __slots__ = ("remote_command",)
+
     def __init__(self, remote_command):
         """
         Initializes an instance of ExecuteRemoteCommand.
@@ -37,8 +39,22 @@ class ExecuteRemoteCommand(SSHCommand):
         """
         Executes the remote command and returns the result.
 
+        The command runs through the shared ExecuteRemoteCommand API function instance,
+        so no factory lookup happens per call. The API module is imported here rather than
+        at module level so that importing this module does not load the SSH backend.
+
         Returns:
             str: The result of executing the remote command.
         """
-        api_function = APIFunctionFactory.create_api_function("ExecuteRemoteCommand")
-        return api_function.execute(self.remote_command)
+        from model.api.api_functions import EXECUTE_REMOTE_COMMAND
+
+        return EXECUTE_REMOTE_COMMAND.execute(self.render())
+
+    def render(self):
+        """
+        Returns the remote command line.
+
+        Returns:
+            str: The remote command to be executed.
+        """
+        return self.remote_command
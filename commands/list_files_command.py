@@ -1,5 +1,5 @@
 """
-This module defines the ListFilesCommand class which extends the SSHCommand abstract base class.
+This module defines the ListFilesCommand class which extends the ShellCommand class.
 
 The ListFilesCommand class represents the 'ls -l' SSH command for listing files and directories 
 on a remote server. It provides an implementation for executing the 'ls -l' command over 
@@ -17,14 +17,14 @@ Methods:
     __init__(self, ssh_connection): Initializes the ListFilesCommand with an SSH connection.
     execute(self): Executes the 'ls -l' command on the connected remote SSH server.
 """
-from commands.ssh_command import SSHCommand
+from commands.shell_command import COMMANDS, ShellCommand
 
 
-class ListFilesCommand(SSHCommand):
+class ListFilesCommand(ShellCommand):
     """
     Represents the 'ls -l' SSH command for listing files and directories on a remote server.
 
-    This class extends the SSHCommand abstract base class, providing an implementation for
+    This class extends the ShellCommand class, supplying the command line for
     executing the 'ls -l' command. It is used to list files and directories in the current directory
     of the remote server, showcasing detailed information.
 
@@ -35,6 +35,8 @@ class ListFilesCommand(SSHCommand):
         execute(): Executes the 'ls -l' command on the remote SSH server.
     """
 
+    __slots__ = ()
+
     def __init__(self, ssh_connection):
         """
         Initializes the ListFilesCommand with an SSH connection.
@@ -42,18 +44,4 @@ class ListFilesCommand(SSHCommand):
         Args:
             ssh_connection: The SSH connection object used to execute the 'ls -l' command.
         """
-        self.ssh_connection = ssh_connection
-
-    def execute(self):
-        """
-        Executes the 'ls -l' command on the connected remote SSH server.
-
-        Overrides the execute method from the SSHCommand class. It sends the 'ls -l' command
-        to the SSH server and returns the output, providing a detailed list of 
-        files and directories.
-
-        Returns:
-            The output of the 'ls -l' command execution, containing details of files 
-            and directories.
-        """
-        return self.ssh_connection.execute_command("ls -l")
+        super().__init__(ssh_connection, COMMANDS["ls"])
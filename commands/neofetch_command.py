@@ -1,15 +1,15 @@
 """
 A concrete SSH command class for executing the Neofetch command on a remote server.
 """
-from commands.ssh_command import SSHCommand
+from commands.shell_command import COMMANDS, ShellCommand
 
 
-class NeofetchCommand(SSHCommand):
+class NeofetchCommand(ShellCommand):
     """
 
-    This class extends the SSHCommand abstract base class, providing a specific implementation
-    of the execute method for the Neofetch command. Neofetch is a command-line system information
-    tool that displays system information in a visually appealing format. This class encapsulates
+    This class extends the ShellCommand class, supplying the command line for
+    the Neofetch command. Neofetch is a command-line system information tool that displays
+    system information in a visually appealing format. This class encapsulates
     the necessary logic to execute the Neofetch command over an established SSH connection.
 
     Attributes:
@@ -19,6 +19,8 @@ class NeofetchCommand(SSHCommand):
         execute(): Executes the Neofetch command on the SSH server.
     """
 
+    __slots__ = ()
+
     def __init__(self, ssh_connection):
         """
         Initializes the NeofetchCommand with the SSH connection.
@@ -26,16 +28,4 @@ class NeofetchCommand(SSHCommand):
         Args:
             ssh_connection: The SSH connection object to execute the Neofetch command.
         """
-        self.ssh_connection = ssh_connection
-
-    def execute(self):
-        """
-        Executes the Neofetch command on the SSH server.
-
-        This method overrides the execute method from the SSHCommand class.
-        It sends the Neofetch command to the SSH server and returns its output.
-
-        Returns:
-            The output of the Neofetch command execution.
-        """
-        return self.ssh_connection.execute_command("neofetch")
+        super().__init__(ssh_connection, COMMANDS["neofetch"])
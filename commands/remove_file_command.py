@@ -1,5 +1,5 @@
 """
-This module defines the RemoveFileCommand class which extends the SSHCommand abstract base class.
+This module defines the RemoveFileCommand class which extends the ShellCommand class.
 
 The RemoveFileCommand class represents a concrete SSH command for removing a file 
 on a remote server. It provides an implementation for executing the 'rm' command 
@@ -17,15 +17,17 @@ Methods:
     the SSH connection and the filename.
     execute(self): Executes the remove file command on the SSH server.
 """
-from commands.ssh_command import SSHCommand
+import shlex
 
-class RemoveFileCommand(SSHCommand):
+from commands.shell_command import COMMANDS, ShellCommand
+
+class RemoveFileCommand(ShellCommand):
     """
     A concrete SSH command class for removing a file on a remote server.
 
-    This class extends the SSHCommand abstract base class, providing a specific implementation
-    of the execute method for removing a file. It encapsulates all the details necessary to
-    perform the file removal operation over an established SSH connection.
+    This class extends the ShellCommand class, supplying the command line for
+    removing a file. It encapsulates all the details necessary to perform the file
+    removal operation over an established SSH connection.
 
     Attributes:
         ssh_connection: An instance of the SSH connection to execute commands.
@@ -35,6 +37,8 @@ class RemoveFileCommand(SSHCommand):
         execute(): Executes the command to remove a file on the SSH server.
     """
 
+    __slots__ = ("filename",)
+
     def __init__(self, ssh_connection, filename):
         """
         Initializes the RemoveFileCommand with the SSH connection and the filename.
@@ -43,17 +47,6 @@ class RemoveFileCommand(SSHCommand):
             ssh_connection: The SSH connection object to execute the command.
             filename (str): The name of the file to be removed.
         """
-        self.ssh_connection = ssh_connection
+        # Quote the filename so spaces and shell metacharacters are passed through literally
+        super().__init__(ssh_connection, COMMANDS["rm"].format(shlex.quote(filename)))
         self.filename = filename
-
-    def execute(self):
-        """
-        Executes the remove file command on the SSH server.
-
-        This method overrides the execute method from the SSHCommand class.
-        It sends a command to the SSH server to remove the specified file.
-
-        Returns:
-            The result of the file removal command execution.
-        """
-        return self.ssh_connection.execute_command(f'rm {self.filename}')
@@ -0,0 +1,96 @@
+"""
+This module defines the ShellCommand class and the registry of shell command templates.
+
+Most SSH commands in BerryFrame differ only in the command line they send to the remote
+server. ShellCommand runs any such command line, so a new command is added by registering
+its template in COMMANDS instead of writing a new SSHCommand subclass.
+
+Classes:
+    ShellCommand: A concrete SSH command running a precompiled shell command line.
+
+Attributes:
+    COMMANDS (dict): Maps command names to their shell command line templates.
+"""
+import shlex
+
+from commands.ssh_command import SSHCommand
+
+# Shell command line templates by name; "{}" placeholders are filled with shell-quoted arguments
+COMMANDS = {
+    "ls": "ls -l",
+    "neofetch": "neofetch",
+    "rm": "rm {}",
+}
+
+
+class ShellCommand(SSHCommand):
+    """
+    A concrete SSH command running a single shell command line on a remote server.
+
+    The command line is compiled once, when the command is created, so executing the
+    command only hands the stored string to the SSH connection.
+
+    Attributes:
+        ssh_connection: An instance of the SSH connection to execute commands.
+        cmd (str): The shell command line run on the remote server.
+
+    Methods:
+        from_template(ssh_connection, name, *args): Creates a command from a COMMANDS template.
+        execute(): Executes the command line on the SSH server.
+        render(): Returns the command line run on the remote server.
+    """
+
+    __slots__ = ("ssh_connection", "cmd")
+
+    def __init__(self, ssh_connection, cmd):
+        """
+        Initializes the ShellCommand with the SSH connection and the command line.
+
+        Args:
+            ssh_connection: The SSH connection object to execute the command.
+            cmd (str): The shell command line to run on the remote server.
+        """
+        self.ssh_connection = ssh_connection
+        self.cmd = cmd
+
+    @classmethod
+    def from_template(cls, ssh_connection, name, *args):
+        """
+        Creates a command from the COMMANDS template registered under the given name.
+
+        Each argument is shell-quoted before it is substituted into the template, so
+        spaces and shell metacharacters are passed through literally.
+
+        Args:
+            ssh_connection: The SSH connection object to execute the command.
+            name (str): The name of the template in COMMANDS.
+            *args (str): The arguments substituted into the template's placeholders.
+
+        Returns:
+            ShellCommand: The command running the rendered command line.
+
+        Raises:
+            KeyError: If no template is registered under the given name.
+        """
+        return cls(ssh_connection, COMMANDS[name].format(*map(shlex.quote, args)))
+
+    def execute(self):
+        """
+        Executes the command line on the SSH server.
+
+        This method overrides the execute method from the SSHCommand class.
+        It sends the precompiled command line to the SSH server and returns its output.
+
+        Returns:
+            The output of the command execution.
+        """
+        return self.ssh_connection.execute_command(self.cmd)
+
+    def render(self):
+        """
+        Returns the precompiled command line.
+
+        Returns:
+            str: The shell command line run on the remote server.
+        """
+        return self.cmd
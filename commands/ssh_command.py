@@ -38,8 +38,14 @@ class SSHCommand(ABC):
 
     Methods:
         execute(): An abstract method that executes the SSH command.
+        render(): Returns the shell command line the command runs on the remote server.
+
+    Commands hold only a few attributes and may be created in large numbers, so the
+    hierarchy declares __slots__ instead of giving every instance a __dict__.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(self):
         """
@@ -53,3 +59,18 @@ class SSHCommand(ABC):
             The result of the SSH command execution, which may vary based on the command's nature.
         """
         raise NotImplementedError
+
+    def render(self):
+        """
+        Returns the shell command line this command runs on the remote server.
+
+        Commands that run a single shell command line implement this method, which lets
+        SSHCommandInvoker.execute_batch() combine them into one remote invocation.
+
+        Returns:
+            str: The shell command line.
+
+        Raises:
+            NotImplementedError: If the command cannot be expressed as one command line.
+        """
+        raise NotImplementedError
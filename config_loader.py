@@ -0,0 +1,63 @@
+"""
+Configuration loading for the BerryFrame application.
+
+This module reads the application's INI configuration into plain dictionaries of
+{section: {key: value}} and memoizes the result, keyed by the file's path and
+modification time, so repeated loads skip the INI parser until the file changes.
+
+Functions:
+    load_config(path): Returns the parsed configuration for the given file.
+"""
+import configparser
+import os
+from functools import lru_cache
+
+# Default location of the application's configuration file
+CONFIG_PATH = "config.ini"
+
+# Port used when the SSH section does not set one
+DEFAULT_SSH_PORT = 22
+
+
+def load_config(path=CONFIG_PATH):
+    """
+    Returns the parsed configuration for the given file.
+
+    The parsed configuration is cached per path and modification time, so the file is
+    only parsed again once it has been modified. A missing file parses as an empty
+    configuration, as with ConfigParser.read().
+
+    Args:
+        path (str, optional): The path of the INI file. Defaults to CONFIG_PATH.
+
+    Returns:
+        dict: The sections of the file, each a dict of its keys and string values. The
+        SSH section's port is converted to an int. The returned object is shared
+        between callers and must not be modified.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    return _parse_config(path, mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _parse_config(path, _mtime_ns):
+    """
+    Parses the given INI file into a dict of sections.
+
+    Args:
+        path (str): The path of the INI file.
+        _mtime_ns (int): The file's modification time. It is not read; it only makes
+            lru_cache store a new entry once the file has been modified.
+
+    Returns:
+        dict: The sections of the file, each a dict of its keys and values.
+    """
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    config = {section: dict(parser[section]) for section in parser.sections()}
+    if "SSH" in config:
+        config["SSH"]["port"] = int(config["SSH"].get("port", DEFAULT_SSH_PORT))
+    return config
@@ -14,13 +14,31 @@ for auditing, debugging, and reviewing the history of SSH operations performed.
 Classes:
     SSHCommandInvoker: Executes SSH command objects and maintains a history of these executions.
 
+Commands do not open connections of their own. They run through the ConnectionManager,
+which keeps a pool of authenticated clients per destination and opens a channel on one
+of them per command, so a burst of commands executed through the invoker pays for the
+SSH handshake only once.
+
 Key Features:
     - Executes SSH command objects using a standard interface.
     - Maintains a history of executed commands and their results for tracking and auditing purposes.
     - Demonstrates the use of the Command Pattern in executing and managing SSH operations.
     - Enhances the flexibility and modularity of the SSH command execution process.
+    - Runs several commands in a single remote invocation with execute_batch().
+    - Runs independent commands concurrently with execute_many().
 """
 
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Default number of commands execute_many() runs at once, below sshd's default MaxSessions of 10
+DEFAULT_MAX_WORKERS = 8
+
+# Number of executions kept in the history, and characters of each result kept
+HISTORY_SIZE = 1024
+HISTORY_RESULT_PREVIEW = 256
+
 
 class SSHCommandInvoker:
     """
@@ -31,18 +49,22 @@ class SSHCommandInvoker:
     approach to executing different types of SSH commands.
 
     Attributes:
-        history (list): A list to store the history of executed commands and their results.
+        history (collections.deque): The most recent HISTORY_SIZE executed commands with their
+            results, truncated to HISTORY_RESULT_PREVIEW characters, oldest first.
 
     Methods:
         execute_command(command): Executes a given SSH command and stores it in the history.
-        show_history(): Prints the history of executed commands and their results.
+        execute_batch(commands): Executes several SSH commands in one remote invocation.
+        execute_many(commands, max_workers): Executes independent SSH commands concurrently.
+        iter_history(): Yields the executed commands with their results.
+        show_history(file): Prints the history of executed commands and their results.
     """
 
     def __init__(self):
         """
-        Initializes the SSHCommandInvoker with an empty history list.
+        Initializes the SSHCommandInvoker with an empty history.
         """
-        self.history = []
+        self.history = deque(maxlen=HISTORY_SIZE)
 
     def execute_command(self, command):
         """
@@ -58,15 +80,107 @@ class SSHCommandInvoker:
             The command object should implement an execute method.
         """
         result = command.execute()
-        self.history.append((command, result))
+        self._record(command, result)
         return result
 
-    def show_history(self):
+    def execute_batch(self, commands):
+        """
+        Executes several SSH commands in a single remote invocation.
+
+        The rendered command lines run one after another through the shared
+        BatchExecuteCommand API function, so N commands cost one round-trip instead
+        of N. Each command runs even if an earlier one fails. Every command and its
+        result are appended to the history. The API module is imported here so that
+        importing the invoker does not load the SSH backend.
+
+        Args:
+            commands (list): The SSH command objects to execute. Each must implement
+                             render().
+
+        Returns:
+            list: The result of each command, in order. If the remote invocation failed,
+            every command's result is an error message.
+        """
+        from model.api.api_functions import BATCH_EXECUTE_COMMAND
+
+        if not commands:
+            return []
+        results = BATCH_EXECUTE_COMMAND.execute([command.render() for command in commands])
+        for command, result in zip(commands, results):
+            self._record(command, result)
+        return results
+
+    def execute_many(self, commands, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Executes independent SSH commands concurrently.
+
+        Each command runs on a worker thread and checks its own client out of the
+        ConnectionManager's pool, so N latency-bound commands take roughly as long as
+        the slowest one rather than the sum of all. Commands and their results are
+        appended to the history in the order given once all have finished.
+
+        Args:
+            commands (list): The SSH command objects to execute.
+            max_workers (int, optional): The maximum number of commands run at once.
+                                         Defaults to DEFAULT_MAX_WORKERS.
+
+        Returns:
+            list: The result of each command, in order.
+
+        Raises:
+            Exception: The first exception raised by a command, after all have finished.
+        """
+        if not commands:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(commands), max_workers)) as executor:
+            futures = [executor.submit(command.execute) for command in commands]
+        results = [future.result() for future in futures]
+        for command, result in zip(commands, results):
+            self._record(command, result)
+        return results
+
+    def _record(self, command, result):
+        """
+        Appends a command and a preview of its result to the history.
+
+        The history is bounded, so the oldest entry is dropped once HISTORY_SIZE is
+        reached, and text results are truncated so large outputs are not kept alive.
+
+        Args:
+            command (SSHCommand): The executed command.
+            result: The result of the command.
+        """
+        if isinstance(result, str):
+            result = result[:HISTORY_RESULT_PREVIEW]
+        self.history.append((command, result))
+
+    def iter_history(self):
+        """
+        Yields the executed commands with their results, oldest first.
+
+        The entries are yielded straight from the history, without copying it, so
+        callers can consume the history programmatically instead of parsing output.
+
+        Yields:
+            tuple: A (command, result) pair for each recorded execution.
+        """
+        yield from self.history
+
+    def show_history(self, file=None):
         """
         Displays the history of executed commands along with their results.
 
-        This method iterates through the command history, printing the details
-        of each executed command and its corresponding result.
+        This method formats the details of each executed command and its corresponding
+        result, and writes them with a single write call instead of one print per entry.
+
+        Args:
+            file (file-like, optional): The text stream to write to. Defaults to sys.stdout.
         """
-        for command, result in self.history:
-            print(f"Executed: {command} with result: {result}")
+        if file is None:
+            file = sys.stdout
+        file.write(
+            "".join(
+                f"Executed: {command} with result: {result}\n"
+                for command, result in self.iter_history()
+            )
+        )
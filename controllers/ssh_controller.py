@@ -12,8 +12,8 @@ Classes:
 
 The SSHController class is central to the module, providing methods to connect to a 
 remote server, execute commands, and disconnect. It uses the ConnectionManager singleton 
-from the 'backend.connection_manager' module for managing connections and the APIFunctionFactory
-from the 'api.api_function_factory' module to execute remote commands.
+from the 'backend.connection_manager' module for managing connections and the shared
+ExecuteRemoteCommand API function from the 'api.api_functions' module to execute remote commands.
 The SSHView class from the 'views.ssh_view' module is optionally used for displaying messages.
 
 Each method in the SSHController class is designed for a specific operation:
@@ -34,9 +34,9 @@ Example:
 
 """
 
-from model.api.api_function_factory import APIFunctionFactory
+from model.api.api_functions import EXECUTE_REMOTE_COMMAND
 from model.backend.connection_manager import ConnectionManager, Observer
-from views.ssh_view import SSHView
+from views.ssh_view import SSHView, show_message
 
 
 class ConnectionStatusLogger(Observer):
@@ -55,7 +55,7 @@ class ConnectionStatusLogger(Observer):
     """
 
     def update(self, status):
-        print(f"[Logger] SSH Connection status changed: {status}")
+        show_message(f"[Logger] SSH Connection status changed: {status}")
 
 
 class ConnectionAlertSystem(Observer):
@@ -71,7 +71,7 @@ class ConnectionAlertSystem(Observer):
         Args:
             status (str): The new status of the SSH connection.
         """
-        print(f"[Alert] Attention: SSH Connection is now {status}")
+        show_message(f"[Alert] Attention: SSH Connection is now {status}")
 
 
 class SSHController:
@@ -94,6 +94,8 @@ class SSHController:
         username (str): The username for authentication.
         password (str): The password for authentication.
         key_path (str): The path to the private key file for authentication.
+        observers (tuple): The observers attached to the connection manager. The
+            connection manager only holds them weakly, so the controller keeps them alive.
     """
 
     def __init__(self, host, port, username, password, key_path, view=None):
@@ -106,10 +108,9 @@ class SSHController:
         self.key_path = key_path
 
         # Create and attach observers
-        logger = ConnectionStatusLogger()
-        alert_system = ConnectionAlertSystem()
-        self.connection_manager.attach(logger)
-        self.connection_manager.attach(alert_system)
+        self.observers = (ConnectionStatusLogger(), ConnectionAlertSystem())
+        for observer in self.observers:
+            self.connection_manager.attach(observer)
 
     def connect(self):
         """
@@ -144,9 +145,7 @@ class SSHController:
         Returns:
             None
         """
-        factory = APIFunctionFactory()
-        execute_command_function = factory.create_api_function("ExecuteRemoteCommand")
-        result = execute_command_function.execute(command)
+        result = EXECUTE_REMOTE_COMMAND.execute(command)
         self.view.show_message(result)
 
     def disconnect(self):
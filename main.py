@@ -6,12 +6,14 @@ commands on a remote server. It allows users to connect to SSH, execute various
 and manage the SSH connection.
 """
 
-import configparser
 import sys
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt
+from rich.style import Style
+from rich.text import Text
 
+from config_loader import load_config
 from controllers.ssh_controller import SSHController
 from controllers.command_invoker import SSHCommandInvoker
 from commands.list_files_command import ListFilesCommand
@@ -26,6 +28,38 @@ BOLD_CYAN = "bold cyan"
 BOLD_RED = "bold red"
 BOLD_MAGENTA = "bold magenta"
 
+# Status messages, built once as styled Text so printing them skips markup parsing
+MSG_CONNECTING = Text("Connecting to SSH...", style=BOLD_GREEN)
+MSG_CONNECTED = Text("Connected.", style=BOLD_BLUE)
+MSG_NOT_CONNECTED = Text(
+    "SSH is not connected. Would you like to connect now? (yes/no)", style=BOLD_YELLOW
+)
+MSG_EXECUTING_NEOFETCH = Text("Executing Neofetch Command...", style=BOLD_YELLOW)
+MSG_EXECUTING_LIST_FILES = Text("Executing List Files Command...", style=BOLD_YELLOW)
+MSG_EXECUTING_REMOTE = Text("Executing Remote Command...", style=BOLD_YELLOW)
+MSG_DISCONNECTING = Text("Disconnecting from SSH...", style=BOLD_GREEN)
+MSG_DISCONNECTED = Text("Disconnected.", style=BOLD_BLUE)
+MSG_EXITING = Text("Exiting the program.", style=BOLD_RED)
+MSG_INVALID_CHOICE = Text("Invalid choice, please try again.", style=BOLD_RED)
+
+# Style of command results, parsed once
+RESULT_STYLE = Style.parse(BOLD_CYAN)
+
+# The main menu, built once and printed on every pass of the menu loop
+MENU_TABLE = Table(
+    title="SSH Management System", show_header=False, title_style=BOLD_MAGENTA
+)
+MENU_TABLE.add_row("1. Connect to SSH")
+MENU_TABLE.add_row("2. Execute Remote Command")
+MENU_TABLE.add_row("3. Execute Neofetch Command")
+MENU_TABLE.add_row("4. Execute List Files Command")
+MENU_TABLE.add_row("5. Disconnect SSH")
+MENU_TABLE.add_row("6. Exit")
+
+# The menu option chosen by an empty answer, and the prompt asking for a choice
+DEFAULT_MENU_CHOICE = "1"
+MENU_PROMPT = "Enter your choice [1/2/3/4/5/6] (1): "
+
 console = Console()
 
 
@@ -34,20 +68,9 @@ def main_menu():
     Displays the main menu for the SSH Management System.
 
     This function presents a table of options to the user, including connecting to SSH, 
-    executing commands, and exiting the program.
+    executing commands, and exiting the program. The table is built once, as MENU_TABLE.
     """
-    table = Table(
-        title="SSH Management System", show_header=False, title_style=BOLD_MAGENTA
-    )
-
-    table.add_row("1. Connect to SSH")
-    table.add_row("2. Execute Remote Command")
-    table.add_row("3. Execute Neofetch Command")
-    table.add_row("4. Execute List Files Command")
-    table.add_row("5. Disconnect SSH")
-    table.add_row("6. Exit")
-
-    console.print(table)
+    console.print(MENU_TABLE)
 
 
 def connect_ssh(controller):
@@ -60,9 +83,9 @@ def connect_ssh(controller):
     Args:
         controller (SSHController): The controller used to manage SSH connections.
     """
-    console.print("Connecting to SSH...", style=BOLD_GREEN)
+    console.print(MSG_CONNECTING)
     controller.connect()
-    console.print("Connected.", style=BOLD_BLUE)
+    console.print(MSG_CONNECTED)
 
 
 def check_ssh_connection(controller):
@@ -78,10 +101,7 @@ def check_ssh_connection(controller):
         bool: True if SSH is connected or the user opts to connect, False otherwise.
     """
     if not controller.is_connected():
-        console.print(
-            "SSH is not connected. Would you like to connect now? (yes/no)",
-            style=BOLD_YELLOW,
-        )
+        console.print(MSG_NOT_CONNECTED)
         choice = Prompt.ask("")
         if choice.lower() == "yes":
             connect_ssh(controller)
@@ -102,9 +122,9 @@ def execute_neofetch_command(controller, invoker):
         invoker (SSHCommandInvoker): The invoker to execute the command.
     """
     if check_ssh_connection(controller):
-        console.print("Executing Neofetch Command...", style="bold yellow")
+        console.print(MSG_EXECUTING_NEOFETCH)
         result = invoker.execute_command(NeofetchCommand(controller))
-        console.print(result, style=BOLD_CYAN)
+        console.print(result, style=RESULT_STYLE)
 
 
 def execute_list_files_command(controller, invoker):
@@ -119,9 +139,9 @@ def execute_list_files_command(controller, invoker):
         invoker (SSHCommandInvoker): The invoker to execute the command.
     """
     if check_ssh_connection(controller):
-        console.print("Executing List Files Command...", style=BOLD_YELLOW)
+        console.print(MSG_EXECUTING_LIST_FILES)
         result = invoker.execute_command(ListFilesCommand(controller))
-        console.print(result, style=BOLD_CYAN)
+        console.print(result, style=RESULT_STYLE)
 
 
 def execute_remote_command(controller, invoker, command):
@@ -136,9 +156,9 @@ def execute_remote_command(controller, invoker, command):
         command (str): The command to be executed on the remote server.
     """
     if check_ssh_connection(controller):
-        console.print("Executing Remote Command...", style=BOLD_YELLOW)
+        console.print(MSG_EXECUTING_REMOTE)
         result = invoker.execute_command(ExecuteRemoteCommand(command))
-        console.print(result, style=BOLD_CYAN)
+        console.print(result, style=RESULT_STYLE)
 
 
 def disconnect_ssh(controller):
@@ -150,9 +170,28 @@ def disconnect_ssh(controller):
     Args:
         controller (SSHController): The controller managing the SSH connection.
     """
-    console.print("Disconnecting from SSH...", style=BOLD_GREEN)
+    console.print(MSG_DISCONNECTING)
     controller.disconnect()
-    console.print("Disconnected.", style=BOLD_BLUE)
+    console.print(MSG_DISCONNECTED)
+
+
+def exit_program(controller):
+    """
+    Exits the SSH Management System.
+
+    This function disconnects from the SSH server if a connection is active and
+    terminates the program.
+
+    Args:
+        controller (SSHController): The controller managing the SSH connection.
+
+    Raises:
+        SystemExit: Always, to end the program.
+    """
+    console.print(MSG_EXITING)
+    if controller.is_connected():
+        disconnect_ssh(controller)
+    sys.exit()
 
 
 def main():
@@ -163,12 +202,9 @@ def main():
     initializes controllers and invokes, and provides a loop 
     for user interaction with the system's menu.
     """
-    config = configparser.ConfigParser()
-    config.read("config.ini")
-
-    ssh_config = config["SSH"]
+    ssh_config = load_config()["SSH"]
     host = ssh_config.get("host")
-    port = ssh_config.getint("port", 22)
+    port = ssh_config["port"]
     username = ssh_config.get("username")
     password = ssh_config.get("password")
     key_path = ssh_config.get("key_path")
@@ -176,30 +212,27 @@ def main():
     controller = SSHController(host, port, username, password, key_path)
     invoker = SSHCommandInvoker()
 
+    # Maps each menu choice to its action, built once instead of testing every choice
+    handlers = {
+        "1": lambda: connect_ssh(controller),
+        "2": lambda: execute_remote_command(
+            controller, invoker, Prompt.ask("Enter the command to execute")
+        ),
+        "3": lambda: execute_neofetch_command(controller, invoker),
+        "4": lambda: execute_list_files_command(controller, invoker),
+        "5": lambda: disconnect_ssh(controller),
+        "6": lambda: exit_program(controller),
+    }
+
     while True:
         main_menu()
-        choice = Prompt.ask(
-            "Enter your choice", choices=["1", "2", "3", "4", "5", "6"], default="1"
-        )
-
-        if choice == "1":
-            connect_ssh(controller)
-        elif choice == "2":
-            command = Prompt.ask("Enter the command to execute")
-            execute_remote_command(controller, invoker, command)
-        elif choice == "3":
-            execute_neofetch_command(controller, invoker)
-        elif choice == "4":
-            execute_list_files_command(controller, invoker)
-        elif choice == "5":
-            disconnect_ssh(controller)
-        elif choice == "6":
-            console.print("Exiting the program.", style=BOLD_RED)
-            if controller.is_connected():
-                disconnect_ssh(controller)
-            sys.exit()
-        else:
-            console.print("Invalid choice, please try again.", style=BOLD_RED)
+        # A plain input() keeps the per-iteration cost of the menu prompt low
+        choice = input(MENU_PROMPT).strip() or DEFAULT_MENU_CHOICE
+        handler = handlers.get(choice)
+        if handler is None:
+            console.print(MSG_INVALID_CHOICE)
+            continue
+        handler()
 
 
 if __name__ == "__main__":
@@ -3,16 +3,40 @@ This module defines a factory for creating instances of API function classes.
 
 The APIFunctionFactory class in this module is responsible for instantiating
 and returning objects of various API function classes such as ExecuteRemoteCommand,
-GetSystemStats, UploadFile, and DownloadFile based on the requested function type.
+ExecuteRemoteCommandBytes, ExecuteRemoteCommands, BatchExecuteCommand, GetSystemStats,
+UploadFile, DownloadFile, UploadFiles, DownloadFiles, UploadDirectory and DownloadDirectory
+based on the requested function type.
 """
 
 from model.api.api_functions import (
-    DownloadFile,
-    ExecuteRemoteCommand,
-    GetSystemStats,
-    UploadFile,
+    BATCH_EXECUTE_COMMAND,
+    DOWNLOAD_DIRECTORY,
+    DOWNLOAD_FILE,
+    DOWNLOAD_FILES,
+    EXECUTE_REMOTE_COMMAND,
+    EXECUTE_REMOTE_COMMAND_BYTES,
+    EXECUTE_REMOTE_COMMANDS,
+    GET_SYSTEM_STATS,
+    UPLOAD_DIRECTORY,
+    UPLOAD_FILE,
+    UPLOAD_FILES,
 )
 
+# Maps each supported function type to the shared instance of its API function class
+_REGISTRY = {
+    "ExecuteRemoteCommand": EXECUTE_REMOTE_COMMAND,
+    "ExecuteRemoteCommandBytes": EXECUTE_REMOTE_COMMAND_BYTES,
+    "ExecuteRemoteCommands": EXECUTE_REMOTE_COMMANDS,
+    "BatchExecuteCommand": BATCH_EXECUTE_COMMAND,
+    "GetSystemStats": GET_SYSTEM_STATS,
+    "UploadFile": UPLOAD_FILE,
+    "DownloadFile": DOWNLOAD_FILE,
+    "UploadFiles": UPLOAD_FILES,
+    "DownloadFiles": DOWNLOAD_FILES,
+    "UploadDirectory": UPLOAD_DIRECTORY,
+    "DownloadDirectory": DOWNLOAD_DIRECTORY,
+}
+
 
 class APIFunctionFactory:
     """
@@ -20,7 +44,8 @@ class APIFunctionFactory:
 
     This class provides a method to create instances of different API function classes
     based on the specified function type. It supports creating objects for executing
-    remote commands, getting system statistics, uploading files, and downloading files.
+    remote commands, getting system statistics, uploading files, and downloading files,
+    either one at a time, in parallel batches or as whole directories.
     """
 
     @staticmethod
@@ -28,14 +53,18 @@ class APIFunctionFactory:
         """
         Creates and returns an instance of an API function class.
 
-        Based on the provided function type, this method instantiates and returns
-        the corresponding API function class object. If an unknown function type
-        is specified, it raises a ValueError.
+        Based on the provided function type, this method looks up the shared instance
+        of the corresponding API function class defined in the api_functions module.
+        If an unknown function type is specified, it raises a ValueError.
 
         Parameters:
             function_type (str): The type of API function to create. Expected values
-                                 are "ExecuteRemoteCommand", "GetSystemStats",
-                                 "UploadFile", or "DownloadFile".
+                                 are "ExecuteRemoteCommand", "ExecuteRemoteCommandBytes",
+                                 "ExecuteRemoteCommands", "BatchExecuteCommand",
+                                 "GetSystemStats",
+                                 "UploadFile", "DownloadFile", "UploadFiles",
+                                 "DownloadFiles", "UploadDirectory", or
+                                 "DownloadDirectory".
 
         Returns:
             An instance of the specified API function class.
@@ -43,13 +72,7 @@ class APIFunctionFactory:
         Raises:
             ValueError: If an unknown function type is specified.
         """
-        if function_type == "ExecuteRemoteCommand":
-            return ExecuteRemoteCommand()
-        elif function_type == "GetSystemStats":
-            return GetSystemStats()
-        elif function_type == "UploadFile":
-            return UploadFile()
-        elif function_type == "DownloadFile":
-            return DownloadFile()
-        else:
+        api_function = _REGISTRY.get(function_type)
+        if api_function is None:
             raise ValueError(f"Unknown API function type: {function_type}")
+        return api_function
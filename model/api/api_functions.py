@@ -1,14 +1,126 @@
 """
 This module defines a set of API function classes for remote system operations. 
 
-It includes classes for executing remote commands, retrieving system statistics, 
-and uploading and downloading files using a connection manager. Each class inherits 
+It includes classes for executing remote commands one at a time, concurrently or batched
+into one invocation, retrieving 
+system statistics, and uploading and downloading single files, batches of files or whole 
+directories using a connection manager. Each class inherits 
 from the base class 'APIFunction' and implements an execute method for its specific functionality.
+
+The API functions are stateless, so the module also provides one shared instance of each
+class, such as EXECUTE_REMOTE_COMMAND, for callers that do not need dynamic dispatch.
 """
 
+import os
+import shlex
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
 from paramiko import SSHException, AuthenticationException
 
-from model.backend.connection_manager import ConnectionManager
+from model.backend.connection_manager import COMMAND_CACHE, ConnectionManager
+
+# Separator printed between the outputs of batched system statistics commands
+STATS_SEPARATOR = "\x1e"
+STATS_SEPARATOR_ESCAPE = "\\036"
+
+# Raw statistics sources, read in one remote invocation and parsed locally
+STATS_COMMANDS = (
+    "cat /proc/stat /proc/meminfo",
+    "df -P /",
+    "ls /proc",
+)
+
+# The statistics sources joined into a single command, with a separator printed between
+# their outputs; built once at import time since it never changes
+STATS_COMMAND = f"; printf '{STATS_SEPARATOR_ESCAPE}'; ".join(STATS_COMMANDS)
+
+# Bytes read from the local file per SFTP write during uploads; the SFTP layer splits
+# them into pipelined 32 KiB requests
+SFTP_CHUNK_SIZE = 1 << 20
+
+# Outstanding SFTP read requests per download, matching OpenSSH's `sftp -R 64`
+SFTP_MAX_REQUESTS = 64
+
+# Bytes copied per read when streaming a tar archive through an exec channel
+TAR_CHUNK_SIZE = 1 << 20
+
+def _parse_cpu_usage(stat_and_meminfo):
+    """
+    Computes the user plus system CPU share from /proc/stat.
+
+    Args:
+        stat_and_meminfo (str): The contents of /proc/stat followed by /proc/meminfo.
+
+    Returns:
+        str: The CPU usage in percent with one decimal, or an empty string if the
+        "cpu" line is missing.
+    """
+    for line in stat_and_meminfo.splitlines():
+        if line.startswith("cpu "):
+            # user nice system idle iowait irq softirq steal
+            ticks = [int(field) for field in line.split()[1:9]]
+            total = sum(ticks)
+            if total:
+                return f"{(ticks[0] + ticks[2]) * 100 / total:.1f}"
+    return ""
+
+
+def _parse_memory_usage(stat_and_meminfo):
+    """
+    Computes the used and total memory from /proc/meminfo.
+
+    Args:
+        stat_and_meminfo (str): The contents of /proc/stat followed by /proc/meminfo.
+
+    Returns:
+        str: The memory usage as "Memory Usage: used/totalMB (percent%)", or an empty
+        string if MemTotal or MemAvailable is missing.
+    """
+    meminfo = {}
+    for line in stat_and_meminfo.splitlines():
+        name, _, value = line.partition(":")
+        if name in ("MemTotal", "MemAvailable"):
+            meminfo[name] = int(value.split()[0]) // 1024
+    if len(meminfo) < 2 or not meminfo["MemTotal"]:
+        return ""
+    total = meminfo["MemTotal"]
+    used = total - meminfo["MemAvailable"]
+    return f"Memory Usage: {used}/{total}MB ({used * 100 / total:.2f}%)"
+
+
+def _parse_disk_usage(df_output):
+    """
+    Extracts the usage of the root filesystem from POSIX `df -P /` output.
+
+    Args:
+        df_output (str): The output of `df -P /`.
+
+    Returns:
+        str: The disk usage as "Disk Usage: used/totalGB (percent)", or an empty string
+        if the output has no filesystem line.
+    """
+    lines = df_output.strip().splitlines()
+    if len(lines) < 2:
+        return ""
+    # Filesystem 1024-blocks Used Available Capacity Mounted-on
+    fields = lines[-1].split()
+    total, used = int(fields[1]) >> 20, int(fields[2]) >> 20
+    return f"Disk Usage: {used}/{total}GB ({fields[4]})"
+
+
+def _parse_process_count(proc_listing):
+    """
+    Counts the running processes in a listing of /proc.
+
+    Args:
+        proc_listing (str): The output of `ls /proc`.
+
+    Returns:
+        str: The number of numeric (process) entries.
+    """
+    return str(sum(entry.isdigit() for entry in proc_listing.split()))
 
 
 class APIFunction:
@@ -16,9 +128,12 @@ class APIFunction:
     Base class for API functions.
 
     This class serves as a template for all API functions, requiring subclasses
-    to implement the execute method.
+    to implement the execute method. API functions hold no per-instance state, so
+    the hierarchy declares empty __slots__.
     """
 
+    __slots__ = ()
+
     def execute(self, *args, **kwargs):
         """
         Abstract method to execute an API function.
@@ -43,10 +158,14 @@ class ExecuteRemoteCommand(APIFunction):
     API function for executing a remote command.
 
     This class allows the execution of a command on a remote server using the ConnectionManager.
+    Each command runs on its own exec channel of a pooled, already authenticated connection,
+    so it cannot change the state seen by later commands.
     It handles specific exceptions related to SSH connections and command execution.
     """
 
-    def execute(self, command):
+    __slots__ = ()
+
+    def execute(self, command, cache=False):
         """
         Executes a specified command on a remote server.
 
@@ -56,6 +175,9 @@ class ExecuteRemoteCommand(APIFunction):
 
         Args:
             command (str): The command to be executed on the remote server.
+            cache (bool, optional): Whether the command is read-only and its output may be
+                                    reused for COMMAND_CACHE_TTL seconds on the same
+                                    destination. Defaults to False.
 
         Returns:
             str: The output of the executed command, or an error message if the execution fails.
@@ -65,16 +187,131 @@ class ExecuteRemoteCommand(APIFunction):
             AuthenticationException: Raised for authentication issues.
             ConnectionResetError: Raised when the connection is reset unexpectedly.
         """
+        # Get the singleton instance of ConnectionManager
+        connection_manager = ConnectionManager.get_instance()
+        # Outputs of different hosts must not be mixed up, so the key includes the destination
+        cache_key = (connection_manager.destination, command)
+        if cache:
+            cached_output = COMMAND_CACHE.get(cache_key)
+            if cached_output is not None:
+                return cached_output
         try:
-            # Get the singleton instance of ConnectionManager
-            connection_manager = ConnectionManager.get_instance()
-            # Execute the command and get the output
             output = connection_manager.execute_command(command)
-            # Trim the output to remove unnecessary whitespaces and newlines
-            return output.strip()
         except (SSHException, AuthenticationException, ConnectionResetError) as e:
             # Handle specific exceptions (e.g., connection issues, command errors)
             return f"Error executing command '{command}': {e}"
+        # Trim the output to remove unnecessary whitespaces and newlines
+        output = output.strip()
+        if cache:
+            COMMAND_CACHE.set(cache_key, output)
+        return output
+
+    def stream(self, command):
+        """
+        Executes a specified command on a remote server and yields its output as it arrives.
+
+        The command runs on its own channel and each chunk is yielded as soon as it has
+        been read, so callers can display long-running output progressively instead of
+        waiting for the command to finish. The output is neither cached nor trimmed.
+
+        Args:
+            command (str): The command to be executed on the remote server.
+
+        Yields:
+            str: The next decoded chunk of the output, or an error message if the
+            execution fails.
+        """
+        try:
+            connection_manager = ConnectionManager.get_instance()
+            yield from connection_manager.execute_command(command, stream=True)
+        except (SSHException, AuthenticationException, ConnectionResetError) as e:
+            yield f"Error executing command '{command}': {e}"
+
+
+class ExecuteRemoteCommandBytes(APIFunction):
+    """
+    API function for executing a remote command and returning its raw output.
+
+    For callers that store, hash or forward the output rather than display it, so the
+    output is never decoded and re-encoded.
+    """
+
+    __slots__ = ()
+
+    def execute(self, command):
+        """
+        Executes a specified command on a remote server.
+
+        Args:
+            command (str): The command to be executed on the remote server.
+
+        Returns:
+            bytes: The undecoded output of the executed command, or an encoded error
+            message if the execution fails.
+        """
+        try:
+            connection_manager = ConnectionManager.get_instance()
+            return connection_manager.execute_command_bytes(command)
+        except (SSHException, AuthenticationException, ConnectionResetError) as e:
+            return f"Error executing command '{command}': {e}".encode()
+
+
+class ExecuteRemoteCommands(APIFunction):
+    """
+    API function for executing several remote commands concurrently.
+
+    The commands run on separate channels multiplexed over one pooled SSH connection,
+    so they do not wait for each other and do not open additional connections.
+    """
+
+    __slots__ = ()
+
+    def execute(self, commands):
+        """
+        Executes the specified commands concurrently on a remote server.
+
+        Args:
+            commands (list): The commands to be executed on the remote server.
+
+        Returns:
+            list: The output of each command in order, or an error message for every
+            command if the execution fails.
+        """
+        try:
+            connection_manager = ConnectionManager.get_instance()
+            outputs = connection_manager.execute_commands(commands)
+        except (SSHException, AuthenticationException, ConnectionResetError) as e:
+            return [f"Error executing command '{command}': {e}" for command in commands]
+        return [output.strip() for output in outputs]
+
+
+class BatchExecuteCommand(APIFunction):
+    """
+    API function for executing several remote commands in a single invocation.
+
+    The commands run one after another on a single channel, so they cost one round-trip
+    instead of one per command.
+    """
+
+    __slots__ = ()
+
+    def execute(self, commands):
+        """
+        Executes the specified commands in a single invocation on a remote server.
+
+        Args:
+            commands (list): The commands to be executed on the remote server.
+
+        Returns:
+            list: The output of each command in order, or an error message for every
+            command if the execution fails.
+        """
+        try:
+            connection_manager = ConnectionManager.get_instance()
+            outputs = connection_manager.execute_many(commands)
+        except (SSHException, AuthenticationException, ConnectionResetError) as e:
+            return [f"Error executing command '{command}': {e}" for command in commands]
+        return [output.strip() for output in outputs]
 
 
 class GetSystemStats(APIFunction):
@@ -82,32 +319,41 @@ class GetSystemStats(APIFunction):
     API function for retrieving system statistics.
 
     Retrieves statistics such as CPU usage, memory usage, disk space, and running processes
-    on a remote system. It utilizes the ExecuteRemoteCommand class for executing system commands.
+    on a remote system. It utilizes the ExecuteRemoteCommand class to read the raw sources
+    (/proc/stat, /proc/meminfo, `df -P /` and the /proc listing) in a single remote invocation
+    and parses them locally, so the remote host forks no grep or awk processes.
+    The output is cached for COMMAND_CACHE_TTL seconds, so polling clients share one round-trip.
     """
 
+    __slots__ = ()
+
     def execute(self):
         """
         Retrieves various system statistics from a remote server.
 
         This method gathers CPU usage, memory usage, disk space, and running process counts
-        by executing relevant system commands on the remote server. It utilizes the
-        ExecuteRemoteCommand class for executing these commands.
+        by reading the raw statistics sources on the remote server and parsing them locally.
+        It utilizes the ExecuteRemoteCommand class for executing the commands.
 
         Returns:
             tuple: A tuple containing CPU usage, memory usage, disk space, 
             and running process count.
         """
-        command_executor = ExecuteRemoteCommand()
-        cpu_usage = command_executor.execute(
-            "top -bn1 | grep 'Cpu(s)' | awk '{print $2+$4}'"
-        )
-        memory_usage = command_executor.execute(
-            "free -m | awk 'NR==2{printf \"Memory Usage: %s/%sMB (%.2f%%)\", $3,$2,$3*100/$2 }'"
-        )
-        disk_space = command_executor.execute(
-            'df -h | awk \'$NF=="/"{printf "Disk Usage: %d/%dGB (%s)", $3,$2,$5}\''
-        )
-        running_processes = command_executor.execute("ps -e | wc -l")
+        # Run all commands in one remote shell, separated by an ASCII record separator
+        output = EXECUTE_REMOTE_COMMAND.execute(STATS_COMMAND, cache=True)
+        parts = output.split(STATS_SEPARATOR)
+        if len(parts) != len(STATS_COMMANDS):
+            # An error message has no separators; report it in place of the CPU usage
+            return output.strip(), "", "", ""
+
+        stat_and_meminfo, df_output, proc_listing = parts
+        try:
+            cpu_usage = _parse_cpu_usage(stat_and_meminfo)
+            memory_usage = _parse_memory_usage(stat_and_meminfo)
+            disk_space = _parse_disk_usage(df_output)
+        except (ValueError, IndexError):
+            return "Error: unexpected system statistics output", "", "", ""
+        running_processes = _parse_process_count(proc_listing)
 
         return cpu_usage, memory_usage, disk_space, running_processes
 
@@ -116,16 +362,22 @@ class UploadFile(APIFunction):
     """
     API function for uploading a file.
 
-    This class handles uploading a file from a local path to a remote path. It manages
-    the SFTP client provided by the ConnectionManager for file transfer.
+    This class handles uploading a file from a local path to a remote path. It reuses
+    the persistent SFTP session of an SSH client checked out of the ConnectionManager's pool.
     """
 
+    __slots__ = ()
+
     def execute(self, local_path, remote_path):
         """
         Uploads a file from the local system to a remote server.
 
-        This method establishes an SFTP connection via the ConnectionManager and uploads
-        a file from the specified local path to the specified remote path.
+        This method uses a pooled SFTP session from the ConnectionManager to upload
+        a file from the specified local path to the specified remote path. The remote
+        file is opened in pipelined mode, so writes are sent without waiting for each
+        acknowledgement and the transfer is not limited to one request per round-trip.
+        Write errors are still reported when the remote file is closed. If the local
+        path is a directory, it is uploaded with UploadDirectory instead.
 
         Args:
             local_path (str): The path of the file on the local system to be uploaded.
@@ -135,26 +387,36 @@ class UploadFile(APIFunction):
             IOError: Raised if there is an issue with file reading or writing.
             SSHException: Raised if there is an issue with the SFTP connection.
         """
+        if os.path.isdir(local_path):
+            # Directories are streamed as a tar archive, avoiding per-file SFTP framing
+            UPLOAD_DIRECTORY.execute(local_path, remote_path)
+            return
         connection_manager = ConnectionManager.get_instance()
-        sftp_client = connection_manager.ssh_client.open_sftp()
-        sftp_client.put(local_path, remote_path)
-        sftp_client.close()
+        with connection_manager.sftp() as sftp_client:
+            with open(local_path, "rb") as local_file, sftp_client.open(
+                remote_path, "wb"
+            ) as remote_file:
+                remote_file.set_pipelined(True)
+                shutil.copyfileobj(local_file, remote_file, SFTP_CHUNK_SIZE)
 
 
 class DownloadFile(APIFunction):
     """
     API function for downloading a file.
 
-    This class handles downloading a file from a remote path to a local path. It manages
-    the SFTP client provided by the ConnectionManager for file transfer.
+    This class handles downloading a file from a remote path to a local path. It reuses
+    the persistent SFTP session of an SSH client checked out of the ConnectionManager's pool.
     """
 
+    __slots__ = ()
+
     def execute(self, remote_path, local_path):
         """
         Downloads a file from a remote server to the local system.
 
-        This method establishes an SFTP connection via the ConnectionManager and downloads
-        a file from the specified remote path to the specified local path.
+        This method uses a pooled SFTP session from the ConnectionManager to download
+        a file from the specified remote path to the specified local path. Up to
+        SFTP_MAX_REQUESTS read requests are kept in flight to hide network latency.
 
         Args:
             remote_path (str): The path of the file on the remote server to be downloaded.
@@ -165,6 +427,218 @@ class DownloadFile(APIFunction):
             SSHException: Raised if there is an issue with the SFTP connection.
         """
         connection_manager = ConnectionManager.get_instance()
-        sftp_client = connection_manager.ssh_client.open_sftp()
-        sftp_client.get(remote_path, local_path)
-        sftp_client.close()
+        with connection_manager.sftp() as sftp_client:
+            sftp_client.get(
+                remote_path,
+                local_path,
+                max_concurrent_prefetch_requests=SFTP_MAX_REQUESTS,
+            )
+
+
+def _read_error(stderr):
+    """
+    Reads what a remote command printed on its standard error.
+
+    Args:
+        stderr (file-like): The stderr stream returned by exec_command().
+
+    Returns:
+        str: The decoded, stripped error output.
+    """
+    return stderr.read().decode("utf-8", "replace").strip()
+
+
+class UploadDirectory(APIFunction):
+    """
+    API function for uploading a directory tree.
+
+    The directory is packed by a local `tar` process and streamed through an SSH exec
+    channel into `tar` on the remote server. This avoids SFTP's per-request framing and
+    acknowledgements, which dominate when copying many files.
+    """
+
+    __slots__ = ()
+
+    def execute(self, local_dir, remote_dir):
+        """
+        Uploads the contents of a local directory into a remote directory.
+
+        The remote directory is created if it does not exist.
+
+        Args:
+            local_dir (str): The directory on the local system to be uploaded.
+            remote_dir (str): The directory on the remote server to extract into.
+
+        Raises:
+            IOError: Raised if the local or remote tar process fails or the stream between
+                     them breaks, with the remote tar's error output.
+            SSHException: Raised if there is an issue with the SSH connection.
+        """
+        remote_dir = shlex.quote(remote_dir)
+        connection_manager = ConnectionManager.get_instance()
+        tar_process = copy_error = None
+        with connection_manager.acquire() as ssh_client:
+            stdin, stdout, stderr = ssh_client.exec_command(
+                f"mkdir -p {remote_dir} && tar xf - -C {remote_dir}"
+            )
+            try:
+                try:
+                    with subprocess.Popen(
+                        ["tar", "cf", "-", "-C", local_dir, "."], stdout=subprocess.PIPE
+                    ) as tar_process:
+                        shutil.copyfileobj(tar_process.stdout, stdin, TAR_CHUNK_SIZE)
+                    # Closing stdin sends EOF so the remote tar can finish
+                    stdin.close()
+                except OSError as e:
+                    # The remote tar exiting early breaks the pipe; report its stderr instead
+                    copy_error = e
+                exit_status = stdout.channel.recv_exit_status()
+                remote_error = _read_error(stderr)
+            finally:
+                stdout.channel.close()
+        if copy_error is not None or tar_process.returncode != 0 or exit_status != 0:
+            raise IOError(
+                f"Uploading directory '{local_dir}' failed: {remote_error or copy_error}"
+            ) from copy_error
+
+
+class DownloadDirectory(APIFunction):
+    """
+    API function for downloading a directory tree.
+
+    The remote directory is packed by `tar` on the server and streamed through an SSH
+    exec channel into a local `tar` process, avoiding SFTP's per-request framing.
+    """
+
+    __slots__ = ()
+
+    def execute(self, remote_dir, local_dir):
+        """
+        Downloads the contents of a remote directory into a local directory.
+
+        The local directory is created if it does not exist.
+
+        Args:
+            remote_dir (str): The directory on the remote server to be downloaded.
+            local_dir (str): The directory on the local system to extract into.
+
+        Raises:
+            IOError: Raised if the local or remote tar process fails or the stream between
+                     them breaks, with the remote tar's error output.
+            SSHException: Raised if there is an issue with the SSH connection.
+        """
+        os.makedirs(local_dir, exist_ok=True)
+        connection_manager = ConnectionManager.get_instance()
+        tar_process = copy_error = None
+        with connection_manager.acquire() as ssh_client:
+            _, stdout, stderr = ssh_client.exec_command(
+                f"tar cf - -C {shlex.quote(remote_dir)} ."
+            )
+            try:
+                try:
+                    with subprocess.Popen(
+                        ["tar", "xf", "-", "-C", local_dir], stdin=subprocess.PIPE
+                    ) as tar_process:
+                        shutil.copyfileobj(stdout, tar_process.stdin, TAR_CHUNK_SIZE)
+                except OSError as e:
+                    # The local tar exiting early breaks the pipe
+                    copy_error = e
+                exit_status = stdout.channel.recv_exit_status()
+                remote_error = _read_error(stderr)
+            finally:
+                stdout.channel.close()
+        if copy_error is not None or tar_process.returncode != 0 or exit_status != 0:
+            raise IOError(
+                f"Downloading directory '{remote_dir}' failed: {remote_error or copy_error}"
+            ) from copy_error
+
+
+def _transfer_many(transfer, pairs, max_workers):
+    """
+    Runs a single-file transfer for each path pair across a pool of worker threads.
+
+    Args:
+        transfer (APIFunction): The UploadFile or DownloadFile instance to execute.
+        pairs (iterable): Tuples of (source_path, destination_path).
+        max_workers (int): The maximum number of concurrent transfers. Defaults to the
+                           ConnectionManager's pool size when None.
+
+    Raises:
+        IOError: Re-raised from the first transfer that failed.
+        SSHException: Re-raised from the first transfer that failed.
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return
+    if max_workers is None:
+        max_workers = ConnectionManager.get_instance().pool_size
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+        # Consume the iterator so the first transfer error is raised here
+        list(executor.map(lambda pair: transfer.execute(*pair), pairs))
+
+
+class UploadFiles(APIFunction):
+    """
+    API function for uploading several files in parallel.
+
+    Each transfer checks out its own pooled SSH client and SFTP session, so up to
+    min(pool size, number of files) uploads proceed at the same time.
+    """
+
+    __slots__ = ()
+
+    def execute(self, pairs, max_workers=None):
+        """
+        Uploads several files from the local system to a remote server.
+
+        Args:
+            pairs (iterable): Tuples of (local_path, remote_path).
+            max_workers (int, optional): The maximum number of concurrent uploads.
+                                         Defaults to the connection pool size.
+
+        Raises:
+            IOError: Raised if there is an issue with file reading or writing.
+            SSHException: Raised if there is an issue with the SFTP connection.
+        """
+        _transfer_many(UPLOAD_FILE, pairs, max_workers)
+
+
+class DownloadFiles(APIFunction):
+    """
+    API function for downloading several files in parallel.
+
+    Each transfer checks out its own pooled SSH client and SFTP session, so up to
+    min(pool size, number of files) downloads proceed at the same time.
+    """
+
+    __slots__ = ()
+
+    def execute(self, pairs, max_workers=None):
+        """
+        Downloads several files from a remote server to the local system.
+
+        Args:
+            pairs (iterable): Tuples of (remote_path, local_path).
+            max_workers (int, optional): The maximum number of concurrent downloads.
+                                         Defaults to the connection pool size.
+
+        Raises:
+            IOError: Raised if there is an issue with file reading or writing.
+            SSHException: Raised if there is an issue with the SFTP connection.
+        """
+        _transfer_many(DOWNLOAD_FILE, pairs, max_workers)
+
+
+# Shared instances of the stateless API functions, for callers that know the function
+# they need and do not have to go through APIFunctionFactory
+EXECUTE_REMOTE_COMMAND = ExecuteRemoteCommand()
+EXECUTE_REMOTE_COMMAND_BYTES = ExecuteRemoteCommandBytes()
+EXECUTE_REMOTE_COMMANDS = ExecuteRemoteCommands()
+BATCH_EXECUTE_COMMAND = BatchExecuteCommand()
+GET_SYSTEM_STATS = GetSystemStats()
+UPLOAD_FILE = UploadFile()
+DOWNLOAD_FILE = DownloadFile()
+UPLOAD_FILES = UploadFiles()
+DOWNLOAD_FILES = DownloadFiles()
+UPLOAD_DIRECTORY = UploadDirectory()
+DOWNLOAD_DIRECTORY = DownloadDirectory()
@@ -13,22 +13,210 @@ Classes:
     ConnectionManager: Manages SSH connections and notifies observers about 
                        connection status changes.
     Observer: Abstract class for observers that can be notified by the ConnectionManager.
+    ConnectionPool: A bounded pool of SSH clients authenticated with the same credentials.
+    TTLCache: A thread-safe cache whose entries expire after a fixed time-to-live.
 
 The ConnectionManager class initializes an SSH client with a policy to automatically 
 add missing host keys. It provides functionality to connect to and disconnect from 
 an SSH server, execute commands, and manage observers that need to be notified 
 of connection status changes.
 
+Once connected, the ConnectionManager also maintains a bounded pool of pre-authenticated 
+SSH clients. Operations check a client out of the pool for their duration, so concurrent 
+commands and file transfers run over separate transports instead of serializing through 
+one. The pool size is read from the BF_SSH_POOL_SIZE environment variable. Pools are 
+kept per (host, port, username), so connecting again to a destination reuses its 
+authenticated clients instead of paying for a new handshake.
+
+The SSH clients are paramiko clients by default. Setting the BF_SSH_BACKEND environment 
+variable to "ssh2" selects the libssh2-based Ssh2SSHClient instead, which performs the 
+encryption in C. Setting BF_SSH_COMPRESS to a true value enables zlib compression of 
+the transports, which pays off for large text output over slow links.
+
 Usage:
     The ConnectionManager is intended to be used as a singleton to ensure a single 
     point of SSH connection management throughout the application. It can be used 
     to establish a connection, execute commands over SSH, and close the connection. 
     Additionally, other components can register as observers to receive updates 
-    on the connection status.
+    on the connection status. The instance is created when the module is imported 
+    and bound to CONNECTION_MANAGER; ConnectionManager.get_instance() returns it.
 """
 
+import atexit
+import codecs
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
 import paramiko
 
+from model.backend.ssh2_client import Ssh2SSHClient
+
+# Environment variable and values selecting the SSH client implementation
+SSH_BACKEND_ENV_VAR = "BF_SSH_BACKEND"
+PARAMIKO_BACKEND = "paramiko"
+SSH2_BACKEND = "ssh2"
+
+# Environment variable and default for the number of pooled SSH clients
+POOL_SIZE_ENV_VAR = "BF_SSH_POOL_SIZE"
+DEFAULT_POOL_SIZE = 4
+
+# Environment variable enabling zlib compression of SSH transports, and its "on" values
+COMPRESS_ENV_VAR = "BF_SSH_COMPRESS"
+COMPRESS_ENABLED_VALUES = ("1", "true", "yes", "on")
+
+# Seconds between keepalive packets so idle transports are not dropped mid-transfer
+KEEPALIVE_INTERVAL = 30
+
+# Bytes requested per recv() call when reading channel output
+RECV_SIZE = 1 << 16
+
+# sshd's default MaxStartups; beyond this many concurrent unauthenticated
+# connections the server starts dropping new ones
+MAX_STARTUPS = 10
+
+# sshd's default MaxSessions, the number of channels one connection may have open at once
+MAX_SESSIONS = 10
+
+# Separator printed between the outputs of commands batched into one invocation,
+# and its printf escape
+BATCH_SEPARATOR = "\x1f"
+BATCH_SEPARATOR_ESCAPE = "\\037"
+
+# Default number of commands execute_parallel() runs at once across all hosts
+PARALLEL_MAX_WORKERS = 32
+
+# Seconds for which the output of a cached read-only command is reused
+COMMAND_CACHE_TTL = 2.0
+
+# Host key policy shared by every client; AutoAddPolicy keeps no state, so one instance suffices
+_AUTO_ADD_POLICY = paramiko.AutoAddPolicy()
+
+# Limits concurrent handshakes across all pools to stay below MaxStartups
+_HANDSHAKE_SLOTS = threading.BoundedSemaphore(MAX_STARTUPS - 1)
+
+# Queued after the last status to make the notification dispatcher thread exit
+_STOP_NOTIFYING = object()
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _connect_client(client, credentials, compress):
+    """
+    Connects and authenticates an SSH client and enables keepalives on its transport.
+
+    The underlying TCP socket, when there is one rather than a proxy, gets TCP_NODELAY
+    to disable Nagle's algorithm and SO_KEEPALIVE.
+
+    Args:
+        client (paramiko.SSHClient): The unconnected client.
+        credentials (tuple): The host, port, username, password and key path to connect with.
+        compress (bool): Whether to negotiate zlib compression for the transport.
+
+    Raises:
+        SSHException: If the connection fails or other SSH-related errors occur.
+    """
+    host, port, username, password, key_path = credentials
+    client.connect(
+        host,
+        port,
+        username=username,
+        password=password,
+        key_filename=key_path,
+        compress=compress,
+    )
+    transport = client.get_transport()
+    transport.set_keepalive(KEEPALIVE_INTERVAL)
+    sock = transport.sock
+    if isinstance(sock, socket.socket):
+        # Send small packets such as commands and keystrokes without waiting for ACKs,
+        # and let the kernel detect dead peers on idle connections
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
+class TTLCache:
+    """
+    A small thread-safe cache whose entries expire after a fixed time-to-live.
+
+    Used to memoize the output of idempotent, read-only remote commands so that
+    clients polling the same command within the TTL window do not generate
+    additional SSH traffic.
+    """
+
+    def __init__(self, ttl, maxsize=128):
+        """
+        Initializes an empty cache.
+
+        Args:
+            ttl (float): The number of seconds an entry stays valid.
+            maxsize (int): The maximum number of entries; the oldest is evicted first.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value for a key if it has not expired.
+
+        Args:
+            key (hashable): The cache key.
+            default: The value to return on a miss.
+
+        Returns:
+            The cached value, or the default if the key is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key, value):
+        """
+        Stores a value under a key for the cache's TTL.
+
+        Args:
+            key (hashable): The cache key.
+            value: The value to cache.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key=None):
+        """
+        Removes a single entry, or every entry when no key is given.
+
+        Args:
+            key (hashable, optional): The cache key to remove. Defaults to None.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+# Output of cached read-only commands, keyed by (destination, command); cleared whenever
+# the connection changes
+COMMAND_CACHE = TTLCache(COMMAND_CACHE_TTL)
+
 
 class Observer:
     """
@@ -62,6 +250,164 @@ class Observer:
         raise NotImplementedError("Subclass must implement abstract method")
 
 
+class ConnectionPool:
+    """
+    A bounded pool of SSH clients pre-authenticated with the same credentials.
+
+    The pool starts with the client that was connected by ConnectionManager.connect()
+    and grows on demand up to its size. Growing is the only place new transports are
+    opened, and concurrent handshakes are limited to MAX_STARTUPS - 1 so a burst of
+    checkouts cannot trip the server's MaxStartups limit.
+
+    Attributes:
+        primary (paramiko.SSHClient): The client the pool was created with.
+        credentials (tuple): The host, port, username, password and key path of the pool.
+        size (int): The maximum number of clients the pool may hold.
+        compress (bool): Whether new clients negotiate zlib compression.
+    """
+
+    def __init__(self, primary, credentials, size, client_factory, compress=False):
+        """
+        Initializes the pool with an already connected client.
+
+        Args:
+            primary (paramiko.SSHClient): A client connected with the given credentials.
+            credentials (tuple): The host, port, username, password and key path used to
+                                 authenticate new clients.
+            size (int): The maximum number of clients the pool may hold.
+            client_factory (callable): Creates an unconnected SSH client.
+            compress (bool, optional): Whether new clients negotiate zlib compression.
+                                       Defaults to False.
+        """
+        self.primary = primary
+        self.credentials = credentials
+        self.size = size
+        self.compress = compress
+        self._client_factory = client_factory
+        self._idle = deque([primary])
+        self._clients = [primary]
+        self._pending = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def is_active(self):
+        """
+        Checks whether the primary client's transport is still connected.
+
+        Returns:
+            bool: True if the pool can still hand out authenticated clients.
+        """
+        transport = self.primary.get_transport()
+        return transport is not None and transport.is_active()
+
+    def _grow(self):
+        """
+        Creates a new client authenticated with the pool's credentials.
+
+        Returns:
+            paramiko.SSHClient: A connected SSH client.
+
+        Raises:
+            SSHException: If the connection fails or other SSH-related errors occur.
+        """
+        client = self._client_factory()
+        with _HANDSHAKE_SLOTS:
+            _connect_client(client, self.credentials, self.compress)
+        return client
+
+    def checkout(self):
+        """
+        Takes an idle client from the pool, growing the pool if it is below its size limit.
+
+        When the pool is exhausted this method waits until another operation returns or
+        discards its client. A discarded client frees its slot, so a waiter then grows
+        the pool instead of waiting for a client that will never come back.
+
+        Returns:
+            paramiko.SSHClient: A connected SSH client owned by the pool.
+
+        Raises:
+            SSHException: If the pool is closed, the connection fails or other SSH-related
+                errors occur.
+        """
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise paramiko.SSHException("Connection pool is closed")
+                if self._idle:
+                    return self._idle.popleft()
+                if len(self._clients) + self._pending < self.size:
+                    # Reserve the slot before connecting so other threads cannot overshoot
+                    self._pending += 1
+                    break
+                self._condition.wait()
+
+        try:
+            client = self._grow()
+        except BaseException:
+            with self._condition:
+                self._pending -= 1
+                # The slot is free again, so a waiter may try to grow the pool itself
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._pending -= 1
+            self._clients.append(client)
+        return client
+
+    def release(self, client):
+        """
+        Returns a checked-out client to the pool.
+
+        Clients that no longer belong to the pool, for example because the pool was
+        closed while they were in use, are closed instead.
+
+        Args:
+            client (paramiko.SSHClient): The client to return.
+        """
+        with self._condition:
+            if client in self._clients:
+                self._idle.append(client)
+                self._condition.notify()
+                return
+        client.close()
+
+    def discard(self, client):
+        """
+        Removes a client with a dead transport from the pool so a fresh one is created.
+
+        A thread waiting in checkout() is woken up to grow the pool into the freed slot.
+
+        Args:
+            client (paramiko.SSHClient): The client to discard.
+        """
+        with self._condition:
+            if client in self._clients:
+                self._clients.remove(client)
+                self._condition.notify()
+        client.close()
+
+    def close(self):
+        """
+        Closes every client owned by the pool.
+
+        Threads waiting in checkout() are woken up and raise SSHException.
+
+        Returns:
+            list: The clients that were closed.
+        """
+        with self._condition:
+            clients = self._clients
+            self._clients = []
+            self._idle.clear()
+            self._closed = True
+            self._condition.notify_all()
+        for client in clients:
+            client.close()
+        return clients
+
+
 class ConnectionManager:
     """
     A singleton class that manages SSH connections using the `paramiko` library.
@@ -74,16 +420,39 @@ class ConnectionManager:
 
     Attributes:
         ssh_client (paramiko.SSHClient): The SSH client is used for connections.
-        _observers (list): List of observers to be notified of connection status changes.
+        _backend (str): The SSH client implementation, "paramiko" or "ssh2".
+        _observers (weakref.WeakSet): Observers to be notified of connection status changes.
+            Observers are held weakly, so an observer no longer referenced elsewhere is
+            dropped automatically.
+        _observers_lock (threading.Lock): Guards the observer set against the dispatcher thread.
+        _notify_queue (queue.Queue): Statuses waiting to be delivered by the dispatcher thread.
+        _notify_thread (threading.Thread): The dispatcher thread, started on first notify().
+        _notify_lock (threading.Lock): Guards starting and stopping the dispatcher thread.
+        _pool_size (int): The maximum number of clients each pool may hold.
+        _compress (bool): Whether transports negotiate zlib compression.
+        _pools (dict): The connection pool of each (host, port, username) connected to.
+        _pool (ConnectionPool): The pool of the current connection, or None.
+        _connected (bool): Whether connect() succeeded since the last disconnect().
+        _sftp_clients (dict): The persistent SFTP session opened on each pooled client.
 
     Methods:
         get_instance(): Returns the singleton instance of the ConnectionManager.
         connect(host, port, username, password, key_path): Establishes an SSH connection to host.
         disconnect(): Closes the SSH connection.
-        execute_command(command): Executes a given command on the connected host.
+        close_all(): Closes every pooled client without notifying observers.
+        execute_command(command, stream, text): Executes a given command on the connected host.
+        execute_command_bytes(command): Executes a command and returns its raw output.
+        execute_commands(commands): Executes several commands concurrently on one connection.
+        execute_many(commands): Executes several commands in one remote invocation.
+        execute_parallel(tasks, max_workers): Executes commands on several hosts concurrently.
+        acquire(destination): Checks an SSH client out of a pool for the duration of a with-block.
+        sftp(): Yields the persistent SFTP session of a checked-out pooled client.
         attach(observer): Attaches an observer.
         detach(observer): Detaches an observer.
         notify(status): Notifies all observers of the connection status.
+        flush_notifications(): Waits until every queued status has been delivered.
+        stop_notifications(): Delivers the queued statuses and stops the dispatcher thread.
+        reset(): Restores the state of a freshly created instance.
     """
 
     _instance = None
@@ -91,9 +460,27 @@ class ConnectionManager:
     def __init__(self):
         if ConnectionManager._instance is not None:
             raise RuntimeError("Singleton class, use get_instance() method")
-        self.ssh_client = paramiko.SSHClient()
-        self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        self._observers = []
+        self._initialize()
+
+    def _initialize(self):
+        """
+        Sets up the state of a freshly created instance, reading the environment.
+        """
+        self._backend = os.environ.get(SSH_BACKEND_ENV_VAR, PARAMIKO_BACKEND)
+        self.ssh_client = self._create_ssh_client()
+        self._observers = weakref.WeakSet()
+        self._observers_lock = threading.Lock()
+        self._notify_queue = queue.Queue()
+        self._notify_thread = None
+        self._notify_lock = threading.Lock()
+        self._pool_size = int(os.environ.get(POOL_SIZE_ENV_VAR, DEFAULT_POOL_SIZE))
+        self._compress = (
+            os.environ.get(COMPRESS_ENV_VAR, "").lower() in COMPRESS_ENABLED_VALUES
+        )
+        self._pools = {}
+        self._pool = None
+        self._connected = False
+        self._sftp_clients = {}
 
     @staticmethod
     def get_instance():
@@ -101,39 +488,66 @@ class ConnectionManager:
         Retrieves the singleton instance of the ConnectionManager.
 
         This method ensures that only one instance of ConnectionManager is created and used
-        throughout the application, adhering to the singleton design pattern.
+        throughout the application, adhering to the singleton design pattern. The instance
+        is created when this module is imported, so this is a plain attribute read.
 
         Returns:
             ConnectionManager: The singleton instance of the ConnectionManager.
         """
-        if ConnectionManager._instance is None:
-            ConnectionManager._instance = ConnectionManager()
         return ConnectionManager._instance
 
+    @property
+    def pool_size(self):
+        """
+        The maximum number of SSH clients the connection pool may hold.
+
+        Returns:
+            int: The pool size configured through BF_SSH_POOL_SIZE.
+        """
+        return self._pool_size
+
+    @property
+    def destination(self):
+        """
+        The (host, port, username) of the current connection.
+
+        Returns:
+            tuple: The destination connected to last, or None when not connected.
+        """
+        if self._pool is None:
+            return None
+        host, port, username, _, _ = self._pool.credentials
+        return host, port, username
+
     def attach(self, observer):
         """
         Attaches an observer to the ConnectionManager.
 
-        This method allows an observer to be added to the internal list,
+        This method allows an observer to be added to the internal set,
         enabling it to receive notifications about connection status changes.
+        Only a weak reference is kept, so the caller must hold on to the observer
+        for as long as it should be notified.
 
         Args:
             observer (Observer): The observer that will be notified of
             connection status changes.
         """
-        self._observers.append(observer)
+        with self._observers_lock:
+            self._observers.add(observer)
 
     def detach(self, observer):
         """
         Detaches an observer from the ConnectionManager.
 
-        This method removes an observer from the internal list, stopping it from receiving
-        further notifications about connection status changes.
+        This method removes an observer from the internal set, stopping it from receiving
+        further notifications about connection status changes. Detaching an observer
+        that is not attached has no effect.
 
         Args:
             observer (Observer): The observer to be removed.
         """
-        self._observers.remove(observer)
+        with self._observers_lock:
+            self._observers.discard(observer)
 
     def notify(self, status):
         """
@@ -142,11 +556,90 @@ class ConnectionManager:
         This method is called internally whenever there is a change in the connection status,
         such as after connecting or disconnecting from the SSH server.
 
+        The status is queued and delivered by a background dispatcher thread, so notify()
+        returns without waiting for the observers. Use flush_notifications() to wait for
+        delivery; the exit hook does so, so no status is lost when the program exits.
+
         Args:
             status (str): The connection status to be notified to the observers.
         """
-        for observer in self._observers:
-            observer.update(status)
+        with self._notify_lock:
+            self._notify_queue.put(status)
+            if self._notify_thread is None:
+                self._notify_thread = threading.Thread(
+                    target=self._notify_loop, name="ConnectionManager-notify", daemon=True
+                )
+                self._notify_thread.start()
+
+    def flush_notifications(self):
+        """
+        Blocks until every status passed to notify() has been delivered to the observers.
+
+        Called from an observer, this returns immediately instead of waiting for itself.
+        """
+        if threading.current_thread() is self._notify_thread:
+            return
+        self._notify_queue.join()
+
+    def stop_notifications(self):
+        """
+        Delivers the queued statuses and stops the dispatcher thread.
+
+        A later notify() starts a new dispatcher thread.
+        """
+        with self._notify_lock:
+            thread = self._notify_thread
+            self._notify_thread = None
+            if thread is None:
+                return
+            self._notify_queue.put(_STOP_NOTIFYING)
+        thread.join()
+
+    def _notify_loop(self):
+        """
+        Delivers queued statuses to the observers, one batch at a time.
+
+        Statuses queued while the previous batch was being delivered are taken together,
+        so the observers' update methods are looked up once per batch. Every status is
+        delivered, in order. The loop ends after delivering the statuses queued before
+        _STOP_NOTIFYING.
+        """
+        stopping = False
+        while not stopping:
+            statuses = [self._notify_queue.get()]
+            while True:
+                try:
+                    statuses.append(self._notify_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                if _STOP_NOTIFYING in statuses:
+                    stopping = True
+                    del statuses[statuses.index(_STOP_NOTIFYING):]
+                self._deliver(statuses)
+            finally:
+                for _ in range(len(statuses) + stopping):
+                    self._notify_queue.task_done()
+
+    def _deliver(self, statuses):
+        """
+        Calls every observer's update method with each status.
+
+        Args:
+            statuses (list): The statuses to deliver, oldest first.
+        """
+        # Resolve each observer's bound update method once per batch rather than
+        # once per status; the set itself only holds weak references
+        with self._observers_lock:
+            callbacks = tuple(observer.update for observer in self._observers)
+        for status in statuses:
+            for callback in callbacks:
+                try:
+                    callback(status)
+                # Observers are arbitrary code, and one failing must not stop delivery
+                # to the others
+                except Exception:  # pylint: disable=broad-exception-caught
+                    _LOGGER.exception("Observer %r failed to handle status %r", callback, status)
 
     def connect(self, host, port, username, password, key_path):
         """
@@ -155,6 +648,15 @@ class ConnectionManager:
         This method sets up an SSH connection using the provided credentials.
         It also notifies the observers about the connection status.
 
+        Authenticated connections are kept in a pool per (host, port, username) until
+        disconnect() is called. Connecting again to a destination whose pool is still
+        active reuses it instead of authenticating again. Connecting clears COMMAND_CACHE.
+
+        When the BF_SSH_COMPRESS environment variable is set to a true value, the
+        transports negotiate zlib compression. This shrinks large text output such as
+        logs or process lists several times over on slow links, but only costs CPU for
+        file transfers of already compressed data, so it is off by default.
+
         Args:
             host (str): The hostname or IP address of the SSH server.
             port (int): The port number of the SSH server.
@@ -165,49 +667,421 @@ class ConnectionManager:
         Raises:
             SSHException: If the connection fails or other SSH-related errors occur.
         """
-        self.ssh_client.connect(
-            host, port, username=username, password=password, key_filename=key_path
-        )
+        key = (host, port, username)
+        pool = self._pools.get(key)
+        if pool is not None and not pool.is_active():
+            del self._pools[key]
+            self._close_pool(pool)
+            pool = None
+
+        if pool is None:
+            client = self.ssh_client
+            if self._pool is not None:
+                # Keep the current destination's pool for reuse and connect a new client
+                client = self._create_ssh_client()
+            credentials = (host, port, username, password, key_path)
+            _connect_client(client, credentials, self._compress)
+            pool = ConnectionPool(
+                client,
+                credentials,
+                self._pool_size,
+                self._create_ssh_client,
+                self._compress,
+            )
+            self._pools[key] = pool
+
+        self.ssh_client = pool.primary
+        self._pool = pool
+        self._connected = True
+        # Cached output may describe the state before this connection
+        COMMAND_CACHE.invalidate()
         self.notify("Connected")
 
     def is_connected(self):
         """
         Checks if an SSH connection is active.
 
-        This method returns True if the SSH connection is active, False otherwise.
+        This method returns True if the SSH connection is active, False otherwise. The
+        state is recorded by connect() and disconnect(), so checking it before every
+        command is a plain attribute read.
 
         Returns:
             bool: True if the SSH connection is active, False otherwise.
         """
-        return self.ssh_client.get_transport() is not None
+        return self._connected
 
     def disconnect(self):
         """
         Closes the active SSH connection.
 
-        This method disconnects from the SSH server and notifies observers about the
-        disconnection status.
+        This method disconnects from the SSH server, closes every pooled client and
+        notifies observers about the disconnection status.
         """
-        self.ssh_client.close()
+        self.close_all()
         self.notify("Disconnected")
 
-    def execute_command(self, command):
+    def close_all(self):
+        """
+        Closes every pooled client and the primary SSH client without notifying observers.
+        COMMAND_CACHE is cleared as well.
+
+        This is registered to run when the interpreter exits, so the pooled connections
+        are shut down cleanly instead of being dropped with the process.
+        """
+        pools = list(self._pools.values())
+        self._pools = {}
+        self._pool = None
+        self._connected = False
+        COMMAND_CACHE.invalidate()
+        closed_clients = []
+        for pool in pools:
+            closed_clients += self._close_pool(pool)
+        if self.ssh_client not in closed_clients:
+            self.ssh_client.close()
+
+    def _create_ssh_client(self):
+        """
+        Creates an unconnected SSH client for the configured backend.
+
+        Returns:
+            paramiko.SSHClient or Ssh2SSHClient: The new client, set to automatically add
+            missing host keys.
+        """
+        if self._backend == SSH2_BACKEND:
+            client = Ssh2SSHClient()
+        else:
+            client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(_AUTO_ADD_POLICY)
+        return client
+
+    def _close_sessions(self, client):
+        """
+        Closes the persistent SFTP session opened on a client, if any.
+
+        Args:
+            client (paramiko.SSHClient): The client whose sessions to close.
+        """
+        sftp_client = self._sftp_clients.pop(client, None)
+        if sftp_client is not None:
+            sftp_client.close()
+
+    def _close_pool(self, pool):
+        """
+        Closes a pool along with the sessions opened on its clients.
+
+        Args:
+            pool (ConnectionPool): The pool to close.
+
+        Returns:
+            list: The clients that were closed.
+        """
+        clients = pool.close()
+        for client in clients:
+            self._close_sessions(client)
+        return clients
+
+    @contextmanager
+    def acquire(self, destination=None):
+        """
+        Checks an SSH client out of the pool for the duration of a with-block.
+
+        Each operation gets its own pre-authenticated client, so concurrent commands
+        and transfers do not contend on a single transport. The client is returned
+        to the pool when the block exits. If the block raises an SSHException and the
+        client's transport is no longer active, the client is discarded and replaced
+        on a later checkout.
+
+        When no connection has been established yet, the primary SSH client is
+        yielded directly.
+
+        Args:
+            destination (tuple, optional): The (host, port, username) whose pool to check
+                the client out of. Defaults to the current connection's pool.
+
+        Yields:
+            paramiko.SSHClient: The checked-out SSH client.
+
+        Raises:
+            SSHException: If no connection to the given destination has been established.
+        """
+        if destination is None:
+            pool = self._pool
+            if pool is None:
+                yield self.ssh_client
+                return
+        else:
+            pool = self._pools.get(destination)
+            if pool is None:
+                host, port, username = destination
+                raise paramiko.SSHException(f"Not connected to {username}@{host}:{port}")
+
+        client = pool.checkout()
+        try:
+            yield client
+        except paramiko.SSHException:
+            transport = client.get_transport()
+            if transport is None or not transport.is_active():
+                self._close_sessions(client)
+                pool.discard(client)
+            else:
+                pool.release(client)
+            raise
+        except BaseException:
+            pool.release(client)
+            raise
+        pool.release(client)
+
+    @contextmanager
+    def sftp(self):
+        """
+        Yields the persistent SFTP session of an SSH client checked out of the pool.
+
+        Each pooled client keeps one SFTP session open for the lifetime of the connection,
+        so transfers do not pay an SFTP subsystem handshake per file. The session is
+        reopened if its channel was closed, and it is closed by disconnect().
+
+        Yields:
+            paramiko.SFTPClient: The SFTP session of the checked-out client.
+        """
+        with self.acquire() as client:
+            sftp_client = self._sftp_clients.get(client)
+            if sftp_client is None or sftp_client.sock.closed:
+                sftp_client = client.open_sftp()
+                self._sftp_clients[client] = sftp_client
+            yield sftp_client
+
+    def execute_command(self, command, stream=False, *, text=True):
         """
         Executes a given command on the connected SSH host.
 
         This method sends a command to the SSH server and returns its output.
 
+        The output is read from the channel in RECV_SIZE chunks into a single buffer and
+        decoded once, so large outputs are not copied into intermediate bytes objects.
+        With stream=True the output is instead yielded chunk by chunk as it arrives,
+        and the pooled client stays checked out until the iterator is exhausted or closed.
+        With text=False the output is returned or yielded as undecoded bytes, for callers
+        that store, hash or forward it rather than display it.
+
+        Args:
+            command (str): The command to execute on the SSH server.
+            stream (bool, optional): Whether to return an iterator over the output instead
+                                     of the whole output. Defaults to False.
+            text (bool, optional): Whether to decode the output as UTF-8. Defaults to True.
+
+        Returns:
+            str, bytes or Iterator: The output returned from executing the command on the
+            server, or an iterator over its chunks when stream is True. The output is str
+            when text is True and bytes otherwise.
+
+        Raises:
+            SSHException: If the command execution fails or other SSH-related errors occur.
+        """
+        if stream:
+            return self._stream_command(command, text)
+        output = self.execute_command_bytes(command)
+        return output.decode("utf-8", "replace") if text else output
+
+    def execute_command_bytes(self, command):
+        """
+        Executes a given command on the connected SSH host and returns its raw output.
+
+        Callers that store, hash or forward the output do not need it as text, and
+        skipping the decode saves a full pass over the output and a second copy of it.
+
         Args:
             command (str): The command to execute on the SSH server.
 
         Returns:
-            str: The output returned from executing the command on the server.
+            bytes: The undecoded output of the command.
 
         Raises:
             SSHException: If the command execution fails or other SSH-related errors occur.
         """
-        _, stdout, _ = self.ssh_client.exec_command(command)
-        return stdout.read().decode()
+        with self.acquire() as client:
+            return self._run_on_channel(client.get_transport(), command)
+
+    def execute_commands(self, commands):
+        """
+        Executes several commands concurrently over a single connection.
+
+        Each command runs on its own channel, and the channels are multiplexed over one
+        pooled client's transport, so N commands finish in about the time of the slowest
+        one while using a single TCP connection. At most MAX_SESSIONS channels are open
+        at once. libssh2 sessions are not thread-safe, so with the ssh2 backend the
+        commands run one after another on the connection instead.
+
+        Args:
+            commands (list): The commands to execute on the SSH server.
+
+        Returns:
+            list: The output of each command, in order.
+
+        Raises:
+            SSHException: If a command execution fails or other SSH-related errors occur.
+        """
+        if not commands:
+            return []
+        if self._backend == SSH2_BACKEND:
+            max_workers = 1
+        else:
+            max_workers = min(len(commands), MAX_SESSIONS)
+        with self.acquire() as client:
+            transport = client.get_transport()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._run_on_channel, transport, command)
+                    for command in commands
+                ]
+            return [future.result().decode("utf-8", "replace") for future in futures]
+
+    def execute_many(self, commands):
+        """
+        Executes several commands one after another in a single remote invocation.
+
+        The commands are joined into one shell script, one command per line with a line
+        printing BATCH_SEPARATOR between them, and run on a single channel, so N commands
+        cost one channel open and one round-trip instead of N. Putting each command on its
+        own line keeps a trailing & or # comment from affecting the separator. Each
+        command runs even if an earlier one fails.
+
+        Args:
+            commands (list): The commands to execute on the SSH server.
+
+        Returns:
+            list: The output of each command, in order.
+
+        Raises:
+            SSHException: If the output cannot be split into one part per command, for
+                example because a command exited the shell or printed the separator, if
+                the command execution fails or other SSH-related errors occur.
+        """
+        if not commands:
+            return []
+        script = f"\nprintf '{BATCH_SEPARATOR_ESCAPE}'\n".join(commands)
+        with self.acquire() as client:
+            output = self._run_on_channel(client.get_transport(), script)
+        parts = output.decode("utf-8", "replace").split(BATCH_SEPARATOR)
+        if len(parts) != len(commands):
+            raise paramiko.SSHException(
+                f"Expected output of {len(commands)} batched commands, got {len(parts)}"
+            )
+        return parts
+
+    def execute_parallel(self, tasks, max_workers=PARALLEL_MAX_WORKERS):
+        """
+        Executes commands on several connected hosts concurrently.
+
+        Each command runs in its own worker thread on a client checked out of its
+        destination's pool, so commands on different hosts overlap their network
+        round-trips instead of running one host after another. Every destination must
+        have been connected with connect() first, so no handshakes are repeated.
+
+        Args:
+            tasks (list): (destination, command) pairs, where destination is the
+                (host, port, username) to run the command on.
+            max_workers (int, optional): The maximum number of commands running at once.
+                Defaults to PARALLEL_MAX_WORKERS.
+
+        Returns:
+            list: The output of each command, in the order of the tasks.
+
+        Raises:
+            SSHException: If a destination is not connected, a command execution fails
+                or other SSH-related errors occur.
+        """
+        if not tasks:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(tasks), max_workers)) as executor:
+            futures = [
+                executor.submit(self._run_on_destination, destination, command)
+                for destination, command in tasks
+            ]
+        return [future.result() for future in futures]
+
+    def _run_on_destination(self, destination, command):
+        """
+        Executes a command on a client checked out of a destination's pool.
+
+        Args:
+            destination (tuple): The (host, port, username) to run the command on.
+            command (str): The command to execute.
+
+        Returns:
+            str: The decoded output of the command.
+        """
+        with self.acquire(destination) as client:
+            output = self._run_on_channel(client.get_transport(), command)
+        return output.decode("utf-8", "replace")
+
+    @staticmethod
+    def _run_on_channel(transport, command):
+        """
+        Executes a command on a new channel of a transport and returns its output.
+
+        The output is read in RECV_SIZE chunks into a single buffer.
+
+        Args:
+            transport (paramiko.Transport): The transport to open the channel on.
+            command (str): The command to execute.
+
+        Returns:
+            bytes: The output of the command.
+        """
+        buffer = bytearray()
+        channel = transport.open_session()
+        try:
+            channel.exec_command(command)
+            for data in iter(lambda: channel.recv(RECV_SIZE), b""):
+                buffer += data
+        finally:
+            channel.close()
+        return bytes(buffer)
+
+    def _stream_command(self, command, text=True):
+        """
+        Executes a command and yields its output as it arrives.
+
+        Decoded chunks are decoded incrementally, so a multi-byte character split across
+        two reads is yielded whole.
+
+        Args:
+            command (str): The command to execute on the SSH server.
+            text (bool, optional): Whether to decode the chunks as UTF-8. Defaults to True.
+
+        Yields:
+            str or bytes: The next chunk of the command's output, decoded when text is True.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")("replace") if text else None
+        with self.acquire() as client:
+            channel = client.get_transport().open_session()
+            try:
+                channel.exec_command(command)
+                for data in iter(lambda: channel.recv(RECV_SIZE), b""):
+                    if decoder is None:
+                        yield data
+                        continue
+                    chunk = decoder.decode(data)
+                    if chunk:
+                        yield chunk
+            finally:
+                channel.close()
+        if decoder is not None:
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+
+    def reset(self):
+        """
+        Restores the state of a freshly created instance.
+
+        The dispatcher thread delivers the queued statuses and exits, then the clients,
+        pools, observers and settings are replaced as if the instance had just been
+        created, reading the environment as it is at the time of the call. Existing
+        connections are dropped without being closed.
+        """
+        self.stop_notifications()
+        self._initialize()
 
     @staticmethod
     def reset_instance():
@@ -215,6 +1089,27 @@ class ConnectionManager:
         Resets the singleton instance of the ConnectionManager.
 
         This method is used to reset the instance of the ConnectionManager, primarily
-        for testing or re-initialization purposes.
+        for testing or re-initialization purposes. The instance is reset in place with
+        reset(), so CONNECTION_MANAGER and any other reference to it stay valid.
         """
-        ConnectionManager._instance = None
+        ConnectionManager._instance.reset()
+
+
+# The singleton ConnectionManager, created once at import time
+CONNECTION_MANAGER = ConnectionManager._instance = ConnectionManager()
+
+
+def _close_all():
+    """
+    Delivers the queued statuses and closes the pooled connections of the current
+    ConnectionManager instance.
+
+    Observers run on a daemon thread, so without the flush a status such as the
+    "Disconnected" sent right before sys.exit() could be lost.
+    """
+    manager = ConnectionManager.get_instance()
+    manager.flush_notifications()
+    manager.close_all()
+
+
+atexit.register(_close_all)
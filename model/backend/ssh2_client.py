@@ -0,0 +1,614 @@
+"""
+This module provides an SSH client backed by ssh2-python, a binding to the C library libssh2.
+
+Paramiko implements the SSH protocol, including its ciphers and MACs, in Python, which
+makes it CPU bound on command output and file transfers. libssh2 does this work in C
+through OpenSSL and releases the GIL while doing so. The Ssh2SSHClient class exposes
+the subset of the paramiko.SSHClient interface that the ConnectionManager relies on, so
+it can be selected as a drop-in backend by setting the BF_SSH_BACKEND environment
+variable to "ssh2".
+
+ssh2-python is an optional dependency; it is only imported when a connection is made.
+
+Classes:
+    Ssh2SSHClient: A paramiko.SSHClient-compatible client built on an ssh2 Session.
+    Ssh2Transport: Exposes transport-level operations such as keepalives and new channels.
+    Ssh2Channel: A paramiko.Channel-compatible wrapper around an ssh2 Channel.
+    Ssh2ChannelFile: A file-like view of a channel's stdin, stdout or stderr stream.
+    Ssh2SFTPClient: A paramiko.SFTPClient-compatible client supporting open, put and get.
+    Ssh2SFTPFile: A paramiko.SFTPFile-compatible remote file supporting read and write.
+"""
+
+import socket
+from contextlib import contextmanager
+
+from paramiko import AuthenticationException, SSHException
+
+# Bytes requested per channel read
+CHUNK_SIZE = 1 << 15
+
+# Bytes passed to each SFTP write; libssh2 splits a write into SFTP packets and keeps
+# them all in flight, so a larger buffer pipelines more requests per round-trip
+SFTP_WRITE_SIZE = 1 << 20
+
+
+@contextmanager
+def _translate_errors(client=None):
+    """
+    Re-raises ssh2-python errors as the paramiko exceptions callers already handle.
+
+    Errors showing that the connection itself is gone drop the client's session, so
+    its transport no longer reports itself as active.
+
+    Args:
+        client (Ssh2SSHClient, optional): The client whose session the calls use.
+
+    Raises:
+        AuthenticationException: If ssh2 reports an authentication failure.
+        SSHException: For any other ssh2 error.
+    """
+    from ssh2.exceptions import (
+        AuthenticationError,
+        SocketDisconnectError,
+        SocketRecvError,
+        SocketSendError,
+        SocketTimeout,
+        SSH2Error,
+        Timeout,
+    )
+
+    try:
+        yield
+    except AuthenticationError as e:
+        raise AuthenticationException(str(e)) from e
+    except (
+        SocketDisconnectError, SocketRecvError, SocketSendError, SocketTimeout, Timeout
+    ) as e:
+        if client is not None:
+            client.drop_session()
+        raise SSHException(str(e)) from e
+    except SSH2Error as e:
+        raise SSHException(str(e)) from e
+
+
+class Ssh2Channel:
+    """
+    A paramiko.Channel-compatible wrapper around an ssh2 Channel.
+    """
+
+    def __init__(self, channel, client):
+        """
+        Wraps an open ssh2 channel.
+
+        Args:
+            channel (ssh2.channel.Channel): The channel to wrap.
+            client (Ssh2SSHClient): The client whose session the channel belongs to.
+        """
+        self._channel = channel
+        self._client = client
+        self._closed = False
+
+    @property
+    def closed(self):
+        """
+        Whether the channel has been closed or its session has been dropped.
+
+        Returns:
+            bool: True if the channel can no longer be used, False otherwise.
+        """
+        return self._closed or self._client.session is None
+
+    def exec_command(self, command):
+        """
+        Executes a command on the channel.
+
+        Args:
+            command (str): The command to execute.
+        """
+        with _translate_errors(self._client):
+            self._channel.execute(command)
+
+    def sendall(self, data):
+        """
+        Writes all of the given bytes to the channel's stdin.
+
+        Args:
+            data (bytes): The data to send.
+        """
+        with _translate_errors(self._client):
+            self._channel.write(data)
+
+    def recv(self, size):
+        """
+        Reads up to size bytes from the channel's stdout, blocking until data arrives.
+
+        Args:
+            size (int): The maximum number of bytes to read.
+
+        Returns:
+            bytes: The data read, or an empty bytes object at end of stream.
+        """
+        with _translate_errors(self._client):
+            _, data = self._channel.read(size)
+        return data
+
+    def recv_stderr(self, size):
+        """
+        Reads up to size bytes from the channel's stderr.
+
+        Args:
+            size (int): The maximum number of bytes to read.
+
+        Returns:
+            bytes: The data read, or an empty bytes object at end of stream.
+        """
+        with _translate_errors(self._client):
+            _, data = self._channel.read_stderr(size)
+        return data
+
+    def shutdown_write(self):
+        """
+        Sends EOF on the channel's stdin.
+        """
+        with _translate_errors(self._client):
+            self._channel.send_eof()
+
+    def recv_exit_status(self):
+        """
+        Waits for the remote command to finish and returns its exit status.
+
+        Returns:
+            int: The exit status of the remote command.
+        """
+        with _translate_errors(self._client):
+            self._channel.wait_eof()
+            self._channel.close()
+            self._channel.wait_closed()
+        self._closed = True
+        return self._channel.get_exit_status()
+
+    def close(self):
+        """
+        Closes the channel.
+        """
+        if not self.closed:
+            self._closed = True
+            with _translate_errors(self._client):
+                self._channel.close()
+
+
+class Ssh2ChannelFile:
+    """
+    A file-like view of one stream of an Ssh2Channel, as returned by exec_command.
+
+    Attributes:
+        channel (Ssh2Channel): The channel the stream belongs to.
+    """
+
+    def __init__(self, channel, stream):
+        """
+        Initializes the file for the given stream.
+
+        Args:
+            channel (Ssh2Channel): The channel the stream belongs to.
+            stream (str): One of "stdin", "stdout" or "stderr".
+        """
+        self.channel = channel
+        self._stream = stream
+
+    def read(self, size=-1):
+        """
+        Reads from stdout or stderr.
+
+        Args:
+            size (int, optional): The maximum number of bytes to read. Reads until the end
+                                  of the stream when negative. Defaults to -1.
+
+        Returns:
+            bytes: The data read.
+        """
+        recv = self.channel.recv_stderr if self._stream == "stderr" else self.channel.recv
+        if size >= 0:
+            return recv(size)
+        buffer = bytearray()
+        for data in iter(lambda: recv(CHUNK_SIZE), b""):
+            buffer += data
+        return bytes(buffer)
+
+    def write(self, data):
+        """
+        Writes to stdin.
+
+        Args:
+            data (bytes): The data to write.
+        """
+        self.channel.sendall(data)
+
+    def close(self):
+        """
+        Closes the stream; closing stdin sends EOF to the remote command.
+        """
+        if self._stream == "stdin":
+            self.channel.shutdown_write()
+
+
+class Ssh2SFTPFile:
+    """
+    A paramiko.SFTPFile-compatible wrapper around an ssh2 SFTP file handle.
+    """
+
+    def __init__(self, handle, client):
+        """
+        Wraps an open ssh2 SFTP file handle.
+
+        Args:
+            handle (ssh2.sftp_handle.SFTPHandle): The handle to wrap.
+            client (Ssh2SSHClient): The client whose session the handle belongs to.
+        """
+        self._handle = handle
+        self._client = client
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def set_pipelined(pipelined=True):
+        """
+        Accepts the pipelining mode for compatibility with paramiko.SFTPFile.
+
+        libssh2 always pipelines the SFTP requests of a large write.
+
+        Args:
+            pipelined (bool): The requested mode, which is ignored.
+        """
+
+    def write(self, data):
+        """
+        Writes data to the remote file.
+
+        Args:
+            data (bytes): The data to write.
+        """
+        with _translate_errors(self._client):
+            self._handle.write(bytes(data))
+
+    def read(self, size=-1):
+        """
+        Reads from the remote file.
+
+        Args:
+            size (int, optional): The maximum number of bytes to read. Reads until the end
+                                  of the file when negative. Defaults to -1.
+
+        Returns:
+            bytes: The data read.
+        """
+        with _translate_errors(self._client):
+            if size >= 0:
+                return self._handle.read(size)[1]
+            buffer = bytearray()
+            for _, data in self._handle:
+                buffer += data
+            return bytes(buffer)
+
+    def close(self):
+        """
+        Closes the remote file handle.
+        """
+        with _translate_errors(self._client):
+            self._handle.close()
+
+
+class Ssh2SFTPClient:
+    """
+    A paramiko.SFTPClient-compatible client supporting whole-file put and get.
+
+    Attributes:
+        sock (Ssh2Channel): The channel carrying the SFTP subsystem.
+    """
+
+    def __init__(self, sftp, client):
+        """
+        Wraps an initialized ssh2 SFTP session.
+
+        Args:
+            sftp (ssh2.sftp.SFTP): The SFTP session to wrap.
+            client (Ssh2SSHClient): The client whose session the SFTP session runs on.
+        """
+        self._sftp = sftp
+        self._client = client
+        self.sock = Ssh2Channel(sftp.get_channel(), client)
+
+    def open(self, remote_path, mode="r"):
+        """
+        Opens a remote file for reading or for writing.
+
+        Args:
+            remote_path (str): The path of the file on the remote server.
+            mode (str, optional): "r"/"rb" to read, or "w"/"wb" to create or truncate
+                                  the file and write to it. Defaults to "r".
+
+        Returns:
+            Ssh2SFTPFile: The open remote file.
+        """
+        from ssh2 import sftp as ssh2_sftp
+
+        if "w" in mode:
+            flags = ssh2_sftp.LIBSSH2_FXF_WRITE | ssh2_sftp.LIBSSH2_FXF_CREAT
+            flags |= ssh2_sftp.LIBSSH2_FXF_TRUNC
+            permissions = (
+                ssh2_sftp.LIBSSH2_SFTP_S_IRUSR
+                | ssh2_sftp.LIBSSH2_SFTP_S_IWUSR
+                | ssh2_sftp.LIBSSH2_SFTP_S_IRGRP
+                | ssh2_sftp.LIBSSH2_SFTP_S_IROTH
+            )
+        else:
+            flags, permissions = ssh2_sftp.LIBSSH2_FXF_READ, 0
+        with _translate_errors(self._client):
+            return Ssh2SFTPFile(self._sftp.open(remote_path, flags, permissions), self._client)
+
+    def put(self, local_path, remote_path):
+        """
+        Uploads a local file to the remote server.
+
+        The file is written in SFTP_WRITE_SIZE blocks, which libssh2 sends as many
+        pipelined write requests instead of waiting for each to be acknowledged.
+
+        Args:
+            local_path (str): The path of the file on the local system.
+            remote_path (str): The path on the remote server to write to.
+        """
+        with open(local_path, "rb") as local_file, self.open(remote_path, "wb") as remote_file:
+            for data in iter(lambda: local_file.read(SFTP_WRITE_SIZE), b""):
+                remote_file.write(data)
+
+    def get(self, remote_path, local_path, **_):
+        """
+        Downloads a remote file to the local system.
+
+        Keyword arguments specific to paramiko, such as prefetch tuning, are accepted
+        and ignored.
+
+        Args:
+            remote_path (str): The path of the file on the remote server.
+            local_path (str): The path on the local system to write to.
+        """
+        from ssh2 import sftp as ssh2_sftp
+
+        with _translate_errors(self._client), open(local_path, "wb") as local_file:
+            with self._sftp.open(remote_path, ssh2_sftp.LIBSSH2_FXF_READ, 0) as remote_file:
+                for _, data in remote_file:
+                    local_file.write(data)
+
+    def close(self):
+        """
+        Closes the SFTP session's channel.
+        """
+        self.sock.close()
+
+
+class Ssh2Transport:
+    """
+    Exposes the transport-level operations of an ssh2 Session.
+    """
+
+    def __init__(self, client):
+        """
+        Initializes the transport for a connected client.
+
+        Args:
+            client (Ssh2SSHClient): The client owning the session.
+        """
+        self._client = client
+
+    @property
+    def sock(self):
+        """
+        The TCP socket the session runs over.
+
+        Returns:
+            socket.socket: The connected socket.
+        """
+        return self._client.sock
+
+    def is_active(self):
+        """
+        Checks whether the session is still connected.
+
+        The session is dropped when libssh2 reports that the socket was disconnected
+        or timed out, so a connection the server closed is not reported as active.
+
+        Returns:
+            bool: True if the session is connected, False otherwise.
+        """
+        return self._client.session is not None
+
+    def set_keepalive(self, interval):
+        """
+        Configures the interval of libssh2 keepalive messages.
+
+        libssh2 never sends keepalives by itself; one is only sent when keepalive_send()
+        finds it due, which open_session() checks before every new channel. Sessions are
+        not thread-safe, so there is no background thread sending them while the client
+        is idle; dead idle connections are detected by the socket's SO_KEEPALIVE instead.
+
+        Args:
+            interval (int): Seconds between keepalive messages; 0 disables them.
+        """
+        self._client.session.keepalive_config(False, interval)
+
+    def open_session(self):
+        """
+        Opens a new channel on the session, first sending a keepalive if one is due.
+
+        Returns:
+            Ssh2Channel: The new channel.
+        """
+        with _translate_errors(self._client):
+            self._client.session.keepalive_send()
+            return Ssh2Channel(self._client.session.open_session(), self._client)
+
+
+class Ssh2SSHClient:
+    """
+    A paramiko.SSHClient-compatible client built on an ssh2 Session.
+
+    Attributes:
+        session (ssh2.session.Session): The authenticated session, or None when not connected.
+        sock (socket.socket): The TCP socket the session runs over.
+    """
+
+    def __init__(self):
+        """
+        Initializes a disconnected client.
+        """
+        self.session = None
+        self.sock = None
+
+    def set_missing_host_key_policy(self, policy):
+        """
+        Accepts a host key policy for compatibility with paramiko.SSHClient.
+
+        libssh2 does not check host keys unless asked to, which matches the
+        AutoAddPolicy used by the ConnectionManager.
+
+        Args:
+            policy (paramiko.MissingHostKeyPolicy): The policy, which is ignored.
+        """
+
+    def connect(
+        self, host, port, username=None, password=None, key_filename=None, compress=False
+    ):
+        """
+        Connects and authenticates to an SSH server.
+
+        A private key file is tried first when given. If it is rejected, or no key file
+        is given, the password is tried.
+
+        Args:
+            host (str): The hostname or IP address of the SSH server.
+            port (int): The port number of the SSH server.
+            username (str): The username for SSH authentication.
+            password (str): The password for SSH authentication.
+            key_filename (str): The file path to the SSH private key.
+            compress (bool): Whether to negotiate zlib compression.
+
+        Raises:
+            AuthenticationException: If neither a key file nor a password is given, or
+                authentication fails.
+            SSHException: If the connection fails or other SSH-related errors occur.
+        """
+        from ssh2.session import LIBSSH2_FLAG_COMPRESS, Session
+
+        if not key_filename and password is None:
+            raise AuthenticationException("No private key file or password given")
+        sock = socket.create_connection((host, port))
+        session = Session()
+        try:
+            with _translate_errors():
+                if compress:
+                    session.flag(LIBSSH2_FLAG_COMPRESS)
+                session.handshake(sock)
+            self._authenticate(session, username, password, key_filename)
+        except Exception:
+            sock.close()
+            raise
+        self.sock = sock
+        self.session = session
+
+    @staticmethod
+    def _authenticate(session, username, password, key_filename):
+        """
+        Authenticates a session with the key file, falling back to the password.
+
+        Args:
+            session (ssh2.session.Session): The session, after its handshake.
+            username (str): The username for SSH authentication.
+            password (str): The password, or None to only try the key file.
+            key_filename (str): The file path to the SSH private key, or None.
+
+        Raises:
+            AuthenticationException: If every given credential is rejected.
+            SSHException: For other SSH-related errors.
+        """
+        if key_filename:
+            try:
+                with _translate_errors():
+                    session.userauth_publickey_fromfile(username, key_filename)
+                return
+            except AuthenticationException:
+                if password is None:
+                    raise
+        with _translate_errors():
+            session.userauth_password(username, password)
+
+    def get_transport(self):
+        """
+        Returns the transport of the connected session.
+
+        Returns:
+            Ssh2Transport: The transport, or None when not connected.
+        """
+        if self.session is None:
+            return None
+        return Ssh2Transport(self)
+
+    def exec_command(self, command):
+        """
+        Executes a command on a new channel.
+
+        Args:
+            command (str): The command to execute.
+
+        Returns:
+            tuple: The stdin, stdout and stderr streams of the command.
+
+        Raises:
+            SSHException: If not connected or the command cannot be started.
+        """
+        transport = self.get_transport()
+        if transport is None:
+            raise SSHException("SSH session not active")
+        channel = transport.open_session()
+        channel.exec_command(command)
+        return (
+            Ssh2ChannelFile(channel, "stdin"),
+            Ssh2ChannelFile(channel, "stdout"),
+            Ssh2ChannelFile(channel, "stderr"),
+        )
+
+    def open_sftp(self):
+        """
+        Starts an SFTP session.
+
+        Returns:
+            Ssh2SFTPClient: The SFTP client.
+        """
+        with _translate_errors(self):
+            return Ssh2SFTPClient(self.session.sftp_init(), self)
+
+    def drop_session(self):
+        """
+        Forgets a session whose connection is gone and closes its socket.
+
+        No disconnect message is sent, since the connection can no longer carry it.
+        """
+        if self.session is not None:
+            self.session = None
+            self.sock.close()
+            self.sock = None
+
+    def close(self):
+        """
+        Disconnects the session and closes the socket.
+        """
+        if self.session is not None:
+            try:
+                self.session.disconnect()
+            finally:
+                self.session = None
+                self.sock.close()
+                self.sock = None
@@ -14,6 +14,7 @@ messages or triggering alerts, in response to changes in network connectivity.
 """
 
 from model.backend.connection_manager import Observer
+from views.ssh_view import show_message
 
 
 class AlertSystem(Observer):
@@ -44,7 +45,7 @@ class AlertSystem(Observer):
         Responds to network status updates by printing an alert message.
 
         This method is called when the subject (typically a network connection manager)
-        notifies its observers about a change in network status. The method prints
+        notifies its observers about a change in network status. The method displays
         a formatted message to indicate the current status of the network.
 
         Args:
@@ -56,4 +57,4 @@ class AlertSystem(Observer):
             >>> alert_system.update('Connected')
             AlertSystem: Alert - Network status is now Connected
         """
-        print(f"AlertSystem: Alert - Network status is now {status}")
+        show_message(f"AlertSystem: Alert - Network status is now {status}")
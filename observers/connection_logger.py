@@ -13,6 +13,7 @@ track of network status changes is critical for operation or troubleshooting.
 """
 
 from model.backend.connection_manager import Observer
+from views.ssh_view import show_message
 
 
 class ConnectionLogger(Observer):
@@ -41,8 +42,8 @@ class ConnectionLogger(Observer):
         Logs a message indicating a change in the network status.
 
         This method is called when the observed subject (like a network connection manager)
-        notifies its observers of a status change. It prints a formatted message to
-        log the current network status.
+        notifies its observers of a status change. It displays a formatted message
+        to log the current network status.
 
         Args:
             status (str): The updated status of the network connection.
@@ -53,4 +54,4 @@ class ConnectionLogger(Observer):
             >>> connection_logger.update('Disconnected')
             ConnectionLogger: Network status changed to Disconnected
         """
-        print(f"ConnectionLogger: Network status changed to {status}")
+        show_message(f"ConnectionLogger: Network status changed to {status}")
@@ -0,0 +1,39 @@
+"""
+Shared pytest fixtures for the BerryFrame test suite.
+
+Fixtures:
+    _quiet_stdout: Captures every test's standard output in memory.
+    make_ssh_command: Returns a factory creating SSHCommand mocks.
+"""
+
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+from commands.ssh_command import SSHCommand
+
+
+@pytest.fixture(autouse=True)
+def _quiet_stdout(capsys):
+    """
+    Captures every test's standard output in memory.
+
+    Observers and the invoker write status lines to stdout. Requesting capsys for
+    every test keeps those writes in an in-memory buffer instead of the temporary
+    files pytest's default file descriptor capture goes through. Tests that assert
+    on the output request capsys themselves and share the same buffer.
+    """
+    return capsys
+
+
+@pytest.fixture
+def make_ssh_command():
+    """
+    Returns a factory creating SSHCommand mocks.
+
+    The mocks are spec'd against SSHCommand, so misspelled attributes still fail, but
+    they skip the signature introspection create_autospec() repeats for every mock.
+    Each call returns an independent mock.
+    """
+    return partial(Mock, spec=SSHCommand)
@@ -4,8 +4,12 @@ It includes fixtures and test cases for various API functions such as executing
 retrieving system statistics, and handling file uploads and downloads.
 """
 
-from unittest.mock import MagicMock, patch
+import functools
+import io
+import tarfile
+from unittest.mock import MagicMock, Mock, call, patch
 
+import paramiko
 import pytest
 
 from model.api.api_functions import (
@@ -13,7 +17,17 @@ from model.api.api_functions import (
     GetSystemStats,
     UploadFile,
     DownloadFile,
+    UploadFiles,
+    UploadDirectory,
+    DownloadDirectory,
+    COMMAND_CACHE,
+    SFTP_CHUNK_SIZE,
+    SFTP_MAX_REQUESTS,
+    STATS_COMMAND,
+    STATS_SEPARATOR,
 )
+from model.api import api_functions
+from model.api.api_function_factory import APIFunctionFactory
 from model.backend.connection_manager import ConnectionManager
 
 # Constants for API function names
@@ -23,20 +37,31 @@ UPLOAD_FILE = "UploadFile"
 DOWNLOAD_FILE = "DownloadFile"
 
 
+@pytest.fixture(scope="module")
+def _api_mocks():
+    """
+    Provides one spec'd mock per API function name, built once for the module.
+    """
+    return {
+        EXECUTE_REMOTE_COMMAND: Mock(spec=ExecuteRemoteCommand),
+        GET_SYSTEM_STATS: Mock(spec=GetSystemStats),
+        UPLOAD_FILE: Mock(spec=UploadFile),
+        DOWNLOAD_FILE: Mock(spec=DownloadFile),
+    }
+
+
 @pytest.fixture
-def mock_api_function_factory():
+def mock_api_function_factory(_api_mocks):
     """
     Provides a mock API function factory.
     This fixture creates a mock for the APIFunctionFactory, which is responsible for
     creating instances of different API function classes based on function names.
+    The API function mocks it hands out are shared across the module and reset here.
     """
+    for api_mock in _api_mocks.values():
+        api_mock.reset_mock(return_value=True, side_effect=True)
     with patch("model.api.api_function_factory.APIFunctionFactory") as mock_factory:
-        mock_factory.create_api_function.side_effect = lambda func_name: {
-            EXECUTE_REMOTE_COMMAND: MagicMock(spec=ExecuteRemoteCommand),
-            GET_SYSTEM_STATS: MagicMock(spec=GetSystemStats),
-            UPLOAD_FILE: MagicMock(spec=UploadFile),
-            DOWNLOAD_FILE: MagicMock(spec=DownloadFile),
-        }[func_name]
+        mock_factory.create_api_function.side_effect = _api_mocks.__getitem__
         yield mock_factory
 
 
@@ -47,10 +72,36 @@ def mock_connection_manager():
     This fixture is used to simulate the ConnectionManager's behavior for testing purposes,
     specifically to avoid making actual SSH connections during tests.
     """
-    with patch("backend.connection_manager.ConnectionManager") as mock:
+    with patch("model.api.api_functions.ConnectionManager", spec=True) as mock:
         yield mock
 
 
+@functools.lru_cache(maxsize=None)
+def _sftp_mocks():
+    """
+    Builds the mocked ConnectionManager instance and the SFTP client its pooled
+    sftp() session yields, once for the module.
+    """
+    manager = MagicMock()
+    mock_sftp_client = Mock(spec=paramiko.SFTPClient)
+    manager.sftp.return_value.__enter__.return_value = mock_sftp_client
+    return manager, mock_sftp_client
+
+
+@pytest.fixture
+def sftp_pair():
+    """
+    Provides the mocked ConnectionManager instance and the SFTP client its
+    pooled sftp() session yields, as a (manager, sftp) pair.
+    Both mocks are cached by _sftp_mocks and have their calls reset here.
+    """
+    manager, mock_sftp_client = _sftp_mocks()
+    manager.reset_mock()
+    mock_sftp_client.reset_mock(return_value=True, side_effect=True)
+    with patch.object(ConnectionManager, "get_instance", return_value=manager):
+        yield manager, mock_sftp_client
+
+
 def test_get_system_stats(mock_api_function_factory):
     """
     Test for verifying the GetSystemStats API function.
@@ -73,52 +124,250 @@ def test_get_system_stats(mock_api_function_factory):
     assert processes == "167"
 
 
+def test_factory_returns_shared_instances():
+    """
+    Test that the APIFunctionFactory resolves function types to the shared
+    module-level instances of their classes.
+    """
+    first = APIFunctionFactory.create_api_function(EXECUTE_REMOTE_COMMAND)
+    second = APIFunctionFactory.create_api_function(EXECUTE_REMOTE_COMMAND)
+
+    assert isinstance(first, ExecuteRemoteCommand)
+    assert first is second is api_functions.EXECUTE_REMOTE_COMMAND
+    assert isinstance(APIFunctionFactory.create_api_function(UPLOAD_FILE), UploadFile)
+
+
+@pytest.mark.parametrize(
+    "function_type",
+    [
+        "ExecuteRemoteCommand",
+        "ExecuteRemoteCommandBytes",
+        "ExecuteRemoteCommands",
+        "BatchExecuteCommand",
+        "GetSystemStats",
+        "UploadFile",
+        "DownloadFile",
+        "UploadFiles",
+        "DownloadFiles",
+        "UploadDirectory",
+        "DownloadDirectory",
+    ],
+)
+def test_factory_instances_have_no_instance_dict(function_type):
+    """
+    Test that every API function type resolves through the factory and that its
+    instances are slotted, without a per-instance __dict__.
+    """
+    api_function = APIFunctionFactory.create_api_function(function_type)
+
+    assert type(api_function).__name__ == function_type
+    assert not hasattr(api_function, "__dict__")
+
+
+def test_factory_rejects_unknown_function_type():
+    """
+    Test that the APIFunctionFactory raises a ValueError for unknown function types.
+    """
+    with pytest.raises(ValueError, match="Unknown API function type"):
+        APIFunctionFactory.create_api_function("RebootEverything")
+
+
 @patch.object(ConnectionManager, "get_instance")
-def test_upload_file_success(mock_get_instance):
+def test_execute_remote_command_caches_read_only_output(mock_get_instance):
+    """
+    Test that cached commands reuse their output within the TTL window and
+    run again once the cache is invalidated.
+    """
+    COMMAND_CACHE.invalidate()
+    mock_execute_command = mock_get_instance.return_value.execute_command
+    mock_execute_command.return_value = "uptime output\n"
+    executor = ExecuteRemoteCommand()
+
+    assert executor.execute("uptime", cache=True) == "uptime output"
+    assert executor.execute("uptime", cache=True) == "uptime output"
+    assert mock_execute_command.call_count == 1
+
+    COMMAND_CACHE.invalidate()
+    executor.execute("uptime", cache=True)
+    assert mock_execute_command.call_count == 2
+    COMMAND_CACHE.invalidate()
+
+
+@patch.object(ConnectionManager, "get_instance")
+def test_execute_remote_command_cache_is_per_destination(mock_get_instance):
+    """
+    Test that cached output of one host is not returned for the same command on
+    another host.
+    """
+    COMMAND_CACHE.invalidate()
+    manager = mock_get_instance.return_value
+    manager.execute_command.side_effect = ["alpha stats", "beta stats"]
+    executor = ExecuteRemoteCommand()
+
+    manager.destination = ("alpha", 22, "user")
+    assert executor.execute("cat /proc/stat", cache=True) == "alpha stats"
+    manager.destination = ("beta", 22, "user")
+    assert executor.execute("cat /proc/stat", cache=True) == "beta stats"
+    COMMAND_CACHE.invalidate()
+
+
+@patch.object(ConnectionManager, "get_instance")
+def test_execute_remote_command_streams_output(mock_get_instance):
+    """
+    Test that ExecuteRemoteCommand.stream() yields the output chunks as the
+    ConnectionManager produces them, and an error message if the stream fails.
+    """
+    def chunks():
+        yield "total 0\n"
+        raise paramiko.SSHException("Channel closed.")
+
+    mock_get_instance.return_value.execute_command.return_value = chunks()
+
+    output = list(ExecuteRemoteCommand().stream("ls -l"))
+
+    mock_get_instance.return_value.execute_command.assert_called_once_with("ls -l", stream=True)
+    assert output == ["total 0\n", "Error executing command 'ls -l': Channel closed."]
+
+
+@patch.object(ConnectionManager, "get_instance")
+def test_execute_remote_commands_strips_each_output(mock_get_instance):
+    """
+    Test that ExecuteRemoteCommands runs every command through one call to the
+    ConnectionManager and strips each output.
+    """
+    mock_get_instance.return_value.execute_commands.return_value = ["a\n", " b "]
+
+    outputs = APIFunctionFactory.create_api_function("ExecuteRemoteCommands").execute(
+        ["echo a", "echo b"]
+    )
+
+    mock_get_instance.return_value.execute_commands.assert_called_once_with(["echo a", "echo b"])
+    assert outputs == ["a", "b"]
+
+
+@patch.object(ConnectionManager, "get_instance")
+def test_batch_execute_command_reports_errors_per_command(mock_get_instance):
+    """
+    Test that BatchExecuteCommand strips each output, and that a failed invocation
+    returns an error message for every command.
+    """
+    mock_execute_many = mock_get_instance.return_value.execute_many
+    mock_execute_many.return_value = ["a\n", " b "]
+    batch = APIFunctionFactory.create_api_function("BatchExecuteCommand")
+
+    assert batch.execute(["echo a", "echo b"]) == ["a", "b"]
+
+    mock_execute_many.side_effect = paramiko.SSHException("Channel closed.")
+    assert batch.execute(["echo a", "echo b"]) == [
+        "Error executing command 'echo a': Channel closed.",
+        "Error executing command 'echo b': Channel closed.",
+    ]
+
+
+@patch.object(ExecuteRemoteCommand, "execute")
+def test_get_system_stats_batches_commands(mock_execute):
+    """
+    Test that GetSystemStats reads its sources in a single remote invocation
+    and parses the separated output into CPU, memory, disk and process fields.
+    """
+    mock_execute.return_value = STATS_SEPARATOR.join(
+        [
+            "cpu  600 0 260 9000 100 20 20 0 0 0\n"
+            "cpu0 150 0 65 2250 25 5 5 0 0 0\n"
+            "MemTotal:         943104 kB\n"
+            "MemFree:          412000 kB\n"
+            "MemAvailable:     744448 kB\n",
+            "Filesystem     1024-blocks    Used Available Capacity Mounted on\n"
+            "/dev/root         30408704 8388608  20468736      27% /\n",
+            "1\n12\n167\nacpi\ncpuinfo\nmeminfo\nself\n",
+        ]
+    )
+
+    cpu, memory, disk, processes = GetSystemStats().execute()
+
+    mock_execute.assert_called_once_with(STATS_COMMAND, cache=True)
+    assert cpu == "8.6"
+    assert memory == "Memory Usage: 194/921MB (21.06%)"
+    assert disk == "Disk Usage: 8/29GB (27%)"
+    assert processes == "3"
+
+
+@patch.object(ExecuteRemoteCommand, "execute")
+def test_get_system_stats_reuses_module_command_string(mock_execute):
+    """
+    Test that repeated GetSystemStats calls send the module-level command string
+    itself rather than building a new command line on every poll.
+    """
+    mock_execute.return_value = ""
+
+    GetSystemStats().execute()
+    GetSystemStats().execute()
+
+    assert mock_execute.call_count == 2
+    for call in mock_execute.call_args_list:
+        assert call.args[0] is STATS_COMMAND
+
+
+@patch.object(ExecuteRemoteCommand, "execute")
+def test_get_system_stats_reports_command_errors(mock_execute):
+    """
+    Test that when the single stats invocation fails, its error message is
+    returned in place of the CPU usage and the other fields are empty.
+    """
+    mock_execute.return_value = "Error executing command 'cat': Channel closed."
+
+    stats = GetSystemStats().execute()
+
+    mock_execute.assert_called_once_with(STATS_COMMAND, cache=True)
+    assert stats == ("Error executing command 'cat': Channel closed.", "", "", "")
+
+
+def test_upload_file_success(sftp_pair, tmp_path):
     """
     Test the successful upload of a file.
 
     This test validates that the UploadFile class can successfully upload a file
-    from a local path to a remote path using SFTP. It checks the correctness of
-    the method calls for opening an SFTP session, transferring the file, and
-    closing the session.
+    from a local path to a remote path using SFTP. It checks that the pooled SFTP
+    session is used for the transfer and left open for reuse, and that the remote
+    file is written in pipelined mode.
     """
     # Arrange
-    local_path = "local/file/path"
+    local_file = tmp_path / "file.bin"
+    local_file.write_bytes(b"x" * (SFTP_CHUNK_SIZE + 1))
     remote_path = "remote/file/path"
-    mock_ssh_client = MagicMock()
-    mock_sftp_client = MagicMock()
-    mock_get_instance.return_value.ssh_client = mock_ssh_client
-    mock_ssh_client.open_sftp.return_value = mock_sftp_client
+    mock_manager, mock_sftp_client = sftp_pair
+    mock_sftp_client.open.return_value = MagicMock(spec=paramiko.SFTPFile)
+    remote_file = call.open().__enter__()
 
     uploader = UploadFile()
 
     # Act
-    uploader.execute(local_path, remote_path)
+    uploader.execute(str(local_file), remote_path)
 
     # Assert
-    mock_ssh_client.open_sftp.assert_called_once()
-    mock_sftp_client.put.assert_called_once_with(local_path, remote_path)
-    mock_sftp_client.close.assert_called_once()
+    mock_manager.sftp.assert_called_once()
+    assert mock_sftp_client.mock_calls == [
+        call.open(remote_path, "wb"),
+        call.open().__enter__(),
+        remote_file.set_pipelined(True),
+        remote_file.write(b"x" * SFTP_CHUNK_SIZE),
+        remote_file.write(b"x"),
+        call.open().__exit__(None, None, None),
+    ]
 
 
-@patch.object(ConnectionManager, "get_instance")
-def test_download_file_success(mock_get_instance):
+def test_download_file_success(sftp_pair):
     """
     Test the successful download of a file.
 
     This test validates that the DownloadFile class can successfully download a file
-    from a remote path to a local path using SFTP. It checks the correctness of
-    the method calls for opening an SFTP session, retrieving the file, and
-    closing the session.
+    from a remote path to a local path using SFTP. It checks that the pooled SFTP
+    session is used for the transfer and left open for reuse.
     """
     # Arrange
     remote_path = "remote/file/path"
     local_path = "local/file/path"
-    mock_ssh_client = MagicMock()
-    mock_sftp_client = MagicMock()
-    mock_get_instance.return_value.ssh_client = mock_ssh_client
-    mock_ssh_client.open_sftp.return_value = mock_sftp_client
+    mock_manager, mock_sftp_client = sftp_pair
 
     downloader = DownloadFile()
 
@@ -126,6 +375,124 @@ def test_download_file_success(mock_get_instance):
     downloader.execute(remote_path, local_path)
 
     # Assert
-    mock_ssh_client.open_sftp.assert_called_once()
-    mock_sftp_client.get.assert_called_once_with(remote_path, local_path)
-    mock_sftp_client.close.assert_called_once()
+    mock_manager.sftp.assert_called_once()
+    assert mock_sftp_client.mock_calls == [
+        call.get(remote_path, local_path, max_concurrent_prefetch_requests=SFTP_MAX_REQUESTS)
+    ]
+
+
+def test_sequential_downloads_reuse_one_sftp_session():
+    """
+    Test that consecutive downloads through a connected ConnectionManager reuse
+    one SFTP session instead of opening and closing one per file.
+    """
+    ConnectionManager.reset_instance()
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        mock_sftp_client = mock_ssh_client.open_sftp.return_value
+        mock_sftp_client.sock.closed = False
+        manager.connect("host", 22, "user", "pass", "")
+
+        DownloadFile().execute("remote/a", "local/a")
+        DownloadFile().execute("remote/b", "local/b")
+
+        mock_ssh_client.open_sftp.assert_called_once()
+        assert mock_sftp_client.get.call_count == 2
+        mock_sftp_client.close.assert_not_called()
+
+    ConnectionManager.reset_instance()
+
+
+@patch.object(UploadFile, "execute")
+def test_upload_files_transfers_every_pair(mock_upload_execute):
+    """
+    Test that UploadFiles uploads every (local, remote) pair through UploadFile.
+    """
+    pairs = [("local/a", "remote/a"), ("local/b", "remote/b"), ("local/c", "remote/c")]
+
+    UploadFiles().execute(pairs, max_workers=2)
+
+    assert sorted(call.args for call in mock_upload_execute.call_args_list) == pairs
+
+
+@patch.object(ConnectionManager, "get_instance")
+def test_upload_directory_streams_tar_archive(mock_get_instance, tmp_path):
+    """
+    Test that UploadDirectory streams a tar archive of the local directory into
+    a remote tar process over a single exec channel.
+    """
+    (tmp_path / "config.txt").write_text("setting=1")
+    written = []
+    mock_stdin = Mock()
+    mock_stdin.write.side_effect = written.append
+    mock_stdout = Mock()
+    mock_stdout.channel.recv_exit_status.return_value = 0
+    mock_ssh_client = mock_get_instance.return_value.acquire.return_value.__enter__.return_value
+    mock_ssh_client.exec_command.return_value = (mock_stdin, mock_stdout, Mock())
+
+    UploadDirectory().execute(str(tmp_path), "/home/pi/my dir")
+
+    mock_ssh_client.exec_command.assert_called_once_with(
+        "mkdir -p '/home/pi/my dir' && tar xf - -C '/home/pi/my dir'"
+    )
+    mock_stdin.close.assert_called_once()
+    with tarfile.open(fileobj=io.BytesIO(b"".join(written))) as archive:
+        assert "./config.txt" in archive.getnames()
+
+
+@patch.object(ConnectionManager, "get_instance")
+def test_upload_directory_reports_remote_tar_failure(mock_get_instance, tmp_path):
+    """
+    Test that a remote tar dying mid-stream raises IOError with its error output,
+    read and followed by closing the channel before the client goes back to the pool.
+    """
+    (tmp_path / "config.txt").write_text("setting=1")
+    events = Mock()
+    mock_stdin = Mock()
+    mock_stdin.write.side_effect = BrokenPipeError("Socket is closed")
+    mock_stdout = events.stdout
+    mock_stdout.channel.recv_exit_status.return_value = 2
+    mock_stderr = events.stderr
+    mock_stderr.read.return_value = b"tar: No space left on device\n"
+    mock_acquire = mock_get_instance.return_value.acquire.return_value
+    mock_acquire.__exit__ = events.release
+    mock_acquire.__exit__.return_value = False
+    mock_acquire.__enter__.return_value.exec_command.return_value = (
+        mock_stdin, mock_stdout, mock_stderr
+    )
+
+    with pytest.raises(IOError, match="No space left on device"):
+        UploadDirectory().execute(str(tmp_path), "/home/pi/backup")
+
+    assert [name for name, _, _ in events.mock_calls] == [
+        "stdout.channel.recv_exit_status",
+        "stderr.read",
+        "stdout.channel.close",
+        "release",
+    ]
+
+
+@patch.object(ConnectionManager, "get_instance")
+def test_download_directory_extracts_tar_archive(mock_get_instance, tmp_path):
+    """
+    Test that DownloadDirectory extracts the tar archive streamed from the remote
+    server into the local directory.
+    """
+    archive_buffer = io.BytesIO()
+    with tarfile.open(fileobj=archive_buffer, mode="w") as archive:
+        content = b"setting=1"
+        info = tarfile.TarInfo("./config.txt")
+        info.size = len(content)
+        archive.addfile(info, io.BytesIO(content))
+    archive_buffer.seek(0)
+    mock_stdout = Mock()
+    mock_stdout.read.side_effect = archive_buffer.read
+    mock_stdout.channel.recv_exit_status.return_value = 0
+    mock_ssh_client = mock_get_instance.return_value.acquire.return_value.__enter__.return_value
+    mock_ssh_client.exec_command.return_value = (Mock(), mock_stdout, Mock())
+
+    DownloadDirectory().execute("/home/pi/data", str(tmp_path / "data"))
+
+    mock_ssh_client.exec_command.assert_called_once_with("tar cf - -C /home/pi/data .")
+    assert (tmp_path / "data" / "config.txt").read_text() == "setting=1"
@@ -10,30 +10,57 @@ and executes the correct command string. This is achieved by using mock SSH conn
 asserting the called command.
 
 Test Data:
-    test_data: A list of tuples, each representing a command class, the expected command string, and 
-    any additional arguments required by the command class.
+    test_data: A tuple of pytest.param rows, each representing a command class, the expected
+    command string, and any additional arguments required by the command class.
 
 Functions:
     test_command_execute: Tests each SSH command class for correct command execution.
+    test_execute_remote_command_uses_shared_api_function: Tests that ExecuteRemoteCommand runs
+    through the shared API function instance.
+    test_batch_execute_command_uses_shared_api_function: Tests that BatchExecuteCommand runs
+    its commands through one call to the shared API function.
+    test_command_modules_import_ssh_stack_lazily: Tests that importing a command module
+    loads neither the API module nor paramiko.
+    test_commands_have_no_instance_dict: Tests that command instances are slotted.
+    test_shell_command_from_template_quotes_arguments: Tests that registry templates are
+    rendered with shell-quoted arguments.
 """
 
-from unittest.mock import Mock
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
 import pytest
+from commands.batch_execute_command import BatchExecuteCommand
+from commands.execute_remote_command import ExecuteRemoteCommand
 from commands.list_files_command import ListFilesCommand
 from commands.neofetch_command import NeofetchCommand
 from commands.remove_file_command import RemoveFileCommand
+from commands.shell_command import ShellCommand
 
 # Tuple format: (command_class, command_string, additional_args)
 # additional_args is a dictionary of extra arguments needed for the command
-test_data = [
-    (ListFilesCommand, "ls -l", {}),
-    (NeofetchCommand, "neofetch", {}),
-    (RemoveFileCommand, "rm testfile.txt", {"filename": "testfile.txt"}),
-]
+test_data = (
+    pytest.param(ListFilesCommand, "ls -l", {}, id="ls"),
+    pytest.param(NeofetchCommand, "neofetch", {}, id="neofetch"),
+    pytest.param(RemoveFileCommand, "rm testfile.txt", {"filename": "testfile.txt"}, id="rm"),
+    pytest.param(
+        RemoveFileCommand, "rm 'my notes.txt'", {"filename": "my notes.txt"}, id="rm-space"
+    ),
+    pytest.param(RemoveFileCommand, "rm '; reboot'", {"filename": "; reboot"}, id="rm-meta"),
+)
+
+
+@pytest.fixture
+def mock_ssh():
+    """
+    Provides a mock SSH connection for a single command test.
+    """
+    yield Mock()
 
 
 @pytest.mark.parametrize("command_class, command_string, additional_args", test_data)
-def test_command_execute(command_class, command_string, additional_args):
+def test_command_execute(mock_ssh, command_class, command_string, additional_args):
     """
     Parametrized test function to verify the execution of SSH command classes.
 
@@ -42,6 +69,7 @@ def test_command_execute(command_class, command_string, additional_args):
     string is passed to the SSH connection.
 
     Args:
+        mock_ssh (Mock): The mock SSH connection provided by the fixture.
         command_class (SSHCommand): The SSH command class to be tested.
         command_string (str): The expected SSH command string to be executed.
         additional_args (dict): A dictionary containing any additional arguments required for 
@@ -50,11 +78,102 @@ def test_command_execute(command_class, command_string, additional_args):
     The test is run for each set of parameters defined in the test_data list.
     """
     # Setup
-    mock_ssh_connection = Mock()
-    command = command_class(mock_ssh_connection, **additional_args)
+    command = command_class(mock_ssh, **additional_args)
 
     # Execute
     command.execute()
 
     # Assert
-    mock_ssh_connection.execute_command.assert_called_once_with(command_string)
+    mock_ssh.execute_command.assert_called_once_with(command_string)
+
+
+def test_execute_remote_command_uses_shared_api_function():
+    """
+    Test that ExecuteRemoteCommand passes its command line to the shared
+    ExecuteRemoteCommand API function and returns its output.
+    """
+    with patch("model.api.api_functions.EXECUTE_REMOTE_COMMAND") as mock_api_function:
+        mock_api_function.execute.return_value = "up 3 days"
+
+        result = ExecuteRemoteCommand("uptime").execute()
+
+    assert result == "up 3 days"
+    mock_api_function.execute.assert_called_once_with("uptime")
+
+
+def test_batch_execute_command_uses_shared_api_function():
+    """
+    Test that BatchExecuteCommand passes all of its command lines to the shared
+    BatchExecuteCommand API function in one call and returns its outputs.
+    """
+    with patch("model.api.api_functions.BATCH_EXECUTE_COMMAND") as mock_api_function:
+        mock_api_function.execute.return_value = ["up 3 days", "pi"]
+
+        result = BatchExecuteCommand(["uptime", "whoami"]).execute()
+
+    assert result == ["up 3 days", "pi"]
+    mock_api_function.execute.assert_called_once_with(["uptime", "whoami"])
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "commands.execute_remote_command",
+        "commands.batch_execute_command",
+        "commands.shell_command",
+        "commands.list_files_command",
+        "commands.neofetch_command",
+        "commands.remove_file_command",
+    ],
+)
+def test_command_modules_import_ssh_stack_lazily(module):
+    """
+    Test that importing a command module loads neither the API functions module nor
+    paramiko, which are only loaded when a command that needs them first executes.
+    """
+    probe = (
+        f"import sys, {module}; "
+        "print([name for name in ('model.api.api_functions', 'paramiko') "
+        "if name in sys.modules])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        ListFilesCommand(Mock()),
+        NeofetchCommand(Mock()),
+        RemoveFileCommand(Mock(), "testfile.txt"),
+        ShellCommand(Mock(), "uptime"),
+        ExecuteRemoteCommand("uptime"),
+        BatchExecuteCommand(["uptime"]),
+    ],
+)
+def test_commands_have_no_instance_dict(command):
+    """
+    Test that command instances store their attributes in slots rather than a __dict__.
+    """
+    assert not hasattr(command, "__dict__")
+
+
+def test_shell_command_from_template_quotes_arguments():
+    """
+    Test that ShellCommand.from_template() renders the registered template with
+    shell-quoted arguments and sends the precompiled command line on execute.
+    """
+    mock_ssh_connection = Mock()
+    command = ShellCommand.from_template(mock_ssh_connection, "rm", "my notes.txt")
+
+    command.execute()
+
+    assert command.render() == "rm 'my notes.txt'"
+    mock_ssh_connection.execute_command.assert_called_once_with("rm 'my notes.txt'")
@@ -0,0 +1,64 @@
+"""
+Test module for the configuration loader of the BerryFrame application.
+
+This module tests that load_config parses the INI configuration into plain dictionaries,
+converts the SSH port once, and serves repeated loads from its cache until the file changes.
+
+Functions:
+    test_load_config_parses_sections: Tests that sections are parsed into dicts.
+    test_load_config_defaults_port: Tests that a missing SSH port defaults to 22.
+    test_load_config_caches_until_modified: Tests that the file is only parsed again
+    once its modification time changes.
+"""
+
+import os
+
+from config_loader import DEFAULT_SSH_PORT, load_config
+
+CONFIG_TEXT = """[SSH]
+host = example.com
+port = 2222
+username = user
+"""
+
+
+def test_load_config_parses_sections(tmp_path):
+    """
+    Test that load_config returns each section as a dict with the SSH port as an int.
+    """
+    path = tmp_path / "config.ini"
+    path.write_text(CONFIG_TEXT)
+
+    config = load_config(str(path))
+
+    assert config == {"SSH": {"host": "example.com", "port": 2222, "username": "user"}}
+
+
+def test_load_config_defaults_port(tmp_path):
+    """
+    Test that load_config fills in DEFAULT_SSH_PORT when the SSH section has no port.
+    """
+    path = tmp_path / "config.ini"
+    path.write_text("[SSH]\nhost = example.com\n")
+
+    assert load_config(str(path))["SSH"]["port"] == DEFAULT_SSH_PORT
+
+
+def test_load_config_caches_until_modified(tmp_path):
+    """
+    Test that repeated loads return the cached object and that modifying the file
+    invalidates it.
+    """
+    path = tmp_path / "config.ini"
+    path.write_text(CONFIG_TEXT)
+
+    first = load_config(str(path))
+    assert load_config(str(path)) is first
+
+    path.write_text(CONFIG_TEXT.replace("2222", "22"))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = load_config(str(path))
+    assert reloaded is not first
+    assert reloaded["SSH"]["port"] == 22
@@ -1,20 +1,46 @@
 """
 This module contains unit tests for the ConnectionManager class.
 """
-from unittest.mock import patch, MagicMock
+import gc
+import socket
+import threading
+from unittest.mock import patch, Mock
 
 import paramiko
 import pytest
 
-from model.backend.connection_manager import ConnectionManager, Observer
+from model.backend import connection_manager
+from model.backend.connection_manager import (
+    BATCH_SEPARATOR,
+    BATCH_SEPARATOR_ESCAPE,
+    COMMAND_CACHE,
+    KEEPALIVE_INTERVAL,
+    ConnectionManager,
+    ConnectionPool,
+    Observer,
+)
+from model.backend.ssh2_client import Ssh2SSHClient
+
+
+@pytest.fixture(autouse=True, scope="module")
+def mock_ssh_client_class():
+    """
+    Pytest fixture patching paramiko.SSHClient once for the whole module.
+    """
+    with patch("paramiko.SSHClient") as mock_ssh:
+        yield mock_ssh
 
 
 @pytest.fixture(autouse=True)
-def reset_connection_manager():
+def reset_connection_manager(mock_ssh_client_class):
     """
-    Pytest fixture to reset ConnectionManager before each test.
+    Pytest fixture to reset ConnectionManager before and after each test.
+
+    Resetting before the test means it does not depend on another module's tests
+    having cleaned up the shared instance.
     """
     ConnectionManager.reset_instance()
+    mock_ssh_client_class.reset_mock()
     yield
     ConnectionManager.reset_instance()
 
@@ -29,19 +55,59 @@ def test_singleton_instance():
     assert manager1 is manager2
 
 
-def test_initialization():
+def test_module_instance_is_singleton():
+    """
+    Test that the module-level CONNECTION_MANAGER is the instance get_instance()
+    returns, including after the instance has been reset.
+    """
+    assert connection_manager.CONNECTION_MANAGER is ConnectionManager.get_instance()
+
+
+def test_reset_instance_resets_state_in_place():
+    """
+    Test that resetting keeps the same instance, so references imported before the
+    reset stay valid, while dropping its connection and observers.
+    """
+    manager = ConnectionManager.get_instance()
+    manager.attach(Mock(spec=Observer))
+    with patch.object(manager, "ssh_client", new_callable=Mock):
+        manager.connect("host", 22, "user", "pass", "")
+
+    ConnectionManager.reset_instance()
+
+    assert ConnectionManager.get_instance() is manager
+    assert not manager.is_connected()
+    assert manager.destination is None
+    assert not list(manager._observers)
+
+
+def test_initialization(mock_ssh_client_class):
     """
     Test the initialization of the ConnectionManager class.
     This test verifies that a Paramiko SSHClient is created
     when the ConnectionManager is initialized.
     """
-    with patch("paramiko.SSHClient") as mock_ssh:
-        _ = ConnectionManager.get_instance()
-        mock_ssh.assert_called_once()
+    ConnectionManager.reset_instance()
+    mock_ssh_client_class.assert_called_once()
+
+    # Check if AutoAddPolicy is used for the set_missing_host_key_policy method
+    calls = mock_ssh_client_class.return_value.set_missing_host_key_policy.mock_calls
+    _, args, _ = calls[0]
+    assert isinstance(args[0], paramiko.AutoAddPolicy)
 
-        # Check if AutoAddPolicy is used for the set_missing_host_key_policy method
-        _, args, _ = mock_ssh.return_value.set_missing_host_key_policy.mock_calls[0]
-        assert isinstance(args[0], paramiko.AutoAddPolicy)
+
+def test_clients_share_one_host_key_policy(mock_ssh_client_class):
+    """
+    Test that every SSH client the ConnectionManager creates gets the same
+    AutoAddPolicy instance rather than a new one each.
+    """
+    ConnectionManager.reset_instance()
+    ConnectionManager.get_instance()._create_ssh_client()
+
+    calls = mock_ssh_client_class.return_value.set_missing_host_key_policy.call_args_list
+    policies = [call.args[0] for call in calls]
+    assert len(policies) == 2
+    assert policies[0] is policies[1]
 
 
 def test_ssh_connection():
@@ -57,7 +123,7 @@ def test_ssh_connection():
 
     manager = ConnectionManager.get_instance()
 
-    with patch.object(manager, "ssh_client", new_callable=MagicMock) as mock_ssh_client:
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
         manager.connect(
             test_host, test_port, test_username, test_password, test_key_path
         )
@@ -68,9 +134,29 @@ def test_ssh_connection():
             username=test_username,
             password=test_password,
             key_filename=test_key_path,
+            compress=False,
+        )
+        mock_ssh_client.get_transport.return_value.set_keepalive.assert_called_once_with(
+            KEEPALIVE_INTERVAL
         )
 
 
+def test_connect_tunes_tcp_socket():
+    """
+    Test that connecting disables Nagle's algorithm and enables TCP keepalive on
+    the transport's socket.
+    """
+    manager = ConnectionManager.get_instance()
+    mock_sock = Mock(spec=socket.socket)
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        mock_ssh_client.get_transport.return_value.sock = mock_sock
+        manager.connect("host", 22, "user", "pass", "")
+
+    mock_sock.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    mock_sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
 def test_disconnect():
     """
     Test the disconnection process of the ConnectionManager.
@@ -78,7 +164,7 @@ def test_disconnect():
     """
     manager = ConnectionManager.get_instance()
 
-    with patch.object(manager, "ssh_client", new_callable=MagicMock) as mock_ssh_client:
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
         manager.disconnect()
         mock_ssh_client.close.assert_called_once()
 
@@ -86,41 +172,139 @@ def test_disconnect():
 def test_execute_command():
     """
     Test the execution of a command through the ConnectionManager.
-    This test ensures that the exec_command method of SSH client is called and
-    returns the expected output.
+    This test ensures that the command is run on a new channel and that its
+    output is read until end of stream and decoded.
     """
     command = "ls -l"
     expected_output = "mocked output"
 
     manager = ConnectionManager.get_instance()
 
-    with patch.object(manager, "ssh_client", new_callable=MagicMock) as mock_ssh_client:
-        mock_ssh_client.exec_command.return_value = (
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-        )
-        mock_stdout = mock_ssh_client.exec_command.return_value[1]
-        mock_stdout.read.return_value = expected_output.encode()
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        mock_channel = mock_ssh_client.get_transport.return_value.open_session.return_value
+        mock_channel.recv.side_effect = [b"mocked ", b"output", b""]
 
         output = manager.execute_command(command)
 
         assert output == expected_output
-        mock_ssh_client.exec_command.assert_called_with(command)
+        mock_channel.exec_command.assert_called_with(command)
+        mock_channel.close.assert_called_once()
+
+
+def test_execute_command_streams_decoded_chunks():
+    """
+    Test that stream=True yields the output chunk by chunk and keeps multi-byte
+    characters split across reads intact.
+    """
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        mock_channel = mock_ssh_client.get_transport.return_value.open_session.return_value
+        mock_channel.recv.side_effect = [b"temp: 42\xc2", b"\xb0C\n", b""]
+
+        chunks = list(manager.execute_command("vcgencmd measure_temp", stream=True))
+
+    assert chunks == ["temp: 42", "\u00b0C\n"]
+
+
+def test_second_command_opens_channel_without_reconnecting():
+    """
+    Test that a second command reuses the authenticated transport, opening a new
+    channel on it instead of connecting again, and that compression stays off by default.
+    """
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        transport = mock_ssh_client.get_transport.return_value
+        transport.open_session.return_value.recv.return_value = b""
+        manager.connect("host", 22, "user", "pass", "")
+
+        manager.execute_command("uptime")
+        manager.execute_command("hostname")
+
+        mock_ssh_client.connect.assert_called_once()
+        assert mock_ssh_client.connect.call_args.kwargs["compress"] is False
+        assert transport.open_session.call_count == 2
+
+
+def test_execute_commands_multiplexes_channels_on_one_connection():
+    """
+    Test that execute_commands runs each command on its own channel of the same
+    transport, without connecting again, and returns the outputs in order.
+    """
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        manager.connect("host", 22, "user", "pass", "")
+        remote_outputs = {"uptime": b"up 3 days\n", "hostname": b"raspberrypi\n"}
+
+        def open_session():
+            channel = Mock()
+
+            def exec_command(command):
+                channel.recv.side_effect = [remote_outputs[command], b""]
+
+            channel.exec_command.side_effect = exec_command
+            return channel
+
+        transport = mock_ssh_client.get_transport.return_value
+        transport.open_session.side_effect = open_session
+        with patch.object(ConnectionPool, "_grow") as mock_grow:
+            outputs = manager.execute_commands(["uptime", "hostname"])
+
+        assert outputs == ["up 3 days\n", "raspberrypi\n"]
+        assert transport.open_session.call_count == 2
+        mock_ssh_client.connect.assert_called_once()
+        mock_grow.assert_not_called()
+
+
+def test_execute_command_bytes_returns_undecoded_output():
+    """
+    Test that execute_command_bytes returns the channel output as bytes, without
+    decoding or replacing invalid UTF-8 sequences.
+    """
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        mock_channel = mock_ssh_client.get_transport.return_value.open_session.return_value
+        mock_channel.recv.side_effect = [b"\x89PNG", b"\xff\x00", b""]
+
+        output = manager.execute_command_bytes("cat logo.png")
+
+    assert output == b"\x89PNG\xff\x00"
+
+
+def test_execute_command_text_false_skips_decoding():
+    """
+    Test that execute_command with text=False returns and streams the channel
+    output as bytes.
+    """
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        mock_channel = mock_ssh_client.get_transport.return_value.open_session.return_value
+        mock_channel.recv.side_effect = [b"\xff", b"\x00", b"", b"\xff", b"\x00", b""]
+
+        output = manager.execute_command("cat blob", text=False)
+        chunks = list(manager.execute_command("cat blob", stream=True, text=False))
+
+    assert output == b"\xff\x00"
+    assert chunks == [b"\xff", b"\x00"]
 
 
 def test_observer_notification_on_connect():
     """
     Test that observers are notified with the correct status when a connection is established.
     """
-    observer_mock = MagicMock(spec=Observer)
+    observer_mock = Mock(spec=Observer)
     manager = ConnectionManager.get_instance()
     manager.attach(observer_mock)
 
-    with patch.object(manager, "ssh_client", new_callable=MagicMock) as mock_ssh_client:
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
         mock_ssh_client.connect.return_value = None
         manager.connect("host", 22, "user", "pass", "")
 
+        manager.flush_notifications()
         observer_mock.update.assert_called_once_with("Connected")
 
 
@@ -128,15 +312,408 @@ def test_observer_notification_on_disconnect():
     """
     Test that observers are notified of the correct status when a connection is terminated.
     """
-    observer_mock = MagicMock(spec=Observer)
+    observer_mock = Mock(spec=Observer)
     manager = ConnectionManager.get_instance()
     manager.attach(observer_mock)
 
-    with patch.object(manager, "ssh_client", new_callable=MagicMock) as mock_ssh_client:
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
         mock_ssh_client.connect.return_value = None
         manager.connect("host", 22, "user", "pass", "")
 
         mock_ssh_client.close.return_value = None
         manager.disconnect()
 
+        manager.flush_notifications()
         observer_mock.update.assert_called_with("Disconnected")
+
+
+def test_attaching_observer_twice_notifies_once():
+    """
+    Test that attaching the same observer twice does not deliver each status twice.
+    """
+    observer_mock = Mock(spec=Observer)
+    manager = ConnectionManager.get_instance()
+    manager.attach(observer_mock)
+    manager.attach(observer_mock)
+
+    manager.notify("Connected")
+    manager.flush_notifications()
+
+    observer_mock.update.assert_called_once_with("Connected")
+
+
+def test_notify_does_not_wait_for_slow_observers():
+    """
+    Test that notify() returns before observers run, and that every status queued
+    in the meantime is delivered in order, including repeated ones.
+    """
+    release = threading.Event()
+    received = []
+
+    class SlowObserver(Observer):
+        """
+        An observer that blocks until released.
+        """
+
+        def update(self, status):
+            release.wait(timeout=5)
+            received.append(status)
+
+    manager = ConnectionManager.get_instance()
+    observer = SlowObserver()
+    manager.attach(observer)
+
+    manager.notify("Connected")
+    manager.notify("Connected")
+    manager.notify("Disconnected")
+    assert not received
+
+    release.set()
+    manager.flush_notifications()
+    assert received == ["Connected", "Connected", "Disconnected"]
+
+
+def test_exit_hook_delivers_queued_statuses():
+    """
+    Test that the exit hook delivers the statuses still queued after disconnect(),
+    and that resetting the instance stops its dispatcher thread.
+    """
+    observer_mock = Mock(spec=Observer)
+    manager = ConnectionManager.get_instance()
+    manager.attach(observer_mock)
+
+    with patch.object(manager, "ssh_client", new_callable=Mock), \
+            patch.object(manager, "flush_notifications", wraps=manager.flush_notifications) \
+            as mock_flush:
+        manager.connect("host", 22, "user", "pass", "")
+        manager.disconnect()
+        mock_flush.assert_not_called()
+
+        connection_manager._close_all()
+        mock_flush.assert_called_once()
+
+    assert observer_mock.update.call_args_list == [(("Connected",),), (("Disconnected",),)]
+    dispatcher = manager._notify_thread
+    ConnectionManager.reset_instance()
+    assert not dispatcher.is_alive()
+
+
+def test_failing_observer_is_logged_and_others_notified(caplog):
+    """
+    Test that an exception raised by one observer is logged and does not stop
+    delivery to the other observers.
+    """
+    failing = Mock(spec=Observer)
+    failing.update.side_effect = RuntimeError("boom")
+    healthy = Mock(spec=Observer)
+    manager = ConnectionManager.get_instance()
+    manager.attach(failing)
+    manager.attach(healthy)
+
+    manager.notify("Connected")
+    manager.flush_notifications()
+
+    healthy.update.assert_called_once_with("Connected")
+    assert "failed to handle status 'Connected'" in caplog.text
+    assert "RuntimeError: boom" in caplog.text
+
+
+def test_observers_are_held_weakly():
+    """
+    Test that an observer is dropped once nothing else references it, and that
+    detaching an unknown observer is harmless.
+    """
+    received = []
+
+    class RecordingObserver(Observer):
+        """
+        An observer that records the statuses it receives.
+        """
+
+        def __init__(self, name):
+            self.name = name
+
+        def update(self, status):
+            received.append((self.name, status))
+
+    manager = ConnectionManager.get_instance()
+    kept = RecordingObserver("kept")
+    dropped = RecordingObserver("dropped")
+    manager.attach(kept)
+    manager.attach(dropped)
+    manager.detach(RecordingObserver("unknown"))
+
+    del dropped
+    gc.collect()
+    manager.notify("Connected")
+    manager.flush_notifications()
+
+    assert received == [("kept", "Connected")]
+
+
+def test_acquire_reuses_connected_client():
+    """
+    Test that sequential operations reuse the primary client from the pool
+    instead of opening new connections.
+    """
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        manager.connect("host", 22, "user", "pass", "")
+
+        with patch.object(ConnectionPool, "_grow") as mock_grow:
+            with manager.acquire() as first:
+                pass
+            with manager.acquire() as second:
+                pass
+
+            mock_grow.assert_not_called()
+        assert first is mock_ssh_client
+        assert second is mock_ssh_client
+
+
+def test_acquire_grows_pool_for_concurrent_checkouts():
+    """
+    Test that concurrent checkouts get separate clients and that disconnecting
+    closes every pooled client.
+    """
+    manager = ConnectionManager.get_instance()
+    extra_client = Mock()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        manager.connect("host", 22, "user", "pass", "")
+
+        with patch.object(ConnectionPool, "_grow", return_value=extra_client):
+            with manager.acquire() as first, manager.acquire() as second:
+                assert first is mock_ssh_client
+                assert second is extra_client
+
+        manager.disconnect()
+
+    extra_client.close.assert_called_once()
+
+
+def test_discarding_client_wakes_waiting_checkout():
+    """
+    Test that a checkout waiting on a full pool grows the pool once the client in
+    use is discarded, instead of waiting forever for it to come back.
+    """
+    dead_client = Mock()
+    fresh_client = Mock()
+    pool = ConnectionPool(dead_client, ("host", 22, "user", "pass", ""), 1, Mock)
+    assert pool.checkout() is dead_client
+    checked_out = []
+
+    with patch.object(ConnectionPool, "_grow", return_value=fresh_client):
+        waiter = threading.Thread(target=lambda: checked_out.append(pool.checkout()))
+        waiter.start()
+        pool.discard(dead_client)
+        waiter.join(timeout=5)
+
+    assert checked_out == [fresh_client]
+    dead_client.close.assert_called_once()
+
+
+def test_execute_many_runs_commands_on_one_channel():
+    """
+    Test that execute_many runs every command in one script on a single channel
+    and splits the output at the separators.
+    """
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        mock_transport = mock_ssh_client.get_transport.return_value
+        mock_channel = mock_transport.open_session.return_value
+        mock_channel.recv.side_effect = [
+            f"a\n{BATCH_SEPARATOR}b\n{BATCH_SEPARATOR}c\n".encode(),
+            b"",
+        ]
+
+        outputs = manager.execute_many(["echo a", "echo b", "echo c"])
+
+    mock_transport.open_session.assert_called_once()
+    mock_channel.exec_command.assert_called_once_with(
+        f"echo a\nprintf '{BATCH_SEPARATOR_ESCAPE}'\n"
+        f"echo b\nprintf '{BATCH_SEPARATOR_ESCAPE}'\necho c"
+    )
+    assert outputs == ["a\n", "b\n", "c\n"]
+
+
+def test_execute_many_rejects_output_it_cannot_split():
+    """
+    Test that execute_many raises instead of attributing one command's output to
+    every command when the separators are missing.
+    """
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        mock_channel = mock_ssh_client.get_transport.return_value.open_session.return_value
+        mock_channel.recv.side_effect = [b"a\n", b""]
+
+        with pytest.raises(paramiko.SSHException, match="2 batched commands, got 1"):
+            manager.execute_many(["echo a; exit", "echo b"])
+
+
+def test_execute_parallel_runs_on_each_destination_pool():
+    """
+    Test that execute_parallel runs each command on its own destination's pooled
+    client and rejects destinations that were never connected.
+    """
+    manager = ConnectionManager.get_instance()
+    other_client = Mock()
+    other_client.get_transport.return_value.open_session.return_value.recv.side_effect = [
+        b"beta", b""
+    ]
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        mock_ssh_client.get_transport.return_value.open_session.return_value.recv.side_effect = [
+            b"alpha", b""
+        ]
+        manager.connect("alpha", 22, "user", "pass", "")
+        with patch.object(manager, "_create_ssh_client", return_value=other_client):
+            manager.connect("beta", 22, "user", "pass", "")
+
+        outputs = manager.execute_parallel(
+            [(("alpha", 22, "user"), "hostname"), (("beta", 22, "user"), "hostname")]
+        )
+
+        assert outputs == ["alpha", "beta"]
+        with pytest.raises(paramiko.SSHException, match="gamma"):
+            manager.execute_parallel([(("gamma", 22, "user"), "hostname")])
+
+
+def test_connect_and_close_all_clear_command_cache():
+    """
+    Test that connecting and closing the connections drop cached command output,
+    and that destination reports the current connection.
+    """
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock):
+        assert manager.destination is None
+        COMMAND_CACHE.set((None, "uptime"), "stale")
+        manager.connect("host", 22, "user", "pass", "")
+        assert manager.destination == ("host", 22, "user")
+        assert COMMAND_CACHE.get((None, "uptime")) is None
+
+        COMMAND_CACHE.set((manager.destination, "uptime"), "up 3 days")
+        manager.close_all()
+        assert COMMAND_CACHE.get((("host", 22, "user"), "uptime")) is None
+
+
+def test_is_connected_follows_connect_and_disconnect():
+    """
+    Test that is_connected() reports the state recorded by connect() and disconnect()
+    without inspecting the transport.
+    """
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        assert not manager.is_connected()
+        manager.connect("host", 22, "user", "pass", "")
+        mock_ssh_client.get_transport.reset_mock()
+
+        assert manager.is_connected()
+        mock_ssh_client.get_transport.assert_not_called()
+
+        manager.disconnect()
+        assert not manager.is_connected()
+
+
+def test_close_all_closes_pools_on_exit():
+    """
+    Test that the exit hook closes every pooled client of the current instance
+    without notifying observers.
+    """
+    manager = ConnectionManager.get_instance()
+    observer = Mock(spec=Observer)
+    manager.attach(observer)
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        manager.connect("host", 22, "user", "pass", "")
+        manager.flush_notifications()
+        observer.update.reset_mock()
+
+        connection_manager._close_all()
+        manager.flush_notifications()
+
+        mock_ssh_client.close.assert_called_once()
+        assert manager._pool is None
+    observer.update.assert_not_called()
+
+
+def test_connect_reuses_authenticated_pool_per_destination():
+    """
+    Test that connecting again to a destination with an active pool reuses its
+    authenticated client instead of authenticating again.
+    """
+    manager = ConnectionManager.get_instance()
+    other_client = Mock()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        manager.connect("host", 22, "user", "pass", "")
+
+        with patch.object(manager, "_create_ssh_client", return_value=other_client):
+            manager.connect("other_host", 22, "user", "pass", "")
+            assert manager.ssh_client is other_client
+
+            manager.connect("host", 22, "user", "pass", "")
+            assert manager.ssh_client is mock_ssh_client
+
+        mock_ssh_client.connect.assert_called_once()
+        other_client.connect.assert_called_once()
+
+        manager.disconnect()
+        mock_ssh_client.close.assert_called_once()
+        other_client.close.assert_called_once()
+
+
+def test_sftp_session_is_reused_until_disconnect():
+    """
+    Test that the SFTP session of a pooled client is opened once, reused across
+    transfers and closed on disconnect.
+    """
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        mock_sftp_client = mock_ssh_client.open_sftp.return_value
+        mock_sftp_client.sock.closed = False
+        manager.connect("host", 22, "user", "pass", "")
+
+        with manager.sftp() as first:
+            pass
+        with manager.sftp() as second:
+            pass
+
+        assert first is second is mock_sftp_client
+        mock_ssh_client.open_sftp.assert_called_once()
+
+        manager.disconnect()
+        mock_sftp_client.close.assert_called_once()
+
+
+def test_compression_enabled_from_environment(monkeypatch):
+    """
+    Test that setting BF_SSH_COMPRESS makes connections negotiate compression.
+    """
+    monkeypatch.setenv("BF_SSH_COMPRESS", "1")
+    ConnectionManager.reset_instance()
+    manager = ConnectionManager.get_instance()
+
+    with patch.object(manager, "ssh_client", new_callable=Mock) as mock_ssh_client:
+        manager.connect("host", 22, "user", "pass", "")
+
+        assert mock_ssh_client.connect.call_args.kwargs["compress"] is True
+
+
+def test_ssh2_backend_selected_from_environment(monkeypatch):
+    """
+    Test that setting BF_SSH_BACKEND to "ssh2" makes the ConnectionManager use
+    the libssh2-based client.
+    """
+    monkeypatch.setenv("BF_SSH_BACKEND", "ssh2")
+
+    ConnectionManager.reset_instance()
+    manager = ConnectionManager.get_instance()
+
+    assert isinstance(manager.ssh_client, Ssh2SSHClient)
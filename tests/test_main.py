@@ -7,14 +7,65 @@ mocking external dependencies and user inputs to ensure that each function
 behaves as expected under different scenarios.
 """
 
-from unittest.mock import Mock, patch, ANY, MagicMock
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import DEFAULT, Mock, patch, ANY
 import pytest
-import main
 
+# Parsed configuration returned by the patched load_config in the main() tests
+SSH_CONFIG = {
+    "SSH": {
+        "host": "example.com",
+        "port": 22,
+        "username": "user",
+        "password": "pass",
+        "key_path": "/path/to/key",
+    }
+}
 
 
-@patch("main.console")
-def test_main_menu(mock_console):
+@pytest.fixture(scope="session")
+def main_mod():
+    """
+    Imports the main module on first use, so collecting this file does not.
+    """
+    import main
+
+    return main
+
+
+@pytest.fixture(autouse=True, scope="module")
+def mock_console(main_mod):
+    """
+    Patches the console of the main module once for every test in this module.
+    """
+    with patch("main.console") as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def _reset_console(mock_console):
+    """
+    Clears the calls recorded on the shared console mock before each test.
+    """
+    mock_console.reset_mock()
+
+
+@pytest.fixture
+def mock_check_ssh():
+    """
+    Patches check_ssh_connection to report an active connection.
+
+    Kept function-scoped and opt-in because the real check_ssh_connection is
+    exercised by its own test.
+    """
+    with patch("main.check_ssh_connection", return_value=True) as mock:
+        yield mock
+
+
+def test_main_menu(main_mod, mock_console):
     """
     Tests the main_menu function of the SSH Management System.
 
@@ -22,12 +73,13 @@ def test_main_menu(mock_console):
     print method on the console object, ensuring that the menu is
     displayed to the user.
     """
-    main.main_menu()
-    mock_console.print.assert_called()  # Check if print is called
+    main_mod.main_menu()
+    main_mod.main_menu()
+    mock_console.print.assert_called_with(main_mod.MENU_TABLE)  # The prebuilt menu is reused
+    assert mock_console.print.call_count == 2
 
 
-@patch("main.console")
-def test_connect_ssh(mock_console):
+def test_connect_ssh(main_mod, mock_console):
     """
     Tests the connect_ssh function of the SSH Management System.
 
@@ -36,17 +88,12 @@ def test_connect_ssh(mock_console):
     messages are displayed during the connection process.
     """
     mock_controller = Mock()
-    main.connect_ssh(mock_controller)
+    main_mod.connect_ssh(mock_controller)
     mock_controller.connect.assert_called_once()
     mock_console.print.assert_called()  # Check if print is called with the right arguments
 
 
-@patch("main.Prompt")
-@patch("main.connect_ssh")
-@patch("main.console")
-def test_check_ssh_connection_when_disconnected(
-    mock_console, mock_connect_ssh, mock_prompt
-):
+def test_check_ssh_connection_when_disconnected(main_mod, mock_console):
     """
     Tests the check_ssh_connection function when the SSH connection is initially disconnected.
 
@@ -56,16 +103,17 @@ def test_check_ssh_connection_when_disconnected(
     """
     mock_controller = Mock()
     mock_controller.is_connected.return_value = False
-    mock_prompt.ask.return_value = "yes"
 
-    assert main.check_ssh_connection(mock_controller) is True
-    mock_connect_ssh.assert_called_once_with(mock_controller)
+    with patch.multiple("main", Prompt=DEFAULT, connect_ssh=DEFAULT) as mocks:
+        mocks["Prompt"].ask.return_value = "yes"
+        assert main_mod.check_ssh_connection(mock_controller) is True
+
+    mocks["connect_ssh"].assert_called_once_with(mock_controller)
     mock_console.print.assert_called()  # Check if print is called with the right arguments
 
 
-@patch("main.check_ssh_connection", return_value=True)
-@patch("main.console")
-def test_execute_remote_command(mock_console, mock_check_ssh):
+@pytest.mark.usefixtures("mock_check_ssh")
+def test_execute_remote_command(main_mod, mock_console):
     """
     Tests the execute_remote_command function of the SSH Management System.
 
@@ -76,13 +124,12 @@ def test_execute_remote_command(mock_console, mock_check_ssh):
     mock_invoker = Mock()
     command = "ls"
 
-    main.execute_remote_command(mock_controller, mock_invoker, command)
+    main_mod.execute_remote_command(mock_controller, mock_invoker, command)
     mock_invoker.execute_command.assert_called_once()
     mock_console.print.assert_called()  # Check if print is called with the right arguments
 
 
-@patch("main.console")
-def test_disconnect_ssh(mock_console):
+def test_disconnect_ssh(main_mod, mock_console):
     """
     Tests the disconnect_ssh function of the SSH Management System.
 
@@ -90,14 +137,13 @@ def test_disconnect_ssh(mock_console):
     and that appropriate status messages are displayed during the disconnection process.
     """
     mock_controller = Mock()
-    main.disconnect_ssh(mock_controller)
+    main_mod.disconnect_ssh(mock_controller)
     mock_controller.disconnect.assert_called_once()
     mock_console.print.assert_called()  # Check if print is called with the right arguments
 
 
-@patch("main.check_ssh_connection", return_value=True)
-@patch("main.console")
-def test_execute_neofetch_command(mock_console, mock_check_ssh):
+@pytest.mark.usefixtures("mock_check_ssh")
+def test_execute_neofetch_command(main_mod, mock_console):
     """
     Tests the execute_neofetch_command function of the SSH Management System.
 
@@ -108,14 +154,13 @@ def test_execute_neofetch_command(mock_console, mock_check_ssh):
     mock_controller = Mock()
     mock_invoker = Mock()
 
-    main.execute_neofetch_command(mock_controller, mock_invoker)
+    main_mod.execute_neofetch_command(mock_controller, mock_invoker)
     mock_invoker.execute_command.assert_called_once_with(ANY)
     mock_console.print.assert_called()  # Check if print is called with the right arguments
 
 
-@patch("main.check_ssh_connection", return_value=True)
-@patch("main.console")
-def test_execute_list_files_command(mock_console, mock_check_ssh):
+@pytest.mark.usefixtures("mock_check_ssh")
+def test_execute_list_files_command(main_mod, mock_console):
     """
     Tests the execute_list_files_command function of the SSH Management System.
 
@@ -125,93 +170,85 @@ def test_execute_list_files_command(mock_console, mock_check_ssh):
     mock_controller = Mock()
     mock_invoker = Mock()
 
-    main.execute_list_files_command(mock_controller, mock_invoker)
+    main_mod.execute_list_files_command(mock_controller, mock_invoker)
     mock_invoker.execute_command.assert_called_once_with(ANY)
     mock_console.print.assert_called()  # Check if print is called with the right arguments
 
 
-class MockConfigSection:
+def test_main_loads_ssh_config_and_exits(main_mod, mock_console):
     """
-    A mock configuration section that provides methods to retrieve values from a 
-    dictionary-like data structure.
-
-    Args:
-        data (dict): The dictionary-like data structure containing the configuration values.
-
-    Methods:
-        get(key, default=None): Retrieves the value associated with the given key from the 
-        data structure. If the key is not found, returns the default value.
-        getint(key, default=None): Retrieves the value associated with the given key 
-        from the data structure and converts it to an integer. If the key is not found, 
-        returns the default value.
-
+    Tests if the main function correctly loads the SSH configuration from a file
+    and exits the loop upon user's choice.
     """
+    # Patch the config loader and 'input', which returns '6' to exit the loop
+    with patch.multiple("main", load_config=DEFAULT, SSHController=DEFAULT) as mocks:
+        mocks["load_config"].return_value = SSH_CONFIG
+        with patch("builtins.input", return_value="6"):
+            with pytest.raises(SystemExit):
+                main_mod.main()
 
-    def __init__(self, data):
-        self.data = data
-
-    def get(self, key, default=None):
-        """
-        Retrieve the value associated with the given key from the data dictionary.
+    # Assertions
+    mocks["load_config"].assert_called_once_with()
+    mocks["SSHController"].assert_called_once_with(
+        "example.com", 22, "user", "pass", "/path/to/key"
+    )
+    mock_console.print.assert_called()  # Check if print is called with the right arguments
 
-        Args:
-            key (hashable): The key to retrieve the value for.
-            default: The value to return if the key is not found (default: None).
 
-        Returns:
-            The value associated with the key, or the default value if the key is not found.
-        """
-        return self.data.get(key, default)
+def test_main_rejects_invalid_choice(main_mod, mock_console):
+    """
+    Tests that the main loop reports a choice outside the menu and asks again.
+    """
+    with patch.multiple("main", load_config=DEFAULT, SSHController=DEFAULT) as mocks:
+        mocks["load_config"].return_value = SSH_CONFIG
+        mocks["SSHController"].return_value.is_connected.return_value = False
+        with patch("builtins.input", side_effect=["9", "6"]) as mock_input:
+            with pytest.raises(SystemExit):
+                main_mod.main()
 
-    def getint(self, key, default=None):
-        """
-        Get the value associated with the given key as an integer.
+    assert mock_input.call_count == 2
+    mock_console.print.assert_any_call(main_mod.MSG_INVALID_CHOICE)
 
-        If the key is not found, return the default value.
 
-        Args:
-            key (str): The key to look up in the data dictionary.
-            default (int, optional): The default value to return if the key is not found. 
-            Defaults to None.
+def test_main_dispatches_menu_choices(main_mod):
+    """
+    Tests that each menu choice runs its action and that exiting disconnects an
+    active connection first.
+    """
+    with patch.multiple(
+        "main",
+        load_config=DEFAULT,
+        SSHController=DEFAULT,
+        connect_ssh=DEFAULT,
+        disconnect_ssh=DEFAULT,
+    ) as mocks:
+        mocks["load_config"].return_value = SSH_CONFIG
+        controller = mocks["SSHController"].return_value
+        controller.is_connected.return_value = True
+        with patch("builtins.input", side_effect=["", "5", "6"]):
+            with pytest.raises(SystemExit):
+                main_mod.main()
 
-        Returns:
-            int: The value associated with the key as an integer, or the default value 
-            if the key is not found.
-        """
-        return int(self.data.get(key, default))
+    mocks["connect_ssh"].assert_called_once_with(controller)
+    assert mocks["disconnect_ssh"].call_count == 2
 
 
-@patch("main.configparser.ConfigParser")
-@patch("main.SSHController")
-@patch("main.console")
-def test_main_loads_ssh_config_and_exits(
-    mock_console, mock_ssh_controller, mock_configparser
-):
+def test_importing_main_does_not_read_config(tmp_path):
     """
-    Tests if the main function correctly loads the SSH configuration from a file
-    and exits the loop upon user's choice.
+    Tests that importing the main module does not parse the configuration file,
+    which is only loaded when main() runs.
     """
-    # Setup the mock for configparser
-    mock_config = MagicMock()
-    ssh_section_data = {
-        "host": "example.com",
-        "port": "22",
-        "username": "user",
-        "password": "pass",
-        "key_path": "/path/to/key",
-    }
-    ssh_section_mock = MockConfigSection(ssh_section_data)
-    mock_config.__getitem__.return_value = ssh_section_mock
-    mock_configparser.return_value = mock_config
-
-    # Patch 'main.Prompt.ask' to return '6' to exit the loop
-    with patch("main.Prompt.ask", return_value="6"):
-        with pytest.raises(SystemExit):
-            main.main()
-
-    # Assertions
-    mock_configparser.return_value.read.assert_called_once_with("config.ini")
-    mock_ssh_controller.assert_called_once_with(
-        "example.com", 22, "user", "pass", "/path/to/key"
+    probe = (
+        "import main, config_loader; "
+        "print(config_loader._parse_config.cache_info().misses)"
     )
-    mock_console.print.assert_called()  # Check if print is called with the right arguments
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert output.strip() == "0"
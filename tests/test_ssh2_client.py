@@ -0,0 +1,145 @@
+"""
+This module contains unit tests for the ssh2-python based SSH client.
+
+The ssh2 Session is mocked, so the tests verify how the client drives libssh2
+without opening network connections. ssh2-python is an optional dependency of
+the application but part of the test dependencies; the tests are skipped when
+it is not installed.
+"""
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from paramiko import AuthenticationException, SSHException
+
+from model.backend.ssh2_client import SFTP_WRITE_SIZE, Ssh2SSHClient
+
+ssh2_exceptions = pytest.importorskip("ssh2.exceptions")
+
+
+@pytest.fixture
+def mock_session():
+    """
+    Provides a mock ssh2 Session and patches out the TCP connection.
+    """
+    with patch("socket.create_connection"), patch("ssh2.session.Session") as mock:
+        yield mock.return_value
+
+
+def test_connect_authenticates_with_password(mock_session):
+    """
+    Test that connecting performs the SSH handshake and password authentication.
+    """
+    client = Ssh2SSHClient()
+
+    client.connect("host", 22, username="pi", password="raspberry")
+
+    mock_session.handshake.assert_called_once()
+    mock_session.userauth_password.assert_called_once_with("pi", "raspberry")
+    assert client.get_transport().is_active()
+
+
+def test_connect_translates_authentication_errors(mock_session):
+    """
+    Test that ssh2 authentication errors surface as paramiko exceptions.
+    """
+    mock_session.userauth_password.side_effect = ssh2_exceptions.AuthenticationError()
+    client = Ssh2SSHClient()
+
+    with pytest.raises(AuthenticationException):
+        client.connect("host", 22, username="pi", password="wrong")
+    assert client.get_transport() is None
+
+
+def test_exec_command_reads_stdout(mock_session):
+    """
+    Test that exec_command runs the command on a new channel and that its stdout
+    can be read until the end of the stream.
+    """
+    mock_channel = MagicMock()
+    mock_channel.read.side_effect = [(6, b"total "), (2, b"0\n"), (0, b"")]
+    mock_session.open_session.return_value = mock_channel
+    client = Ssh2SSHClient()
+    client.connect("host", 22, username="pi", password="raspberry")
+
+    _, stdout, _ = client.exec_command("ls -l")
+
+    mock_channel.execute.assert_called_once_with("ls -l")
+    assert stdout.read() == b"total 0\n"
+
+
+def test_sftp_put_writes_large_blocks(mock_session, tmp_path):
+    """
+    Test that uploads hand libssh2 SFTP_WRITE_SIZE blocks so it can pipeline
+    the write requests.
+    """
+    local_file = tmp_path / "image.bin"
+    local_file.write_bytes(b"\0" * (SFTP_WRITE_SIZE * 2 + 1))
+    mock_remote_file = mock_session.sftp_init.return_value.open.return_value
+    client = Ssh2SSHClient()
+    client.connect("host", 22, username="pi", password="raspberry")
+
+    client.open_sftp().put(str(local_file), "/tmp/image.bin")
+
+    sizes = [len(call.args[0]) for call in mock_remote_file.write.call_args_list]
+    assert sizes == [SFTP_WRITE_SIZE, SFTP_WRITE_SIZE, 1]
+
+
+def test_open_session_sends_due_keepalive(mock_session):
+    """
+    Test that the keepalive interval is configured on the session and that a due
+    keepalive is sent before a new channel is opened.
+    """
+    client = Ssh2SSHClient()
+    client.connect("host", 22, username="pi", password="raspberry")
+    transport = client.get_transport()
+
+    transport.set_keepalive(30)
+    transport.open_session()
+
+    mock_session.keepalive_config.assert_called_once_with(False, 30)
+    assert mock_session.mock_calls[-2:] == [call.keepalive_send(), call.open_session()]
+
+
+def test_connect_falls_back_to_password(mock_session):
+    """
+    Test that a rejected key file is followed by password authentication.
+    """
+    mock_session.userauth_publickey_fromfile.side_effect = ssh2_exceptions.AuthenticationError()
+    client = Ssh2SSHClient()
+
+    client.connect("host", 22, username="pi", password="raspberry", key_filename="id_rsa")
+
+    mock_session.userauth_publickey_fromfile.assert_called_once_with("pi", "id_rsa")
+    mock_session.userauth_password.assert_called_once_with("pi", "raspberry")
+
+
+def test_connect_without_credentials_raises(mock_session):
+    """
+    Test that connecting with neither a key file nor a password fails before
+    contacting the server.
+    """
+    client = Ssh2SSHClient()
+
+    with pytest.raises(AuthenticationException, match="No private key file or password"):
+        client.connect("host", 22, username="pi")
+
+    mock_session.handshake.assert_not_called()
+
+
+def test_dropped_session_is_not_active(mock_session):
+    """
+    Test that a socket error from libssh2 drops the session, so the transport is
+    no longer active and the SFTP channel reports itself closed.
+    """
+    client = Ssh2SSHClient()
+    client.connect("host", 22, username="pi", password="raspberry")
+    transport = client.get_transport()
+    sftp_client = client.open_sftp()
+    mock_session.open_session.side_effect = ssh2_exceptions.SocketDisconnectError()
+
+    with pytest.raises(SSHException):
+        transport.open_session()
+
+    assert not transport.is_active()
+    assert client.get_transport() is None
+    assert sftp_client.sock.closed
@@ -9,13 +9,29 @@ Functions:
     test_execute_command: Verifies that the SSHCommandInvoker correctly executes a command and 
     records it in history. 
     test_show_history: Tests the functionality of the SSHCommandInvoker's show_history method.
+    test_commands_share_one_authenticated_connection: Verifies that consecutive commands reuse
+    the ConnectionManager's pooled connection.
+    test_execute_batch: Verifies that several commands run in one remote invocation.
+    test_execute_many: Verifies that independent commands run concurrently.
+    test_history_is_bounded: Verifies that the history keeps only recent, truncated results.
+    test_show_history_writes_to_file: Verifies that show_history writes to a given stream.
+    test_iter_history_yields_entries: Verifies that iter_history yields the recorded pairs.
 """
 
-from unittest.mock import create_autospec
-from commands.ssh_command import SSHCommand
-from controllers.command_invoker import SSHCommandInvoker
-
-def test_execute_command():
+import io
+import threading
+from unittest.mock import MagicMock, patch
+from commands.list_files_command import ListFilesCommand
+from commands.neofetch_command import NeofetchCommand
+from controllers.command_invoker import (
+    HISTORY_RESULT_PREVIEW,
+    HISTORY_SIZE,
+    SSHCommandInvoker,
+)
+from controllers.ssh_controller import SSHController
+from model.backend.connection_manager import ConnectionManager, ConnectionPool
+
+def test_execute_command(make_ssh_command):
     """
     Test to ensure that SSHCommandInvoker correctly executes a command and records it in history.
 
@@ -29,7 +45,7 @@ def test_execute_command():
         - The command in the history is the same as the mock command executed.
     """
     # Setup
-    mock_command = create_autospec(SSHCommand)
+    mock_command = make_ssh_command()
     invoker = SSHCommandInvoker()
 
     # Execute
@@ -41,7 +57,7 @@ def test_execute_command():
     assert invoker.history[0][0] == mock_command
 
 
-def test_show_history(capsys):
+def test_show_history(capsys, make_ssh_command):
     """
     Test the functionality of the show_history method of SSHCommandInvoker.
 
@@ -54,8 +70,8 @@ def test_show_history(capsys):
         - The output includes the specified return values of the executed mock commands.
     """
     # Setup
-    mock_command1 = create_autospec(SSHCommand)
-    mock_command2 = create_autospec(SSHCommand)
+    mock_command1 = make_ssh_command()
+    mock_command2 = make_ssh_command()
 
     # Configure mocks to return specific values when execute() is called
     mock_command1.execute.return_value = 'Result 1'
@@ -73,3 +89,150 @@ def test_show_history(capsys):
     assert "Executed: " in captured.out
     assert "Result 1" in captured.out
     assert "Result 2" in captured.out
+
+
+def test_commands_share_one_authenticated_connection():
+    """
+    Test that consecutive commands executed through the invoker reuse the pooled
+    connection, each on its own channel, instead of connecting again.
+
+    Assertions:
+        - The SSH client authenticates once and the pool never grows.
+        - Each command runs on a new exec channel of the same transport.
+    """
+    ConnectionManager.reset_instance()
+    manager = ConnectionManager.get_instance()
+    invoker = SSHCommandInvoker()
+
+    with patch.object(manager, "ssh_client", new_callable=MagicMock) as mock_ssh_client, \
+            patch.object(ConnectionPool, "_grow") as mock_grow:
+        mock_transport = mock_ssh_client.get_transport.return_value
+        mock_transport.open_session.return_value.recv.return_value = b""
+        controller = SSHController("host", 22, "user", "pass", "", view=MagicMock())
+        controller.connect()
+
+        invoker.execute_command(NeofetchCommand(controller))
+        invoker.execute_command(ListFilesCommand(controller))
+
+        mock_ssh_client.connect.assert_called_once()
+        mock_grow.assert_not_called()
+        assert mock_transport.open_session.call_count == 2
+
+    ConnectionManager.reset_instance()
+
+
+@patch.object(ConnectionManager, "execute_many")
+def test_execute_batch(mock_execute_many):
+    """
+    Test that execute_batch hands the rendered command lines to the model layer in
+    one call and records each command with its own result.
+
+    Assertions:
+        - The command lines are executed as one batch.
+        - Each command gets its own stripped output.
+        - The history holds one entry per command.
+    """
+    mock_execute_many.return_value = ["pi-os\n", "total 0\n"]
+    connection = MagicMock()
+    neofetch = NeofetchCommand(connection)
+    list_files = ListFilesCommand(connection)
+    invoker = SSHCommandInvoker()
+
+    results = invoker.execute_batch([neofetch, list_files])
+
+    mock_execute_many.assert_called_once_with(["neofetch", "ls -l"])
+    assert results == ["pi-os", "total 0"]
+    assert list(invoker.history) == [(neofetch, "pi-os"), (list_files, "total 0")]
+    connection.execute_command.assert_not_called()
+
+
+def test_execute_many(make_ssh_command):
+    """
+    Test that execute_many runs independent commands concurrently and records the
+    results in submission order.
+
+    Assertions:
+        - Both commands are running at the same time.
+        - The results and history follow the order of the commands.
+    """
+    barrier = threading.Barrier(2, timeout=5)
+
+    def run(result):
+        barrier.wait()
+        return result
+
+    mock_command1 = make_ssh_command()
+    mock_command2 = make_ssh_command()
+    mock_command1.execute.side_effect = lambda: run("Result 1")
+    mock_command2.execute.side_effect = lambda: run("Result 2")
+    invoker = SSHCommandInvoker()
+
+    results = invoker.execute_many([mock_command1, mock_command2])
+
+    assert results == ["Result 1", "Result 2"]
+    assert list(invoker.history) == [(mock_command1, "Result 1"), (mock_command2, "Result 2")]
+
+
+def test_history_is_bounded(make_ssh_command):
+    """
+    Test that the history keeps only the most recent executions and truncates
+    their results.
+
+    Assertions:
+        - The history never exceeds HISTORY_SIZE entries and drops the oldest first.
+        - Results are truncated to HISTORY_RESULT_PREVIEW characters.
+    """
+    first_command = make_ssh_command()
+    last_command = make_ssh_command()
+    first_command.execute.return_value = "first"
+    last_command.execute.return_value = "x" * (HISTORY_RESULT_PREVIEW * 4)
+    invoker = SSHCommandInvoker()
+
+    invoker.execute_command(first_command)
+    for _ in range(HISTORY_SIZE):
+        invoker.execute_command(last_command)
+
+    assert len(invoker.history) == HISTORY_SIZE
+    assert all(command is last_command for command, _ in invoker.history)
+    assert invoker.history[-1][1] == "x" * HISTORY_RESULT_PREVIEW
+
+
+def test_show_history_writes_to_file(make_ssh_command):
+    """
+    Test that show_history writes one line per executed command to the given stream.
+
+    Assertions:
+        - The stream receives every entry, each on its own line, in execution order.
+    """
+    mock_command = make_ssh_command()
+    mock_command.execute.side_effect = ["Result 1", "Result 2"]
+    invoker = SSHCommandInvoker()
+    invoker.execute_command(mock_command)
+    invoker.execute_command(mock_command)
+    stream = io.StringIO()
+
+    invoker.show_history(file=stream)
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith("with result: Result 1")
+    assert lines[1].endswith("with result: Result 2")
+
+
+def test_iter_history_yields_entries(make_ssh_command):
+    """
+    Test that iter_history yields each executed command with its result, oldest first.
+
+    Assertions:
+        - iter_history returns an iterator over the (command, result) pairs in order.
+    """
+    mock_command = make_ssh_command()
+    mock_command.execute.side_effect = ["Result 1", "Result 2"]
+    invoker = SSHCommandInvoker()
+    invoker.execute_command(mock_command)
+    invoker.execute_command(mock_command)
+
+    entries = invoker.iter_history()
+
+    assert iter(entries) is entries
+    assert list(entries) == [(mock_command, "Result 1"), (mock_command, "Result 2")]
@@ -21,7 +21,7 @@ Functions:
     reset_connection_manager: A pytest fixture to reset the connection manager before each test.
     mock_connection_manager: A pytest fixture to provide a mock connection manager.
     mock_view: A pytest fixture to provide a mock view object.
-    mock_factory: A pytest fixture to provide a mock API function factory.
+    reset_mocks: A pytest fixture to clear the shared mocks before each test.
     ssh_controller: A pytest fixture to create an SSHController instance with mock dependencies.
     test_initialization: Tests the initialization of SSHController.
     test_connect: Tests the `connect` method of SSHController.
@@ -36,94 +36,129 @@ Note:
     Ensure this file is correctly set up and accessible to the test environment.
 """
 
-from unittest.mock import patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 
 from controllers.ssh_controller import SSHController
-
-
-@pytest.fixture(autouse=True)
+from model.backend.connection_manager import ConnectionManager
+from views import ssh_view
+from views.ssh_view import SSHView
+
+# Connection details the ssh_controller fixture uses unless a test parametrizes it
+CONTROLLER_ARGS = ("host", 22, "username", "password", "key_path")
+
+# Expected calls shared by the connect and disconnect tests, built once at import
+EXPECTED_CONNECT = call(*CONTROLLER_ARGS)
+EXPECTED_CONNECTED_MSG = call("Connected to host")
+EXPECTED_DISCONNECTED_MSG = call("Disconnected")
+
+# Connection details and expected calls the connect test runs over
+CONNECT_CASES = (
+    pytest.param(CONTROLLER_ARGS, EXPECTED_CONNECT, EXPECTED_CONNECTED_MSG, id="default"),
+    pytest.param(
+        ("h2", 2222, "u2", "p2", "k2"),
+        call("h2", 2222, "u2", "p2", "k2"),
+        call("Connected to h2"),
+        id="custom-port",
+    ),
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
 def reset_connection_manager():
     """
         A pytest fixture that resets the ConnectionManager's instance before each test.
 
-        This fixture is automatically used for every test function in this module. It patches
+        This fixture is automatically applied once for the whole module. It patches
         the ConnectionManager's reset_instance method to ensure that each test starts with a fresh
         instance of the ConnectionManager, thereby avoiding shared state across tests.
 
         Yields:
             None
     """
-    with patch("model.backend.connection_manager.ConnectionManager.reset_instance"):
+    with patch.object(ConnectionManager, "reset_instance", new_callable=Mock):
         yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_connection_manager():
     """
         A pytest fixture that provides a mock of the ConnectionManager.
 
         This fixture creates a mock for the ConnectionManager.get_instance method, allowing tests
         to simulate and control the behavior of the ConnectionManager without making actual 
-        SSH connections.
+        SSH connections. The instance mock is spec_set against ConnectionManager, so a
+        misspelled or removed method fails the test instead of returning a new child mock.
 
         Yields:
-            MagicMock: A mock object representing an instance of ConnectionManager.
+            Mock: A mock object representing an instance of ConnectionManager.
         """
-    with patch("model.backend.connection_manager.ConnectionManager.get_instance") as mock:
+    with patch.object(
+        ConnectionManager,
+        "get_instance",
+        new_callable=Mock,
+        return_value=Mock(spec_set=ConnectionManager),
+    ) as mock:
         yield mock.return_value
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_view():
     """
     A pytest fixture that provides a mock of the SSHView class.
 
     This fixture creates a mock for the SSHView class, enabling tests to verify interactions
     between the SSHController and the view component without needing a real view implementation.
+    The mock is spec_set against SSHView, so only attributes the real view has can be used.
 
     Yields:
-        MagicMock: A mock object representing an instance of SSHView.
+        Mock: A mock object representing an instance of SSHView.
     """
-    with patch("views.ssh_view.SSHView") as mock:
+    with patch.object(
+        ssh_view, "SSHView", new_callable=Mock, return_value=Mock(spec_set=SSHView)
+    ) as mock:
         yield mock.return_value
 
 
-@pytest.fixture
-def mock_factory():
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_connection_manager, mock_view):
     """
-    A pytest fixture that provides a mock of the APIFunctionFactory.
+    A pytest fixture that clears the calls recorded on the module's shared mocks.
 
-    This fixture sets up a mock for the APIFunctionFactory, used by the SSHController for
-    creating API function instances. It allows tests to control and inspect the use of API functions
-    within the SSHController.
+    The dependency mocks are patched in once for the whole module, so this fixture resets
+    them before each test to keep assertions limited to the calls the test itself makes.
 
-    Yields:
-        MagicMock: A mock object representing an instance of APIFunctionFactory.
+    Args:
+        mock_connection_manager (Mock): The mock connection manager instance.
+        mock_view (Mock): The mock SSH view instance.
     """
-    with patch("model.api.api_function_factory.APIFunctionFactory") as mock:
-        yield mock.return_value
+    mock_connection_manager.reset_mock()
+    mock_view.reset_mock()
 
 
 @pytest.fixture
-def ssh_controller(mock_connection_manager, mock_view, mock_factory):
+def ssh_controller(request, mock_connection_manager, mock_view):
     """
     A pytest fixture that creates an instance of SSHController with mocked dependencies.
 
-    This fixture constructs an SSHController object using mocked instances of the ConnectionManager,
-    SSHView, and APIFunctionFactory. It is used to test the SSHController's methods in 
+    This fixture constructs an SSHController object using mocked instances of the ConnectionManager
+    and SSHView. It is used to test the SSHController's methods in 
     isolation from its external dependencies.
 
+    Tests can pass their own (host, port, username, password, key_path) tuple through
+    indirect parametrization; otherwise CONTROLLER_ARGS is used.
+
     Args:
-        mock_connection_manager (MagicMock): The mock connection manager instance.
-        mock_view (MagicMock): The mock SSH view instance.
-        mock_factory (MagicMock): The mock API function factory instance.
+        request (FixtureRequest): The pytest request, carrying any indirect parameter.
+        mock_connection_manager (Mock): The mock connection manager instance.
+        mock_view (Mock): The mock SSH view instance.
 
     Returns:
         SSHController: An instance of SSHController with mocked dependencies.
     """
-    return SSHController("host", 22, "username", "password", "key_path", view=mock_view)
+    args = getattr(request, "param", CONTROLLER_ARGS)
+    return SSHController(*args, view=mock_view)
 
 
 def test_initialization(ssh_controller, mock_connection_manager):
@@ -136,7 +171,7 @@ def test_initialization(ssh_controller, mock_connection_manager):
 
     Args:
         ssh_controller (SSHController): The SSHController instance to be tested.
-        mock_connection_manager (MagicMock): The mocked ConnectionManager instance.
+        mock_connection_manager (Mock): The mocked ConnectionManager instance.
 
     Asserts:
         The attach method of the mock ConnectionManager is called the expected number of times.
@@ -144,26 +179,32 @@ def test_initialization(ssh_controller, mock_connection_manager):
     assert mock_connection_manager.attach.call_count == 2
 
 
-def test_connect(ssh_controller, mock_connection_manager, mock_view):
+@pytest.mark.parametrize(
+    "ssh_controller, expected_connect, expected_message", CONNECT_CASES, indirect=["ssh_controller"]
+)
+def test_connect(
+    ssh_controller, mock_connection_manager, mock_view, expected_connect, expected_message
+):
     """
     Test the connect method of the SSH controller.
 
     This test verifies that the `connect` method of the SSH controller correctly calls the 
     `connect` method of the connection manager with the expected parameters and shows the 
-    appropriate message on the view.
+    appropriate message on the view, for each set of connection details in CONNECT_CASES.
 
     Args:
         ssh_controller (obj): The SSH controller object.
         mock_connection_manager (obj): The mock connection manager object.
         mock_view (obj): The mock view object.
+        expected_connect (call): The expected call to the connection manager's connect.
+        expected_message (call): The expected call to the view's show_message.
 
     Returns:
         None
     """
     ssh_controller.connect()
-    mock_connection_manager.connect.assert_called_with("host", 22, "username", "password",
-                                                        "key_path")
-    mock_view.show_message.assert_called_with("Connected to host")
+    assert mock_connection_manager.connect.call_args == expected_connect
+    assert mock_view.show_message.call_args == expected_message
 
 
 def test_disconnect(ssh_controller, mock_connection_manager, mock_view):
@@ -181,4 +222,4 @@ def test_disconnect(ssh_controller, mock_connection_manager, mock_view):
     """
     ssh_controller.disconnect()
     mock_connection_manager.disconnect.assert_called_once()
-    mock_view.show_message.assert_called_with("Disconnected")
+    assert mock_view.show_message.call_args == EXPECTED_DISCONNECTED_MSG
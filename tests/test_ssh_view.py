@@ -6,18 +6,21 @@ The test ensures that the show_message method correctly prints the intended mess
 The SSHView class is part of a system designed to handle SSH connections, and this specific method is responsible
 for displaying messages to the user.
 
-The test employs the unittest.mock.patch function to redirect the standard output to a StringIO object, which allows
- for capturing and inspecting the output generated by the show_message method. This approach ensures that the method's
- functionality can be tested in isolation, without the need for actual console output.
+The test uses pytest's capsys fixture to capture the standard output, which allows for inspecting the output
+generated by the show_message method. This approach ensures that the method's functionality can be tested in
+isolation, without the need for actual console output.
 
-Function:
+Functions:
     test_ssh_view_show_message: Tests that the show_message method of SSHView correctly prints a given message.
+    test_ssh_view_show_message_follows_redirected_stdout: Tests that show_message writes to whatever
+    sys.stdout is at call time.
+    test_ssh_view_show_message_formats_non_string_message: Tests that show_message prints
+    non-string messages as print() did.
 
 The test follows these steps:
 - It creates an instance of SSHView.
-- It redirects the standard output (stdout) to a StringIO object.
 - It calls the show_message method of the SSHView instance with a predefined test message.
-- It captures the output printed to the redirected stdout.
+- It reads the output captured by capsys.
 - It asserts that the captured output matches the expected test message.
 
 This module is essential for ensuring that the SSHView's user feedback mechanism functions correctly, which is crucial
@@ -30,32 +33,48 @@ Example Usage:
 """
 
 
+import contextlib
 from io import StringIO
-from unittest.mock import patch
 
 from views.ssh_view import SSHView
 
 
-def test_ssh_view_show_message():
+def test_ssh_view_show_message(capsys):
     """
     Test that the SSHView's show_message method prints the correct message.
 
-    This test case creates an instance of SSHView, redirects the stdout to a StringIO object,
-    and calls the show_message method with a test message. It then asserts that the printed
-    output matches the test message.
+    This test case creates an instance of SSHView and calls the show_message method with a
+    test message. It then asserts that the output captured by capsys matches the test message.
     """
     # Create an instance of SSHView
     ssh_view = SSHView()
 
-    # Redirect stdout to a StringIO object
+    # Call the show_message method with a test message
+    test_message = "Test message"
+    ssh_view.show_message(test_message)
+
+    # Assert that the printed output matches the test message
+    assert capsys.readouterr().out == test_message + "\n"
+
+
+def test_ssh_view_show_message_follows_redirected_stdout():
+    """
+    Test that show_message writes to the sys.stdout in effect when it is called.
+
+    The view must not bind sys.stdout.write when it is defined, otherwise output
+    redirected after import would still go to the original stream.
+    """
     output = StringIO()
-    with patch("sys.stdout", new=output):
-        # Call the show_message method with a test message
-        test_message = "Test message"
-        ssh_view.show_message(test_message)
+    with contextlib.redirect_stdout(output):
+        SSHView.show_message("Redirected")
 
-    # Get the printed output
-    printed_output = output.getvalue().strip()
+    assert output.getvalue() == "Redirected\n"
 
-    # Assert that the printed output matches the test message
-    assert printed_output == test_message
+
+def test_ssh_view_show_message_formats_non_string_message(capsys):
+    """
+    Test that show_message prints a non-string message, such as an exception, like print() did.
+    """
+    SSHView.show_message(ValueError("Connection refused"))
+
+    assert capsys.readouterr().out == "Connection refused\n"
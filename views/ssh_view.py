@@ -7,12 +7,16 @@ such as connection status, errors, and command outputs. This class abstracts the
 interaction, allowing other components of the system to communicate with the user without being
 concerned about the specifics of the display mechanism.
 
-Methods:
-    show_message: Prints a specified message to the standard output.
+Functions:
+    show_message: Writes a specified message to the standard output.
 
-The show_message method is straightforward in its implementation, using Python's built-in print
-function to display messages. This design choice keeps the class simple and versatile, suitable
-for various command-line based applications.
+Classes:
+    SSHView: Exposes show_message as a static method for the controllers.
+
+The show_message function is straightforward in its implementation, writing each message and its
+newline to standard output in a single write call rather than going through print's argument
+handling. This design choice keeps the view simple and versatile, suitable for various
+command-line based applications.
 
 Example:
     ssh_view = SSHView()
@@ -25,6 +29,21 @@ Note:
     different application requirements.
 """
 
+import sys
+
+
+def show_message(message):
+    """
+    Displays the given message.
+
+    The message is written to standard output together with its newline in one call.
+    sys.stdout is looked up on every call, so redirected or captured output is honoured.
+
+    Args:
+        message: The message to be displayed. Non-string messages are formatted with str().
+    """
+    sys.stdout.write(f"{message}\n")
+
 
 class SSHView:
     """
@@ -33,12 +52,4 @@ class SSHView:
     This class provides methods for displaying messages related to SSH.
     """
 
-    @staticmethod
-    def show_message(message):
-        """
-        Displays the given message.
-
-        Args:
-            message (str): The message to be displayed.
-        """
-        print(message)
+    show_message = staticmethod(show_message)